@@ -13,18 +13,42 @@ Changes from original WEATHER.PY:
 """
 
 from __future__ import annotations
+import hashlib
+import importlib
 import math
 import json
 import os
 import re
-import requests
-import numpy as np
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.colors import LinearSegmentedColormap
-from matplotlib.offsetbox import AnchoredText
+from dataclasses import dataclass
 from datetime import datetime, timedelta, date
+from typing import TYPE_CHECKING
+from weather_http_cache import (
+    DEFAULT_HTTP_CACHE_DIR,
+    HttpResponseCache,
+    conditional_headers,
+    http_cache_key,
+    is_fresh,
+)
+
+if TYPE_CHECKING:
+    import requests
+
+
+class _LazyModule:
+    """Module proxy that imports on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+# numpy loads on first use; requests and matplotlib are imported where needed
+np = _LazyModule("numpy")
 
 # -----------------------------
 # USER CONFIG
@@ -65,76 +89,117 @@ def _get_latest_weather_date() -> date | None:
     return candidates[0][1]
 
 
-if SCHEDULE_4DAY_MODE:
-    if TARGET_DATE is not None:
-        _update = TARGET_DATE
-    elif USE_TODAY_AS_DATE_ANCHOR:
-        # Daily Operation Status 박스: 오늘 날짜 기준 4일치 (1/29 → 29 Jan, 30 Jan, 31 Jan, 01 Feb)
-        _update = date.today()
-    else:
-        _latest = _get_latest_weather_date()
-        _update = _latest if _latest is not None else date.today()
-    START_DATE = _update
-    END_DATE = _update + timedelta(days=3)
-    _script_dir = (
-        os.path.dirname(os.path.abspath(__file__))
-        if "__file__" in globals()
-        else os.getcwd()
-    )
-    _out_dir = os.path.join(_script_dir, "out")
-    os.makedirs(_out_dir, exist_ok=True)
-    OUTPUT_PATH = os.path.join(_out_dir, "weather_4day_heatmap.png")
-else:
-    START_DATE = date(2026, 1, 15)
-    END_DATE = date(2026, 2, 15)
-    OUTPUT_PATH = "AGI_TR_Weather_Risk_Heatmap_v3.png"
-
 # Weather data source settings
 USE_MANUAL_JSON = True
+# API mode: build the heatmap from the hourly dataset (weather_hourly.py) shared
+# with Go/No-Go instead of daily maxima; also writes out/hourly/*.gngc
+USE_HOURLY_DATASET = False
 SCRIPT_DIR = (
     os.path.dirname(os.path.abspath(__file__))
     if "__file__" in globals()
     else os.getcwd()
 )
-WEATHER_JSON_PATH = os.path.join(
-    os.path.dirname(SCRIPT_DIR), "weather_data_20260106.json"
-)
-WEATHER_REQUEST_PATH = os.path.join(SCRIPT_DIR, "weather_data_requests.txt")
-
-if SCHEDULE_4DAY_MODE:
-    # JSON path: try _update (today or TARGET) first, then latest weather folder
-    _parsed_in_files = os.path.join(
-        SCRIPT_DIR,
-        "out",
-        "weather_parsed",
-        _update.strftime("%Y%m%d"),
-        "weather_for_weather_py.json",
+
+
+@dataclass
+class DashboardConfig:
+    """Run configuration derived from the USER CONFIG switches."""
+
+    start_date: date
+    end_date: date
+    output_path: str
+    weather_json_path: str
+    weather_request_path: str
+
+
+def _parsed_weather_json(root: str, day: date) -> str:
+    return os.path.join(
+        root, "out", "weather_parsed", day.strftime("%Y%m%d"), "weather_for_weather_py.json"
     )
-    _convert_root = os.path.dirname(os.path.dirname(SCRIPT_DIR))
-    _parsed_candidate = os.path.join(
-        _convert_root,
-        "out",
-        "weather_parsed",
-        _update.strftime("%Y%m%d"),
-        "weather_for_weather_py.json",
+
+
+def build_config() -> DashboardConfig:
+    """
+    Resolve the date range, output path and weather JSON path.
+
+    Reads the clock and probes the filesystem, but creates nothing; the
+    output directory is created when the heatmap is saved.
+    """
+    weather_json_path = os.path.join(
+        os.path.dirname(SCRIPT_DIR), "weather_data_20260106.json"
     )
-    if os.path.exists(_parsed_in_files):
-        WEATHER_JSON_PATH = _parsed_in_files
-    elif os.path.exists(_parsed_candidate):
-        WEATHER_JSON_PATH = _parsed_candidate
+    weather_request_path = os.path.join(SCRIPT_DIR, "weather_data_requests.txt")
+
+    if not SCHEDULE_4DAY_MODE:
+        return DashboardConfig(
+            start_date=date(2026, 1, 15),
+            end_date=date(2026, 2, 15),
+            output_path="AGI_TR_Weather_Risk_Heatmap_v3.png",
+            weather_json_path=weather_json_path,
+            weather_request_path=weather_request_path,
+        )
+
+    if TARGET_DATE is not None:
+        update = TARGET_DATE
+    elif USE_TODAY_AS_DATE_ANCHOR:
+        # Daily Operation Status 박스: 오늘 날짜 기준 4일치 (1/29 → 29 Jan, 30 Jan, 31 Jan, 01 Feb)
+        update = date.today()
+    else:
+        latest = _get_latest_weather_date()
+        update = latest if latest is not None else date.today()
+
+    # JSON path: try update (today or TARGET) first, then latest weather folder
+    parsed_in_files = _parsed_weather_json(SCRIPT_DIR, update)
+    parsed_candidate = _parsed_weather_json(
+        os.path.dirname(os.path.dirname(SCRIPT_DIR)), update
+    )
+    if os.path.exists(parsed_in_files):
+        weather_json_path = parsed_in_files
+    elif os.path.exists(parsed_candidate):
+        weather_json_path = parsed_candidate
     else:
         # Fallback: latest weather folder (e.g. today=2025-01-29 but project uses 2026)
-        _latest = _get_latest_weather_date()
-        if _latest is not None:
-            _fallback = os.path.join(
-                SCRIPT_DIR,
-                "out",
-                "weather_parsed",
-                _latest.strftime("%Y%m%d"),
-                "weather_for_weather_py.json",
-            )
-            if os.path.exists(_fallback):
-                WEATHER_JSON_PATH = _fallback
+        latest = _get_latest_weather_date()
+        if latest is not None:
+            fallback = _parsed_weather_json(SCRIPT_DIR, latest)
+            if os.path.exists(fallback):
+                weather_json_path = fallback
+
+    return DashboardConfig(
+        start_date=update,
+        end_date=update + timedelta(days=3),
+        output_path=os.path.join(SCRIPT_DIR, "out", "weather_4day_heatmap.png"),
+        weather_json_path=weather_json_path,
+        weather_request_path=weather_request_path,
+    )
+
+
+_CONFIG: DashboardConfig | None = None
+
+
+def get_config() -> DashboardConfig:
+    """Config built on first use and cached for the process."""
+    global _CONFIG
+    if _CONFIG is None:
+        _CONFIG = build_config()
+    return _CONFIG
+
+
+_LEGACY_CONFIG_NAMES = {
+    "START_DATE": "start_date",
+    "END_DATE": "end_date",
+    "OUTPUT_PATH": "output_path",
+    "WEATHER_JSON_PATH": "weather_json_path",
+    "WEATHER_REQUEST_PATH": "weather_request_path",
+}
+
+
+def __getattr__(name):
+    # Module-level START_DATE, OUTPUT_PATH, ... resolve through get_config()
+    if name in _LEGACY_CONFIG_NAMES:
+        return getattr(get_config(), _LEGACY_CONFIG_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Voyage overlay (7 voyages; SSOT: agi tr final schedule.json parent "AGI TR Unit N" planned_start/finish)
 VOYAGES = [
@@ -189,6 +254,23 @@ VOYAGES = [
     },
 ]
 
+# Batch mode sites (lat, lon); option_c locations LOC_AGI / LOC_MZP plus the
+# default heatmap point. Other sites (e.g. the anchorage) set lat/lon per job.
+SITES = {
+    "AGI": (24.841096, 53.658619),
+    "MZP": (24.52489, 54.37798),
+    "ROUTE": (LAT, LON),
+}
+BATCH_RENDER_WORKERS = min(4, os.cpu_count() or 1)
+
+# Gap fill for days without wind data: "linear" (interpolate across gaps of any
+# length, hold edge values), "ffill" or "bfill" (the other direction covers the edge)
+GAP_FILL_METHOD = "linear"
+DEFAULT_WIND_KN = 12.0
+DEFAULT_GUST_KN = 15.0
+DEFAULT_VIS_KM = 8.0
+GUST_FACTOR = 1.30
+
 MANUAL_SHAMAL_PERIODS = [
     (date(2026, 2, 5), date(2026, 2, 14)),
 ]
@@ -260,6 +342,21 @@ MARINE_URL = "https://marine-api.open-meteo.com/v1/marine"
 CLIMATE_URL = "https://climate-api.open-meteo.com/v1/climate"
 CLIMATE_MODELS = ["EC_Earth3P_HR", "MRI_AGCM3_2_S", "MPI_ESM1_2_XR"]
 
+# Concurrent fetch: one pooled session shared by all worker threads
+FETCH_MAX_WORKERS = 8
+
+# Persistent HTTP response cache (files/out/http_cache/)
+USE_HTTP_CACHE = True
+HTTP_CACHE_DIR = DEFAULT_HTTP_CACHE_DIR
+HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024
+# Forecast endpoints are refreshed a few times a day; re-fetch after this many minutes
+FORECAST_CACHE_TTL_MIN = 180
+# Per-endpoint TTL override in minutes (None = never expires): archive/climate
+# results for a fixed date range do not change
+HTTP_CACHE_TTL_MIN = {ARCHIVE_URL: None, CLIMATE_URL: None}
+# Offline: never touch the network, serve cached responses regardless of age
+HTTP_CACHE_OFFLINE = False
+
 
 # -----------------------------
 # HELPERS (Same as original)
@@ -351,14 +448,82 @@ def safe_get(dct, *keys, default=None):
     return cur
 
 
+_HTTP_SESSION: requests.Session | None = None
+
+
+def get_http_session() -> requests.Session:
+    """Shared keep-alive session, pooled for FETCH_MAX_WORKERS concurrent requests."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=FETCH_MAX_WORKERS, pool_maxsize=FETCH_MAX_WORKERS
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+_HTTP_CACHE: HttpResponseCache | None = None
+
+
+def get_http_cache() -> HttpResponseCache | None:
+    """Shared response cache, or None when USE_HTTP_CACHE is off."""
+    global _HTTP_CACHE
+    if not USE_HTTP_CACHE:
+        return None
+    if _HTTP_CACHE is None or _HTTP_CACHE.cache_dir != HTTP_CACHE_DIR:
+        _HTTP_CACHE = HttpResponseCache(HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES)
+    return _HTTP_CACHE
+
+
+def cache_ttl_minutes(url: str) -> float | None:
+    return HTTP_CACHE_TTL_MIN.get(url, FORECAST_CACHE_TTL_MIN)
+
+
 def request_json(url: str, params: dict, timeout=30) -> dict:
+    cache = get_http_cache()
+    key = entry = None
+    if cache is not None:
+        key = http_cache_key(url, params)
+        entry = cache.get(key)
+        if entry is not None and (
+            HTTP_CACHE_OFFLINE or is_fresh(entry, cache_ttl_minutes(url))
+        ):
+            return entry["body"]
+    if HTTP_CACHE_OFFLINE:
+        print(f"[WARN] Offline: no cached response for {url}")
+        return {}
+
     try:
-        r = requests.get(url, params=params, timeout=timeout)
+        r = get_http_session().get(
+            url, params=params, headers=conditional_headers(entry), timeout=timeout
+        )
+        if r.status_code == 304 and entry is not None:
+            cache.revalidated(key, entry)
+            return entry["body"]
         r.raise_for_status()
-        return r.json()
-    except:
+        body = r.json()
+    except Exception:
+        if entry is not None:
+            print(f"[WARN] Request failed, serving stale cached response: {url}")
+            return entry["body"]
         return {}
 
+    if cache is not None and body:
+        cache.put(
+            key,
+            url,
+            params,
+            body,
+            etag=r.headers.get("ETag"),
+            last_modified=r.headers.get("Last-Modified"),
+        )
+    return body
+
 
 def parse_bool(value) -> bool:
     if isinstance(value, bool):
@@ -368,25 +533,58 @@ def parse_bool(value) -> bool:
     return bool(value)
 
 
+def aggregate_hourly_to_daily(
+    hourly_time, hourly_values, daily_time, stats=("min", "max", "mean")
+) -> dict[str, np.ndarray]:
+    """
+    Per-day NaN-aware min/max/mean of hourly values, aligned to daily_time.
+
+    hourly_values may be 1-D (hours,) or 2-D (hours, variables); hours are
+    grouped by the date part of their ISO timestamp. Days without a finite
+    value are NaN.
+    """
+    values = np.asarray(hourly_values, dtype=float)
+    n_days = len(daily_time)
+    out = {s: np.full((n_days,) + values.shape[1:], np.nan) for s in stats}
+    if n_days == 0 or len(values) == 0 or len(hourly_time) != len(values):
+        return out
+
+    days = np.asarray(daily_time).astype("U10").astype("datetime64[D]")
+    hour_days = np.asarray(hourly_time).astype("U10").astype("datetime64[D]")
+    order = np.argsort(days, kind="stable")
+    pos = np.minimum(np.searchsorted(days[order], hour_days), n_days - 1)
+    day_idx = order[pos]
+    keep = days[day_idx] == hour_days
+    day_idx, values = day_idx[keep], values[keep]
+    if len(day_idx) == 0:
+        return out
+
+    sort = np.argsort(day_idx, kind="stable")
+    day_idx, values = day_idx[sort], values[sort]
+    starts = np.flatnonzero(np.r_[True, day_idx[1:] != day_idx[:-1]])
+    groups = day_idx[starts]
+
+    finite = ~np.isnan(values)
+    counts = np.add.reduceat(finite, starts, axis=0)
+    empty = counts == 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if "min" in out:
+            mins = np.minimum.reduceat(np.where(finite, values, np.inf), starts, axis=0)
+            out["min"][groups] = np.where(empty, np.nan, mins)
+        if "max" in out:
+            maxs = np.maximum.reduceat(np.where(finite, values, -np.inf), starts, axis=0)
+            out["max"][groups] = np.where(empty, np.nan, maxs)
+        if "mean" in out:
+            sums = np.add.reduceat(np.where(finite, values, 0.0), starts, axis=0)
+            out["mean"][groups] = np.where(empty, np.nan, sums / counts)
+    return out
+
+
 # -----------------------------
 # FETCH FUNCTIONS (Same as original)
 # -----------------------------
-def fetch_weather_model(model_name: str, base_url: str, d0: date, d1: date) -> dict:
-    params = {
-        "latitude": LAT,
-        "longitude": LON,
-        "timezone": TZ,
-        "wind_speed_unit": "kn",
-        "start_date": d0.isoformat(),
-        "end_date": d1.isoformat(),
-        "daily": ",".join(
-            ["wind_speed_10m_max", "wind_gusts_10m_max", "wind_direction_10m_dominant"]
-        ),
-        "hourly": ",".join(["visibility"]),
-        "forecast_days": 16,
-    }
-    j = request_json(base_url, params)
-
+def parse_daily_wind_payload(model_name: str, j: dict) -> dict:
+    """Daily wind/gust/direction plus daily minimum visibility (km) from hourly data."""
     daily_time = safe_get(j, "daily", "time", default=[])
     wind_max = np.array(
         safe_get(j, "daily", "wind_speed_10m_max", default=[]), dtype=float
@@ -402,18 +600,9 @@ def fetch_weather_model(model_name: str, base_url: str, d0: date, d1: date) -> d
     hourly_vis_m = np.array(
         safe_get(j, "hourly", "visibility", default=[]), dtype=float
     )
-
-    vis_min_km = np.full(len(daily_time), np.nan, dtype=float)
-    if len(hourly_time) == len(hourly_vis_m) and len(daily_time) > 0:
-        day_to_vals = {t: [] for t in daily_time}
-        for ts, vm in zip(hourly_time, hourly_vis_m):
-            day = ts[:10]
-            if day in day_to_vals and not np.isnan(vm):
-                day_to_vals[day].append(vm / 1000.0)
-        for i, day in enumerate(daily_time):
-            vals = day_to_vals.get(day, [])
-            if vals:
-                vis_min_km[i] = float(np.nanmin(vals))
+    vis_min_km = aggregate_hourly_to_daily(
+        hourly_time, hourly_vis_m / 1000.0, daily_time, stats=("min",)
+    )["min"]
 
     return {
         "model": model_name,
@@ -425,10 +614,17 @@ def fetch_weather_model(model_name: str, base_url: str, d0: date, d1: date) -> d
     }
 
 
-def fetch_archive(d0: date, d1: date) -> dict:
+def fetch_weather_model(
+    model_name: str,
+    base_url: str,
+    d0: date,
+    d1: date,
+    lat: float | None = None,
+    lon: float | None = None,
+) -> dict:
     params = {
-        "latitude": LAT,
-        "longitude": LON,
+        "latitude": LAT if lat is None else lat,
+        "longitude": LON if lon is None else lon,
         "timezone": TZ,
         "wind_speed_unit": "kn",
         "start_date": d0.isoformat(),
@@ -436,59 +632,53 @@ def fetch_archive(d0: date, d1: date) -> dict:
         "daily": ",".join(
             ["wind_speed_10m_max", "wind_gusts_10m_max", "wind_direction_10m_dominant"]
         ),
-        "hourly": "visibility",
+        "hourly": ",".join(["visibility"]),
+        "forecast_days": 16,
     }
-    j = request_json(ARCHIVE_URL, params)
-
-    daily_time = safe_get(j, "daily", "time", default=[])
-    wind_max = np.array(
-        safe_get(j, "daily", "wind_speed_10m_max", default=[]), dtype=float
-    )
-    gust_max = np.array(
-        safe_get(j, "daily", "wind_gusts_10m_max", default=[]), dtype=float
-    )
-    wind_dir = np.array(
-        safe_get(j, "daily", "wind_direction_10m_dominant", default=[]), dtype=float
-    )
-
-    hourly_time = safe_get(j, "hourly", "time", default=[])
-    hourly_vis_m = np.array(
-        safe_get(j, "hourly", "visibility", default=[]), dtype=float
-    )
+    j = request_json(base_url, params)
+    return parse_daily_wind_payload(model_name, j)
 
-    vis_min_km = np.full(len(daily_time), np.nan, dtype=float)
-    if len(hourly_time) == len(hourly_vis_m) and len(daily_time) > 0:
-        day_to_vals = {t: [] for t in daily_time}
-        for ts, vm in zip(hourly_time, hourly_vis_m):
-            day = ts[:10]
-            if day in day_to_vals and not np.isnan(vm):
-                day_to_vals[day].append(vm / 1000.0)
-        for i, day in enumerate(daily_time):
-            vals = day_to_vals.get(day, [])
-            if vals:
-                vis_min_km[i] = float(np.nanmin(vals))
 
-    return {
-        "model": "archive",
-        "dates": daily_time,
-        "wind_max_kn": wind_max,
-        "gust_max_kn": gust_max,
-        "wind_dir_deg": wind_dir,
-        "vis_min_km": vis_min_km,
+def fetch_archive(
+    d0: date,
+    d1: date,
+    url: str | None = None,
+    lat: float | None = None,
+    lon: float | None = None,
+) -> dict:
+    params = {
+        "latitude": LAT if lat is None else lat,
+        "longitude": LON if lon is None else lon,
+        "timezone": TZ,
+        "wind_speed_unit": "kn",
+        "start_date": d0.isoformat(),
+        "end_date": d1.isoformat(),
+        "daily": ",".join(
+            ["wind_speed_10m_max", "wind_gusts_10m_max", "wind_direction_10m_dominant"]
+        ),
+        "hourly": "visibility",
     }
+    j = request_json(url or ARCHIVE_URL, params)
+    return parse_daily_wind_payload("archive", j)
 
 
-def fetch_marine_waves(d0: date, d1: date) -> dict:
+def fetch_marine_waves(
+    d0: date,
+    d1: date,
+    url: str | None = None,
+    lat: float | None = None,
+    lon: float | None = None,
+) -> dict:
     params = {
-        "latitude": LAT,
-        "longitude": LON,
+        "latitude": LAT if lat is None else lat,
+        "longitude": LON if lon is None else lon,
         "timezone": TZ,
         "start_date": d0.isoformat(),
         "end_date": d1.isoformat(),
         "daily": "wave_height_max",
         "cell_selection": "sea",
     }
-    j = request_json(MARINE_URL, params)
+    j = request_json(url or MARINE_URL, params)
     daily_time = safe_get(j, "daily", "time", default=[])
     wave_max = np.array(
         safe_get(j, "daily", "wave_height_max", default=[]), dtype=float
@@ -496,17 +686,23 @@ def fetch_marine_waves(d0: date, d1: date) -> dict:
     return {"dates": daily_time, "wave_max_m": wave_max}
 
 
-def fetch_climate_wind_max(d0: date, d1: date) -> dict:
+def fetch_climate_wind_max(
+    d0: date,
+    d1: date,
+    url: str | None = None,
+    lat: float | None = None,
+    lon: float | None = None,
+) -> dict:
     params = {
-        "latitude": LAT,
-        "longitude": LON,
+        "latitude": LAT if lat is None else lat,
+        "longitude": LON if lon is None else lon,
         "start_date": d0.isoformat(),
         "end_date": d1.isoformat(),
         "models": ",".join(CLIMATE_MODELS),
         "daily": "wind_speed_10m_max",
         "wind_speed_unit": "kn",
     }
-    j = request_json(CLIMATE_URL, params)
+    j = request_json(url or CLIMATE_URL, params)
     daily_time = safe_get(j, "daily", "time", default=[])
     w = safe_get(j, "daily", "wind_speed_10m_max", default=None)
     if w is None:
@@ -515,6 +711,256 @@ def fetch_climate_wind_max(d0: date, d1: date) -> dict:
     return {"dates": daily_time, "wind_max_kn": wind}
 
 
+def fetch_all_sources(
+    d0: date,
+    d1: date,
+    today: date,
+    model_urls: dict[str, str] | None = None,
+    archive_url: str | None = None,
+    marine_url: str | None = None,
+    climate_url: str | None = None,
+    max_workers: int = FETCH_MAX_WORKERS,
+    lat: float | None = None,
+    lon: float | None = None,
+) -> dict:
+    """
+    Fetch archive, forecast models, marine and climate data concurrently.
+
+    Latency is bounded by the slowest endpoint instead of the sum. Climate is
+    fetched speculatively; callers only use it for days still missing wind.
+    A failed source yields None (models: omitted), as in the sequential path.
+    URL overrides allow pointing every endpoint at a local stub server;
+    lat/lon default to the LAT/LON config.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    model_urls = MODEL_URLS if model_urls is None else model_urls
+    archive_end = min(d1, today - timedelta(days=2))
+    remaining_start = max(d0, today - timedelta(days=1))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        archive_f = (
+            pool.submit(fetch_archive, d0, archive_end, archive_url, lat, lon)
+            if archive_end >= d0
+            else None
+        )
+        model_fs = (
+            [
+                pool.submit(
+                    fetch_weather_model, name, url, remaining_start, d1, lat, lon
+                )
+                for name, url in model_urls.items()
+            ]
+            if remaining_start <= d1
+            else []
+        )
+        marine_f = pool.submit(fetch_marine_waves, d0, d1, marine_url, lat, lon)
+        climate_f = pool.submit(fetch_climate_wind_max, d0, d1, climate_url, lat, lon)
+
+        def result_or_none(f):
+            if f is None:
+                return None
+            try:
+                return f.result()
+            except Exception:
+                return None
+
+        return {
+            "archive": result_or_none(archive_f),
+            "models": [p for p in map(result_or_none, model_fs) if p is not None],
+            "marine": result_or_none(marine_f),
+            "climate": result_or_none(climate_f),
+            "remaining_start": remaining_start,
+        }
+
+
+# -----------------------------
+# ENSEMBLE BLENDING
+# -----------------------------
+# Per-model blend weight (MODEL_URLS keys; unlisted = 1.0)
+MODEL_WEIGHTS: dict[str, float] = {}
+# Optional skill: recent wind MAE (kt) per model; weights are scaled by 1/MAE^2.
+# Models without a score get the mean skill weight of those with one.
+MODEL_SKILL_MAE_KN: dict[str, float] = {}
+BLEND_FIELDS = ("wind_max_kn", "gust_max_kn", "wind_dir_deg", "vis_min_km")
+
+
+def model_weights(
+    names: list[str],
+    weights: dict[str, float] | None = None,
+    skill_mae: dict[str, float] | None = None,
+) -> np.ndarray:
+    """Normalised blend weight per model: configured weight x skill weight."""
+    weights = MODEL_WEIGHTS if weights is None else weights
+    skill_mae = MODEL_SKILL_MAE_KN if skill_mae is None else skill_mae
+    w = np.array([float(weights.get(name, 1.0)) for name in names])
+    mae = np.array([skill_mae.get(name, np.nan) for name in names], dtype=float)
+    scored = ~np.isnan(mae)
+    if scored.any():
+        skill = np.full(len(names), np.nan)
+        skill[scored] = 1.0 / np.square(np.maximum(mae[scored], 0.1))
+        skill[~scored] = skill[scored].mean()
+        w = w * skill
+    total = w.sum()
+    return w / total if total > 0 else np.full(len(names), 1.0 / max(len(names), 1))
+
+
+def align_model_payloads(payloads: list[dict], days: list[date]) -> dict[str, np.ndarray]:
+    """
+    Stack BLEND_FIELDS of daily model payloads as (models, days) arrays on the
+    common date index days (NaN where a model lacks the day). "present" marks
+    the (model, day) pairs a payload covers.
+    """
+    n_models, n_days = len(payloads), len(days)
+    out = {f: np.full((n_models, n_days), np.nan) for f in BLEND_FIELDS}
+    out["present"] = np.zeros((n_models, n_days), dtype=bool)
+    if n_days == 0:
+        return out
+
+    day_index = np.array(days, dtype="datetime64[D]")
+    order = np.argsort(day_index, kind="stable")
+    for m, p in enumerate(payloads):
+        dates = np.asarray(p["dates"]).astype("U10").astype("datetime64[D]")
+        if len(dates) == 0:
+            continue
+        pos = order[np.minimum(np.searchsorted(day_index[order], dates), n_days - 1)]
+        ok = day_index[pos] == dates
+        out["present"][m, pos[ok]] = True
+        for f in BLEND_FIELDS:
+            vals = np.asarray(p[f], dtype=float)
+            k = min(len(vals), len(dates))
+            out[f][m, pos[:k][ok[:k]]] = vals[:k][ok[:k]]
+    return out
+
+
+def blend_ensemble(
+    stacked: dict[str, np.ndarray],
+    weights: np.ndarray,
+    direction_keys: tuple[str, ...] = ("wind_dir_deg",),
+) -> dict[str, np.ndarray]:
+    """
+    Weighted NaN-aware ensemble over the model axis (axis 0) of each array.
+
+    Returns <key> (weighted mean) and <key>_spread (weighted standard
+    deviation) per key; direction keys use the circular mean and circular
+    standard deviation in degrees. NaN where no model has a value.
+    """
+    w = np.asarray(weights, dtype=float).reshape((-1,) + (1,) * (next(iter(stacked.values())).ndim - 1))
+    out = {}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for key, x in stacked.items():
+            finite = ~np.isnan(x)
+            wf = np.where(finite, w, 0.0)
+            wsum = wf.sum(axis=0)
+            if key in direction_keys:
+                rad = np.deg2rad(np.where(finite, x, 0.0))
+                u, v = (wf * np.sin(rad)).sum(axis=0), (wf * np.cos(rad)).sum(axis=0)
+                mean = np.rad2deg(np.arctan2(u, v)) % 360.0
+                r = np.clip(np.hypot(u, v) / wsum, 1e-12, 1.0)
+                spread = np.rad2deg(np.sqrt(-2.0 * np.log(r)))
+            else:
+                xf = np.where(finite, x, 0.0)
+                mean = (wf * xf).sum(axis=0) / wsum
+                spread = np.sqrt((wf * np.where(finite, x - mean, 0.0) ** 2).sum(axis=0) / wsum)
+            empty = wsum == 0
+            out[key] = np.where(empty, np.nan, mean)
+            out[f"{key}_spread"] = np.where(empty, np.nan, spread)
+    return out
+
+
+def blend_model_payloads(
+    payloads: list[dict],
+    days: list[date],
+    weights: dict[str, float] | None = None,
+    skill_mae: dict[str, float] | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Align daily model payloads on days and blend them with model_weights().
+    Returns mean and spread arrays per BLEND_FIELDS plus n_models per day.
+    """
+    stacked = align_model_payloads(payloads, days)
+    present = stacked.pop("present")
+    w = model_weights([p.get("model", "") for p in payloads], weights, skill_mae)
+    blend = blend_ensemble(stacked, w)
+    blend["n_models"] = present.sum(axis=0)
+    return blend
+
+
+# -----------------------------
+# GAP FILL
+# -----------------------------
+def fill_gaps(values, method: str = "linear") -> np.ndarray:
+    """
+    Fill NaNs of a 1-D series in one array pass.
+
+    "linear" interpolates across interior gaps of any length and holds the
+    nearest value at the edges; "ffill"/"bfill" propagate the previous/next
+    valid value, with the opposite direction covering the leading/trailing
+    edge. An all-NaN series is returned unchanged.
+    """
+    values = np.asarray(values, dtype=float)
+    valid = ~np.isnan(values)
+    if valid.all() or not valid.any():
+        return values.copy()
+
+    x = np.arange(len(values))
+    if method == "linear":
+        return np.interp(x, x[valid], values[valid])
+    if method not in ("ffill", "bfill"):
+        raise ValueError(f"Unknown gap fill method: {method}")
+
+    prev_idx = np.maximum.accumulate(np.where(valid, x, -1))
+    next_idx = np.minimum.accumulate(np.where(valid, x, len(values))[::-1])[::-1]
+    if method == "ffill":
+        src = np.where(prev_idx >= 0, prev_idx, next_idx)
+    else:
+        src = np.where(next_idx < len(values), next_idx, prev_idx)
+    return values[src]
+
+
+def fill_daily_gaps(
+    wind_kn: np.ndarray,
+    gust_kn: np.ndarray,
+    wave_m: np.ndarray,
+    vis_km: np.ndarray,
+    coverage: np.ndarray,
+    method: str = GAP_FILL_METHOD,
+    climatology_wind_kn: np.ndarray | None = None,
+) -> int:
+    """
+    Fill missing daily values in place and tag coverage provenance.
+
+    Wind: climatology (CLIMATE_FILL) first if given, then fill_gaps
+    (INTERPOLATED), else DEFAULT_WIND_KN/DEFAULT_GUST_KN (DEFAULT).
+    Gust, wave and visibility are then derived from wind or defaulted.
+    Returns the number of days still missing wind after climatology.
+    """
+    if climatology_wind_kn is not None:
+        clim = np.asarray(climatology_wind_kn, dtype=float)
+        use = np.isnan(wind_kn) & ~np.isnan(clim)
+        wind_kn[use] = clim[use]
+        coverage[use] = "CLIMATE_FILL"
+
+    still = np.isnan(wind_kn)
+    n_missing = int(still.sum())
+    if n_missing:
+        filled = fill_gaps(wind_kn, method)
+        if np.isnan(filled).all():
+            wind_kn[still] = DEFAULT_WIND_KN
+            gust_kn[still & np.isnan(gust_kn)] = DEFAULT_GUST_KN
+            coverage[still] = "DEFAULT"
+        else:
+            wind_kn[still] = filled[still]
+            coverage[still] = "INTERPOLATED"
+
+    gust_missing = np.isnan(gust_kn)
+    gust_kn[gust_missing] = wind_kn[gust_missing] * GUST_FACTOR
+    wave_missing = np.isnan(wave_m)
+    wave_m[wave_missing] = np.clip(wind_kn[wave_missing] * 0.04, 0.30, 2.50)
+    vis_km[np.isnan(vis_km)] = DEFAULT_VIS_KM
+    return n_missing
+
+
 # -----------------------------
 # RISK MODEL
 # -----------------------------
@@ -535,25 +981,52 @@ def op_status_from_score(score):
     return "NO-GO"
 
 
+# op_status_codes() index -> status (NaN scores count as NO-GO, as above)
+OP_STATUS_LEVELS = ("GO", "HOLD", "NO-GO")
+
+
+def op_status_codes(scores) -> np.ndarray:
+    """Vectorised op_status_from_score: int8 index into OP_STATUS_LEVELS."""
+    scores = np.asarray(scores, dtype=float)
+    return np.where(np.isnan(scores), 2, np.digitize(scores, [30.0, 60.0])).astype(np.int8)
+
+
 def is_shamal_day(wind_dir_deg, wind_kn, gust_kn):
-    if np.isnan(wind_dir_deg) or np.isnan(wind_kn) or np.isnan(gust_kn):
-        return False
-    nw = 285.0 <= wind_dir_deg <= 345.0
-    strong = (wind_kn >= 18.0) or (gust_kn >= 22.0)
-    return bool(nw and strong)
+    """
+    NW (285-345 deg) and strong (wind >= 18 kt or gust >= 22 kt); any NaN -> False.
+    Scalars return bool, arrays an elementwise bool array.
+    """
+    wdir = np.asarray(wind_dir_deg, dtype=float)
+    wind = np.asarray(wind_kn, dtype=float)
+    gust = np.asarray(gust_kn, dtype=float)
+    valid = ~(np.isnan(wdir) | np.isnan(wind) | np.isnan(gust))
+    nw = (wdir >= 285.0) & (wdir <= 345.0)
+    strong = (wind >= 18.0) | (gust >= 22.0)
+    shamal = valid & nw & strong
+    return bool(shamal) if shamal.ndim == 0 else shamal
 
 
 # =====================================================
 # MAIN PIPELINE - DASHBOARD OPTIMIZED VISUALIZATION
 # =====================================================
-def main():
-    days = daterange(START_DATE, END_DATE)
+def collect_daily_weather(
+    d0: date,
+    d1: date,
+    weather_records: list[dict] | None = None,
+    fetched: dict | None = None,
+) -> dict:
+    """
+    Merge manual records and/or fetched API data for d0..d1, gap-fill and score.
+
+    weather_records: load_weather_data_from_json() output (manual JSON mode).
+    fetched: fetch_all_sources() output; may cover a wider range than d0..d1.
+    Forecast days use the weighted model blend (blend_model_payloads).
+    Returns per-day arrays plus risk, status, shamal flags, coverage tags and
+    the ensemble wind spread.
+    """
+    days = daterange(d0, d1)
     idx = to_idx_map(days)
     n = len(days)
-    print(
-        f"[INFO] Date range: {START_DATE.isoformat()} ~ {END_DATE.isoformat()} "
-        f"(4 days) | Data: {WEATHER_JSON_PATH}"
-    )
 
     # Arrays
     wind_kn = np.full(n, np.nan)
@@ -564,179 +1037,94 @@ def main():
     risk_level_override = [None] * n
     shamal_override = [None] * n
     coverage = np.array([""] * n, dtype=object)
+    clim_wind = np.full(n, np.nan)
+    wind_spread_kn = np.full(n, np.nan)  # Ensemble spread on forecast days
 
-    # Load weather data
-    if USE_MANUAL_JSON:
-        ensure_weather_json(WEATHER_JSON_PATH)
-        weather_records = load_weather_data_from_json(
-            WEATHER_JSON_PATH, start_date=START_DATE, end_date=END_DATE
-        )
-
-        if weather_records:
-            for record in weather_records:
-                try:
-                    d = date.fromisoformat(record["date"])
-                    if d in idx:
-                        i = idx[d]
-                        if record.get("wind_max_kn") is not None:
-                            wind_kn[i] = record["wind_max_kn"]
-                            coverage[i] = record.get("source", "MANUAL")
-                        if record.get("gust_max_kn") is not None:
-                            gust_kn[i] = record["gust_max_kn"]
-                        if record.get("wind_dir_deg") is not None:
-                            wdir_deg[i] = record["wind_dir_deg"]
-                        if record.get("wave_max_m") is not None:
-                            wave_m[i] = record["wave_max_m"]
-                        if record.get("visibility_km") is not None:
-                            vis_km[i] = record["visibility_km"]
-                        if record.get("risk_level"):
-                            risk_level_override[i] = str(record["risk_level"]).upper()
-                        if record.get("is_shamal") is not None:
-                            shamal_override[i] = parse_bool(record["is_shamal"])
-                except Exception as e:
-                    print(
-                        f"[WARN] Weather data processing error ({record.get('date', 'Unknown')}): {e}"
-                    )
-        else:
-            print("[WARN] Unable to load weather data.")
-
-    # API mode (if USE_MANUAL_JSON = False)
-    if not USE_MANUAL_JSON:
-        today = datetime.now().date()
-        archive_end = min(END_DATE, today - timedelta(days=2))
-        if archive_end >= START_DATE:
+    # Manual JSON records
+    if weather_records:
+        for record in weather_records:
             try:
-                arc = fetch_archive(START_DATE, archive_end)
-                for d_str, w, g, wd, v in zip(
-                    arc["dates"],
-                    arc["wind_max_kn"],
-                    arc["gust_max_kn"],
-                    arc["wind_dir_deg"],
-                    arc["vis_min_km"],
-                ):
-                    d = date.fromisoformat(d_str)
-                    if d in idx:
-                        i = idx[d]
-                        wind_kn[i], gust_kn[i], wdir_deg[i], vis_km[i] = w, g, wd, v
-                        coverage[i] = "ARCHIVE"
-            except Exception:
-                pass
-
-        remaining_start = max(START_DATE, today - timedelta(days=1))
-        if remaining_start <= END_DATE:
-            model_payloads = []
-            for name, url in MODEL_URLS.items():
-                try:
-                    model_payloads.append(
-                        fetch_weather_model(name, url, remaining_start, END_DATE)
-                    )
-                except Exception:
-                    pass
-
-            for d in days:
-                if d < remaining_start:
-                    continue
-                i = idx[d]
-                d_str = d.isoformat()
-
-                w_list, g_list, wd_list, v_list = [], [], [], []
-                for p in model_payloads:
-                    if d_str in p["dates"]:
-                        k = p["dates"].index(d_str)
-                        w_list.append(p["wind_max_kn"][k])
-                        g_list.append(p["gust_max_kn"][k])
-                        wd_list.append(p["wind_dir_deg"][k])
-                        v_list.append(p["vis_min_km"][k])
-
-                if coverage[i] != "ARCHIVE":
-                    if w_list:
-                        wind_kn[i] = float(np.nanmean(w_list))
-                        gust_kn[i] = float(np.nanmean(g_list)) if g_list else np.nan
-                        wdir_deg[i] = float(np.nanmean(wd_list)) if wd_list else np.nan
-                        vis_km[i] = float(np.nanmean(v_list)) if v_list else np.nan
-                        coverage[i] = "FORECAST_ENSEMBLE"
+                d = date.fromisoformat(record["date"])
+                if d in idx:
+                    i = idx[d]
+                    if record.get("wind_max_kn") is not None:
+                        wind_kn[i] = record["wind_max_kn"]
+                        coverage[i] = record.get("source", "MANUAL")
+                    if record.get("gust_max_kn") is not None:
+                        gust_kn[i] = record["gust_max_kn"]
+                    if record.get("wind_dir_deg") is not None:
+                        wdir_deg[i] = record["wind_dir_deg"]
+                    if record.get("wave_max_m") is not None:
+                        wave_m[i] = record["wave_max_m"]
+                    if record.get("visibility_km") is not None:
+                        vis_km[i] = record["visibility_km"]
+                    if record.get("risk_level"):
+                        risk_level_override[i] = str(record["risk_level"]).upper()
+                    if record.get("is_shamal") is not None:
+                        shamal_override[i] = parse_bool(record["is_shamal"])
+            except Exception as e:
+                print(
+                    f"[WARN] Weather data processing error ({record.get('date', 'Unknown')}): {e}"
+                )
 
-        try:
-            mw = fetch_marine_waves(START_DATE, END_DATE)
+    # API data (fetch_all_sources)
+    if fetched is not None:
+        arc = fetched["archive"]
+        if arc is not None:
+            for d_str, w, g, wd, v in zip(
+                arc["dates"],
+                arc["wind_max_kn"],
+                arc["gust_max_kn"],
+                arc["wind_dir_deg"],
+                arc["vis_min_km"],
+            ):
+                d = date.fromisoformat(d_str)
+                if d in idx:
+                    i = idx[d]
+                    wind_kn[i], gust_kn[i], wdir_deg[i], vis_km[i] = w, g, wd, v
+                    coverage[i] = "ARCHIVE"
+
+        remaining_start = fetched["remaining_start"]
+        if remaining_start <= d1 and fetched["models"]:
+            blend = blend_model_payloads(fetched["models"], days)
+            use = (
+                (np.array(days, dtype="datetime64[D]") >= np.datetime64(remaining_start))
+                & (blend["n_models"] > 0)
+                & (coverage != "ARCHIVE")
+            )
+            wind_kn[use] = blend["wind_max_kn"][use]
+            gust_kn[use] = blend["gust_max_kn"][use]
+            wdir_deg[use] = blend["wind_dir_deg"][use]
+            vis_km[use] = blend["vis_min_km"][use]
+            wind_spread_kn[use] = blend["wind_max_kn_spread"][use]
+            coverage[use] = "FORECAST_ENSEMBLE"
+
+        mw = fetched["marine"]
+        if mw is not None:
             for d_str, wv in zip(mw["dates"], mw["wave_max_m"]):
                 d = date.fromisoformat(d_str)
                 if d in idx:
                     wave_m[idx[d]] = wv
-        except Exception:
-            pass
 
-        missing = np.isnan(wind_kn)
-        if missing.any():
-            try:
-                clim = fetch_climate_wind_max(START_DATE, END_DATE)
-                clim_map = {
-                    date.fromisoformat(t): v
-                    for t, v in zip(clim["dates"], clim["wind_max_kn"])
-                }
-                for d in days:
-                    i = idx[d]
-                    if np.isnan(wind_kn[i]) and d in clim_map:
-                        wind_kn[i] = float(clim_map[d])
-                        coverage[i] = "CLIMATE_FILL"
-            except Exception:
-                pass
+        clim = fetched["climate"]
+        if clim is not None:
+            for t, v in zip(clim["dates"], clim["wind_max_kn"]):
+                d = date.fromisoformat(t)
+                if d in idx:
+                    clim_wind[idx[d]] = v
 
     # Gap fill
     print("\n[INFO] Checking data completeness...")
-    missing_count = np.sum(np.isnan(wind_kn))
+    missing_count = fill_daily_gaps(
+        wind_kn, gust_kn, wave_m, vis_km, coverage, climatology_wind_kn=clim_wind
+    )
     if missing_count > 0:
         print(f"   [WARN] {missing_count} days of data are missing.")
 
-        for i in range(n):
-            if np.isnan(wind_kn[i]):
-                prev_val = (
-                    wind_kn[i - 1] if i > 0 and not np.isnan(wind_kn[i - 1]) else None
-                )
-                next_val = (
-                    wind_kn[i + 1]
-                    if i < n - 1 and not np.isnan(wind_kn[i + 1])
-                    else None
-                )
-
-                if prev_val is not None and next_val is not None:
-                    wind_kn[i] = (prev_val + next_val) / 2
-                    gust_kn[i] = (
-                        wind_kn[i] * 1.3 if np.isnan(gust_kn[i]) else gust_kn[i]
-                    )
-                    coverage[i] = "INTERPOLATED"
-                elif prev_val is not None:
-                    wind_kn[i] = prev_val
-                    gust_kn[i] = (
-                        wind_kn[i] * 1.3 if np.isnan(gust_kn[i]) else gust_kn[i]
-                    )
-                    coverage[i] = "INTERPOLATED"
-                elif next_val is not None:
-                    wind_kn[i] = next_val
-                    gust_kn[i] = (
-                        wind_kn[i] * 1.3 if np.isnan(gust_kn[i]) else gust_kn[i]
-                    )
-                    coverage[i] = "INTERPOLATED"
-                else:
-                    wind_kn[i] = 12.0
-                    gust_kn[i] = 15.0
-                    coverage[i] = "DEFAULT"
-
-            if np.isnan(wave_m[i]) and not np.isnan(wind_kn[i]):
-                wave_m[i] = float(np.clip(wind_kn[i] * 0.04, 0.30, 2.50))
-
-            if np.isnan(vis_km[i]):
-                vis_km[i] = 8.00
-
-            if np.isnan(gust_kn[i]) and not np.isnan(wind_kn[i]):
-                gust_kn[i] = wind_kn[i] * 1.30
-
     # Calculate risk
     risk = calc_risk_score(wind_kn, gust_kn, wave_m, vis_km)
-    status = [op_status_from_score(s) for s in risk]
-    shamal = np.array(
-        [is_shamal_day(wdir_deg[i], wind_kn[i], gust_kn[i]) for i in range(n)],
-        dtype=bool,
-    )
+    status = np.array(OP_STATUS_LEVELS)[op_status_codes(risk)].tolist()
+    shamal = is_shamal_day(wdir_deg, wind_kn, gust_kn)
 
     risk_map = {"LOW": 20.0, "MEDIUM": 45.0, "HIGH": 75.0}
     for i, level in enumerate(risk_level_override):
@@ -757,6 +1145,370 @@ def main():
                 if s <= d <= e:
                     shamal[idx[d]] = True
 
+    return {
+        "start": d0,
+        "end": d1,
+        "days": days,
+        "wind_kn": wind_kn,
+        "gust_kn": gust_kn,
+        "wdir_deg": wdir_deg,
+        "vis_km": vis_km,
+        "wave_m": wave_m,
+        "risk": risk,
+        "status": status,
+        "shamal": shamal,
+        "coverage": coverage,
+        "wind_spread_kn": wind_spread_kn,
+    }
+
+
+# -----------------------------
+# HEATMAP RENDERING
+# -----------------------------
+HEATMAP_PARAMS = [
+    "Risk (0-100)",
+    "Dir (deg)",
+    "Vis (km)",
+    "Wave (m)",
+    "Gust (kt)",
+    "Wind (kt)",
+]
+
+# Fixed ranges for normalization (same order as HEATMAP_PARAMS)
+HEATMAP_RANGES = [
+    (0.0, 100.0),  # risk
+    (0.0, 360.0),  # dir deg
+    (0.0, 10.0),  # vis km
+    (0.0, 2.5),  # wave m
+    (0.0, 30.0),  # gust kn
+    (0.0, 25.0),  # wind kn
+]
+
+# "matplotlib" (full figure stack) or "raster" (weather_heatmap_raster pixel buffer)
+RENDER_BACKEND = "matplotlib"
+
+
+def heatmap_matrix(data: dict) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """(row labels, raw 6 x days matrix, matrix normalised by HEATMAP_RANGES)."""
+    data_matrix = np.vstack(
+        [
+            data["risk"],
+            data["wdir_deg"],
+            data["vis_km"],
+            data["wave_m"],
+            data["gust_kn"],
+            data["wind_kn"],
+        ]
+    )
+    data_norm = np.zeros_like(data_matrix, dtype=float)
+    for r, (mn, mx) in enumerate(HEATMAP_RANGES):
+        data_norm[r] = np.clip((data_matrix[r] - mn) / (mx - mn + 1e-9), 0.0, 1.0)
+    return list(HEATMAP_PARAMS), data_matrix, data_norm
+
+
+def heatmap_summary(data: dict) -> dict:
+    """GO/HOLD/NO-GO, shamal and coverage counts shown in the summary boxes."""
+    status, coverage = data["status"], data["coverage"]
+    return {
+        "go": status.count("GO"),
+        "hold": status.count("HOLD"),
+        "nogo": status.count("NO-GO"),
+        "shamal": int(data["shamal"].sum()),
+        "coverage": {k: int(np.sum(coverage == k)) for k in np.unique(coverage) if k},
+    }
+
+
+def summary_box_text(data: dict, summary: dict) -> str:
+    n = len(data["days"])
+    go_n, hold_n, nogo_n = summary["go"], summary["hold"], summary["nogo"]
+    return (
+        f"Weather Analysis Summary\n"
+        f"{'─'*24}\n"
+        f"Period: {data['start'].isoformat()} to {data['end'].isoformat()} ({n} days)\n"
+        f"GO Days: {go_n} ({go_n/n*100:.2f}%)\n"
+        f"HOLD Days: {hold_n} ({hold_n/n*100:.2f}%)\n"
+        f"NO-GO Days: {nogo_n} ({nogo_n/n*100:.2f}%)\n"
+        f"Shamal Detected Days (NW+Strong): {summary['shamal']}\n"
+        f"Max Gust (kt): {np.nanmax(data['gust_kn']):.2f}\n"
+        f"Max Wave (m): {np.nanmax(data['wave_m']):.2f}\n"
+    )
+
+
+def coverage_box_text(cov_counts: dict) -> str:
+    cov_lines = "\n".join([f"{k}: {v}" for k, v in cov_counts.items()])
+    return f"Data Coverage\n{'─'*14}\n{cov_lines}\n\nNote: CLIMATE FILL is modelled baseline, not actual measurement."
+
+
+# -----------------------------
+# CLIENT-SIDE OUTPUT (JSON / SVG)
+# -----------------------------
+# "png" (render_heatmap), "json" (heatmap_payload, drawn by the dashboard) or "svg"
+HEATMAP_OUTPUT_FORMAT = "png"
+HEATMAP_OUTPUT_SUFFIX = {"png": ".png", "json": ".json", "svg": ".svg"}
+# Bump when heatmap_payload keys change
+HEATMAP_PAYLOAD_VERSION = 1
+
+
+def _rounded_list(values, ndigits: int) -> list:
+    return [None if np.isnan(v) else round(float(v), ndigits) for v in values]
+
+
+def heatmap_payload(data: dict) -> dict:
+    """
+    Compact heatmap data for client-side rendering.
+
+    matrix rows follow params, normalised 0-1 by HEATMAP_RANGES; values are
+    the raw cell values. One entry per day in status/shamal/coverage. NaN -> null.
+    """
+    params, data_matrix, data_norm = heatmap_matrix(data)
+    return {
+        "version": HEATMAP_PAYLOAD_VERSION,
+        "start": data["start"].isoformat(),
+        "end": data["end"].isoformat(),
+        "days": [d.isoformat() for d in data["days"]],
+        "params": params,
+        "ranges": [list(r) for r in HEATMAP_RANGES],
+        "matrix": [_rounded_list(row, 3) for row in data_norm],
+        "values": [_rounded_list(row, 2) for row in data_matrix],
+        "status": list(data["status"]),
+        "shamal": [int(s) for s in data["shamal"]],
+        "coverage": [c or None for c in data["coverage"]],
+        "summary": heatmap_summary(data),
+    }
+
+
+def write_heatmap_json(data: dict, output_path: str) -> dict:
+    """Write heatmap_payload() as minified JSON; returns the summary counts."""
+    payload = heatmap_payload(data)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+    return payload["summary"]
+
+
+def _gradient_hex(colors: list[str], values: np.ndarray) -> np.ndarray:
+    """'#rrggbb' for 0-1 values on the linear gradient through colors."""
+    stops = np.linspace(0.0, 1.0, len(colors))
+    rgb = np.array([[int(c[i : i + 2], 16) for i in (1, 3, 5)] for c in colors], dtype=float)
+    v = np.nan_to_num(np.clip(values, 0.0, 1.0), nan=0.0)
+    channels = [np.rint(np.interp(v, stops, rgb[:, k])).astype(int) for k in range(3)]
+    return np.vectorize(lambda r, g, b: f"#{r:02x}{g:02x}{b:02x}")(*channels)
+
+
+def render_heatmap_svg(data: dict, output_path: str, theme: dict | None = None) -> dict:
+    """
+    Write a small standalone SVG: parameter x day cells coloured by the
+    normalised value, a status strip, and shamal days outlined.
+    Returns the summary counts.
+    """
+    theme = theme or DASHBOARD_THEME
+    params, data_matrix, data_norm = heatmap_matrix(data)
+    days, status, shamal = data["days"], data["status"], data["shamal"]
+    n, rows = len(days), len(params)
+    label_w, cell_w, cell_h, head_h = 92, 64, 24, 20
+    width, height = label_w + n * cell_w, head_h + (rows + 1) * cell_h
+    fills = _gradient_hex(theme["cmap"], data_norm)
+    text_primary, bg_primary = theme["text_primary"], theme["bg_primary"]
+
+    out = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="sans-serif" font-size="11">',
+        f'<rect width="{width}" height="{height}" fill="{bg_primary}"/>',
+    ]
+    for c, d in enumerate(days):
+        x = label_w + c * cell_w + cell_w / 2
+        out.append(
+            f'<text x="{x:g}" y="14" text-anchor="middle" fill="{theme["text_secondary"]}">'
+            f'{d.strftime("%d %b")}</text>'
+        )
+
+    # Top row = last param, as in the PNG (row 0 = risk at the bottom)
+    for i, r in enumerate(reversed(range(rows))):
+        y = head_h + i * cell_h
+        out.append(
+            f'<text x="{label_w - 6}" y="{y + 16}" text-anchor="end" '
+            f'fill="{text_primary}">{params[r]}</text>'
+        )
+        for c in range(n):
+            x = label_w + c * cell_w
+            out.append(f'<rect x="{x}" y="{y}" width="{cell_w}" height="{cell_h}" fill="{fills[r, c]}"/>')
+            val = data_matrix[r, c]
+            if np.isnan(val):
+                continue
+            txt = f"{val:.0f}" if r in (0, 1, 4, 5) else f"{val:.1f}"
+            color = text_primary if data_norm[r, c] > 0.5 else bg_primary
+            out.append(
+                f'<text x="{x + cell_w / 2:g}" y="{y + 16}" text-anchor="middle" '
+                f'font-weight="bold" fill="{color}">{txt}</text>'
+            )
+
+    y = head_h + rows * cell_h
+    out.append(f'<text x="{label_w - 6}" y="{y + 16}" text-anchor="end" fill="{text_primary}">Status</text>')
+    for c, s in enumerate(status):
+        x = label_w + c * cell_w
+        fill = theme["status"].get(s, theme["text_muted"])
+        out.append(f'<rect x="{x + 2}" y="{y + 2}" width="{cell_w - 4}" height="{cell_h - 4}" fill="{fill}"/>')
+        out.append(
+            f'<text x="{x + cell_w / 2:g}" y="{y + 16}" text-anchor="middle" '
+            f'font-weight="bold" fill="{bg_primary}">{s}</text>'
+        )
+    for c in np.flatnonzero(shamal):
+        x = label_w + c * cell_w
+        out.append(
+            f'<rect x="{x + 1}" y="{head_h + 1}" width="{cell_w - 2}" height="{(rows + 1) * cell_h - 2}" '
+            f'fill="none" stroke="{theme["shamal"]}" stroke-width="2"><title>Shamal</title></rect>'
+        )
+    out.append("</svg>")
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(out))
+    return heatmap_summary(data)
+
+
+def heatmap_output_path(output_path: str, fmt: str) -> str:
+    """output_path with its suffix replaced for fmt (png/json/svg)."""
+    if fmt not in HEATMAP_OUTPUT_SUFFIX:
+        raise ValueError(f"Unknown heatmap output format: {fmt}")
+    return os.path.splitext(output_path)[0] + HEATMAP_OUTPUT_SUFFIX[fmt]
+
+
+def export_heatmap(data: dict, output_path: str, fmt: str | None = None) -> dict:
+    """Write the heatmap as PNG, client-side JSON or SVG; returns the summary counts."""
+    fmt = fmt or HEATMAP_OUTPUT_FORMAT
+    if fmt == "json":
+        return write_heatmap_json(data, output_path)
+    if fmt == "svg":
+        return render_heatmap_svg(data, output_path)
+    if fmt != "png":
+        raise ValueError(f"Unknown heatmap output format: {fmt}")
+    return render_heatmap(data, output_path)
+
+
+# -----------------------------
+# RENDER CACHE
+# -----------------------------
+# Skip re-rendering when the heatmap inputs are unchanged; the hash is kept in
+# a sidecar <output>.manifest.json next to the output file.
+USE_RENDER_CACHE = True
+# Bump when rendering changes so existing outputs are redrawn
+RENDER_CACHE_VERSION = 1
+
+
+def heatmap_input_hash(data: dict, fmt: str, theme: dict | None = None, voyages: list | None = None) -> str:
+    """
+    SHA-256 over everything the heatmap is drawn from: the collected daily
+    series (records after blending/gap fill) and date range, theme, voyage
+    overlays, output format and (PNG) render backend.
+    """
+    h = hashlib.sha256()
+    h.update(f"v{RENDER_CACHE_VERSION}|{fmt}|{RENDER_BACKEND if fmt == 'png' else ''}".encode())
+    h.update(f"|{data['start'].isoformat()}|{data['end'].isoformat()}|".encode())
+    for key in ("wind_kn", "gust_kn", "wdir_deg", "vis_km", "wave_m", "risk"):
+        h.update(np.ascontiguousarray(data[key], dtype=np.float64).tobytes())
+    h.update(np.asarray(data["shamal"], dtype=bool).tobytes())
+    h.update(json.dumps([list(data["status"]), [c or "" for c in data["coverage"]]]).encode())
+    h.update(json.dumps(theme or DASHBOARD_THEME, sort_keys=True).encode())
+    h.update(json.dumps(VOYAGES if voyages is None else voyages, sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+
+def heatmap_manifest_path(output_path: str) -> str:
+    return output_path + ".manifest.json"
+
+
+def load_heatmap_manifest(output_path: str) -> dict | None:
+    """Sidecar manifest for output_path, or None if missing/unreadable."""
+    try:
+        with open(heatmap_manifest_path(output_path), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_heatmap_manifest(output_path: str, input_hash: str, fmt: str, summary: dict) -> None:
+    path = heatmap_manifest_path(output_path)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "hash": input_hash,
+                "format": fmt,
+                "output": os.path.basename(output_path),
+                "rendered_at": datetime.now().isoformat(timespec="seconds"),
+                "summary": summary,
+            },
+            f,
+            indent=2,
+        )
+    os.replace(tmp_path, path)
+
+
+def cached_heatmap_summary(data: dict, output_path: str, fmt: str, input_hash: str | None = None) -> dict | None:
+    """Manifest summary if output_path exists and was rendered from the same inputs."""
+    if not USE_RENDER_CACHE or not os.path.exists(output_path):
+        return None
+    manifest = load_heatmap_manifest(output_path)
+    if manifest is None or "summary" not in manifest:
+        return None
+    if manifest.get("hash") != (input_hash or heatmap_input_hash(data, fmt)):
+        return None
+    return manifest["summary"]
+
+
+def export_heatmap_cached(
+    data: dict, output_path: str, fmt: str | None = None, force: bool = False
+) -> tuple[dict, bool]:
+    """
+    export_heatmap() unless output_path and its manifest already match the
+    input hash. Returns (summary, rendered).
+    """
+    fmt = fmt or HEATMAP_OUTPUT_FORMAT
+    if not USE_RENDER_CACHE:
+        return export_heatmap(data, output_path, fmt), True
+
+    input_hash = heatmap_input_hash(data, fmt)
+    summary = None if force else cached_heatmap_summary(data, output_path, fmt, input_hash)
+    if summary is not None:
+        return summary, False
+
+    summary = export_heatmap(data, output_path, fmt)
+    write_heatmap_manifest(output_path, input_hash, fmt, summary)
+    return summary, True
+
+
+def render_heatmap(data: dict, output_path: str, backend: str | None = None) -> dict:
+    """
+    Render the dashboard heatmap PNG for collect_daily_weather() output.
+
+    backend: "matplotlib" or "raster" (default RENDER_BACKEND).
+    Returns the status/shamal/coverage counts shown in the summary boxes.
+    """
+    backend = backend or RENDER_BACKEND
+    if backend == "raster":
+        from weather_heatmap_raster import render_heatmap_raster
+
+        return render_heatmap_raster(data, output_path)
+    if backend != "matplotlib":
+        raise ValueError(f"Unknown render backend: {backend}")
+    return render_heatmap_matplotlib(data, output_path)
+
+
+def render_heatmap_matplotlib(data: dict, output_path: str) -> dict:
+    """
+    Render the dashboard heatmap PNG through the matplotlib figure stack.
+
+    Returns the status/shamal/coverage counts shown in the summary boxes.
+    """
+    import matplotlib as mpl
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as mpatches
+    from matplotlib.colors import LinearSegmentedColormap
+    from matplotlib.offsetbox import AnchoredText
+
+    start, end, days = data["start"], data["end"], data["days"]
+    idx = to_idx_map(days)
+    n = len(days)
+    risk, status, shamal = data["risk"], data["status"], data["shamal"]
+
     # =====================================================
     # DASHBOARD-OPTIMIZED VISUALIZATION
     # =====================================================
@@ -790,30 +1542,7 @@ def main():
         }
     )
 
-    # Heatmap parameters
-    params = [
-        "Risk (0-100)",
-        "Dir (deg)",
-        "Vis (km)",
-        "Wave (m)",
-        "Gust (kt)",
-        "Wind (kt)",
-    ]
-    data_matrix = np.vstack([risk, wdir_deg, vis_km, wave_m, gust_kn, wind_kn])
-
-    # Fixed ranges for normalization
-    ranges = [
-        (0.0, 100.0),  # risk
-        (0.0, 360.0),  # dir deg
-        (0.0, 10.0),  # vis km
-        (0.0, 2.5),  # wave m
-        (0.0, 30.0),  # gust kn
-        (0.0, 25.0),  # wind kn
-    ]
-
-    data_norm = np.zeros_like(data_matrix, dtype=float)
-    for r, (mn, mx) in enumerate(ranges):
-        data_norm[r] = np.clip((data_matrix[r] - mn) / (mx - mn + 1e-9), 0.0, 1.0)
+    params, data_matrix, data_norm = heatmap_matrix(data)
 
     cmap = LinearSegmentedColormap.from_list("dashboard_risk", theme["cmap"], N=256)
 
@@ -856,6 +1585,7 @@ def main():
         aspect="auto",
         cmap=cmap,
         interpolation="nearest",
+        origin="lower",  # Row r (params[r]) at y=r, matching labels and annotations
         extent=[-0.5, n - 0.5, -0.5, len(params) - 0.5],
     )
 
@@ -931,10 +1661,10 @@ def main():
     # Voyage overlays
     voyage_colors = theme["voyage"]
     for v in VOYAGES:
-        if v["end"] < START_DATE or v["start"] > END_DATE:
+        if v["end"] < start or v["start"] > end:
             continue
-        s = max(v["start"], START_DATE)
-        e = min(v["end"], END_DATE)
+        s = max(v["start"], start)
+        e = min(v["end"], end)
         xs = idx[s]
         xe = idx[e]
         color = voyage_colors.get(v["type"], voyage_colors["default"])
@@ -985,22 +1715,8 @@ def main():
     )
 
     # Status summary box
-    go_n = status.count("GO")
-    hold_n = status.count("HOLD")
-    nogo_n = status.count("NO-GO")
-    shamal_n = int(shamal.sum())
-
-    stats_text = (
-        f"Weather Analysis Summary\n"
-        f"{'─'*24}\n"
-        f"Period: {START_DATE.isoformat()} to {END_DATE.isoformat()} ({n} days)\n"
-        f"GO Days: {go_n} ({go_n/n*100:.2f}%)\n"
-        f"HOLD Days: {hold_n} ({hold_n/n*100:.2f}%)\n"
-        f"NO-GO Days: {nogo_n} ({nogo_n/n*100:.2f}%)\n"
-        f"Shamal Detected Days (NW+Strong): {shamal_n}\n"
-        f"Max Gust (kt): {np.nanmax(gust_kn):.2f}\n"
-        f"Max Wave (m): {np.nanmax(wave_m):.2f}\n"
-    )
+    summary = heatmap_summary(data)
+    stats_text = summary_box_text(data, summary)
     stats_box = AnchoredText(
         stats_text,
         loc="lower left",
@@ -1021,9 +1737,8 @@ def main():
     ax2.add_artist(stats_box)
 
     # Data coverage box
-    cov_counts = {k: int(np.sum(coverage == k)) for k in np.unique(coverage) if k}
-    cov_lines = "\n".join([f"{k}: {v}" for k, v in cov_counts.items()])
-    cov_text = f"Data Coverage\n{'─'*14}\n{cov_lines}\n\nNote: CLIMATE FILL is modelled baseline, not actual measurement."
+    cov_counts = summary["coverage"]
+    cov_text = coverage_box_text(cov_counts)
     cov_box = AnchoredText(
         cov_text,
         loc="lower right",
@@ -1099,7 +1814,7 @@ def main():
 
     # Save with 50% transparent background (alpha=0.5) for HTML overlay
     plt.savefig(
-        OUTPUT_PATH,
+        output_path,
         dpi=150,
         bbox_inches="tight",
         facecolor="none",
@@ -1108,11 +1823,260 @@ def main():
     )
     plt.close()
 
-    print(f"\n[OK] Dashboard Heatmap generated -> {OUTPUT_PATH}")
+    return summary
+
+
+# -----------------------------
+# BATCH MODE
+# -----------------------------
+def load_batch_jobs(jobs_path: str, fmt: str | None = None) -> list[dict]:
+    """
+    Load batch jobs: [{"site", "start", "end", "lat"?, "lon"?, "json"?, "output"?, "format"?}]
+    (a bare list or {"jobs": [...]}).
+
+    lat/lon default to SITES[site]. Jobs with "json" use that manual weather
+    JSON; all others use the API. format is png/json/svg (default fmt, else
+    HEATMAP_OUTPUT_FORMAT); output defaults to
+    out/weather_heatmap_<site>_<start>_<end>.<format>, and its suffix is
+    replaced to match the format.
+    """
+    with open(jobs_path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    if isinstance(raw, dict):
+        raw = raw.get("jobs", [])
+
+    jobs = []
+    for k, job in enumerate(raw):
+        site = str(job.get("site", f"job{k + 1}"))
+        start = date.fromisoformat(job["start"])
+        end = date.fromisoformat(job["end"])
+        if end < start:
+            raise ValueError(f"Batch job {site}: end {end} before start {start}")
+        if "lat" in job and "lon" in job:
+            lat, lon = float(job["lat"]), float(job["lon"])
+        elif site in SITES:
+            lat, lon = SITES[site]
+        else:
+            raise ValueError(f"Batch job {site}: unknown site, give lat/lon")
+        job_fmt = job.get("format") or fmt or HEATMAP_OUTPUT_FORMAT
+        # Suffix follows the format, as in main(), also for an explicit output
+        output = heatmap_output_path(
+            job.get("output")
+            or os.path.join(SCRIPT_DIR, "out", f"weather_heatmap_{site}_{start:%Y%m%d}_{end:%Y%m%d}"),
+            job_fmt,
+        )
+        jobs.append(
+            {
+                "site": site,
+                "start": start,
+                "end": end,
+                "lat": lat,
+                "lon": lon,
+                "json": job.get("json"),
+                "output": output,
+                "format": job_fmt,
+            }
+        )
+    return jobs
+
+
+def run_batch(
+    jobs: list[dict],
+    max_workers: int = BATCH_RENDER_WORKERS,
+    today: date | None = None,
+    force: bool = False,
+) -> list[tuple[dict, dict, bool]]:
+    """
+    Render every job, sharing inputs and render processes.
+
+    API data is fetched once per (lat, lon) over the union of its job ranges
+    (sites concurrently), each manual JSON is loaded once, and figures are
+    rendered in a process pool so matplotlib starts once per worker rather
+    than once per site; jobs whose render manifest matches are skipped
+    unless force is set.
+    Returns (job, render summary, rendered) in job order.
+    """
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    today = today or datetime.now().date()
+
+    def union_ranges(key_fn) -> dict:
+        ranges = {}
+        for job in jobs:
+            key = key_fn(job)
+            if key is None:
+                continue
+            d0, d1 = ranges.get(key, (job["start"], job["end"]))
+            ranges[key] = (min(d0, job["start"]), max(d1, job["end"]))
+        return ranges
+
+    api_ranges = union_ranges(lambda j: None if j["json"] else (j["lat"], j["lon"]))
+    json_ranges = union_ranges(lambda j: j["json"])
+
+    fetched_by_loc = {}
+    if api_ranges:
+        with ThreadPoolExecutor(max_workers=len(api_ranges)) as pool:
+            futures = {
+                loc: pool.submit(fetch_all_sources, d0, d1, today, lat=loc[0], lon=loc[1])
+                for loc, (d0, d1) in api_ranges.items()
+            }
+            fetched_by_loc = {loc: f.result() for loc, f in futures.items()}
+    records_by_json = {
+        path: load_weather_data_from_json(path, start_date=d0, end_date=d1)
+        for path, (d0, d1) in json_ranges.items()
+    }
+
+    datasets = []
+    for job in jobs:
+        if job["json"]:
+            data = collect_daily_weather(
+                job["start"], job["end"], weather_records=records_by_json[job["json"]]
+            )
+        else:
+            data = collect_daily_weather(
+                job["start"], job["end"], fetched=fetched_by_loc[(job["lat"], job["lon"])]
+            )
+        os.makedirs(os.path.dirname(os.path.abspath(job["output"])), exist_ok=True)
+        datasets.append(data)
+
+    outputs = [job["output"] for job in jobs]
+    formats = [job["format"] for job in jobs]
+    if max_workers <= 1 or len(jobs) <= 1:
+        results = [
+            export_heatmap_cached(d, o, f, force) for d, o, f in zip(datasets, outputs, formats)
+        ]
+    else:
+        # Unchanged jobs are answered from their manifests without a worker
+        results = [None] * len(jobs)
+        todo = []
+        for k, (d, o, f) in enumerate(zip(datasets, outputs, formats)):
+            summary = None if force else cached_heatmap_summary(d, o, f)
+            if summary is not None:
+                results[k] = (summary, False)
+            else:
+                todo.append(k)
+        if todo:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(todo))) as pool:
+                rendered = pool.map(
+                    export_heatmap_cached,
+                    [datasets[k] for k in todo],
+                    [outputs[k] for k in todo],
+                    [formats[k] for k in todo],
+                    [force] * len(todo),
+                )
+                for k, result in zip(todo, rendered):
+                    results[k] = result
+    return [(job, summary, fresh) for job, (summary, fresh) in zip(jobs, results)]
+
+
+def batch_main(
+    jobs_path: str,
+    max_workers: int = BATCH_RENDER_WORKERS,
+    fmt: str | None = None,
+    force: bool = False,
+):
+    jobs = load_batch_jobs(jobs_path, fmt)
+    print(f"[INFO] Batch: {len(jobs)} jobs | render workers: {max_workers}")
+    for job, summary, rendered in run_batch(jobs, max_workers, force=force):
+        print(
+            f"[OK] {job['site']} {job['start'].isoformat()} ~ {job['end'].isoformat()} "
+            f"-> {job['output']}{'' if rendered else ' (unchanged, skipped)'}"
+        )
+        print(
+            f"   GO/HOLD/NO-GO: {summary['go']}/{summary['hold']}/{summary['nogo']} (days)"
+            f" | Shamal: {summary['shamal']} | Coverage: {summary['coverage']}"
+        )
+
+
+def main(
+    config: DashboardConfig | None = None,
+    fmt: str | None = None,
+    force: bool = False,
+    hourly: bool | None = None,
+):
+    cfg = config or get_config()
+    fmt = fmt or HEATMAP_OUTPUT_FORMAT
+    output_path = heatmap_output_path(cfg.output_path, fmt)
+    print(
+        f"[INFO] Date range: {cfg.start_date.isoformat()} ~ {cfg.end_date.isoformat()} "
+        f"(4 days) | Data: {cfg.weather_json_path}"
+    )
+
+    weather_records = None
+    fetched = None
+    dataset = None
+    if USE_MANUAL_JSON and hourly:
+        print("[WARN] Hourly dataset ignored: USE_MANUAL_JSON is on (set it to False for API mode)")
+    if USE_MANUAL_JSON:
+        ensure_weather_json(cfg.weather_json_path)
+        weather_records = load_weather_data_from_json(
+            cfg.weather_json_path, start_date=cfg.start_date, end_date=cfg.end_date
+        )
+        if not weather_records:
+            print("[WARN] Unable to load weather data.")
+    elif USE_HOURLY_DATASET if hourly is None else hourly:
+        from weather_hourly import daily_from_hourly, load_hourly_dataset, write_gonogo_forecast
+
+        dataset, dataset_path = load_hourly_dataset(cfg.start_date, cfg.end_date, datetime.now().date())
+        gngc_path = write_gonogo_forecast(dataset, os.path.splitext(dataset_path)[0] + ".gngc")
+        print(f"[OK] Hourly dataset ({len(dataset)} h) -> {dataset_path} | Go/No-Go: {gngc_path}")
+    else:
+        fetched = fetch_all_sources(cfg.start_date, cfg.end_date, datetime.now().date())
+
+    if dataset is not None:
+        data = daily_from_hourly(dataset, cfg.start_date, cfg.end_date)
+    else:
+        data = collect_daily_weather(cfg.start_date, cfg.end_date, weather_records, fetched)
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    summary, rendered = export_heatmap_cached(data, output_path, fmt, force=force)
+    go_n, hold_n, nogo_n = summary["go"], summary["hold"], summary["nogo"]
+    shamal_n, cov_counts = summary["shamal"], summary["coverage"]
+
+    if rendered:
+        print(f"\n[OK] Dashboard Heatmap generated -> {output_path}")
+    else:
+        print(f"\n[OK] Dashboard Heatmap unchanged, render skipped -> {output_path}")
     print(f"   GO/HOLD/NO-GO: {go_n}/{hold_n}/{nogo_n} (days)")
     print(f"   Detected Shamal days: {shamal_n}")
     print(f"   Coverage: {cov_counts}")
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="AGI TR weather risk heatmap")
+    parser.add_argument(
+        "--batch",
+        help='Jobs JSON: [{"site", "start", "end", "lat"?, "lon"?, "json"?, "output"?}]',
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=BATCH_RENDER_WORKERS,
+        help="Render processes for --batch",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(HEATMAP_OUTPUT_SUFFIX),
+        help="png, json (client-side rendering payload) or svg (default HEATMAP_OUTPUT_FORMAT); "
+        'with --batch, used for jobs without "format"',
+    )
+    parser.add_argument(
+        "--hourly",
+        action="store_true",
+        default=None,
+        help="API mode: score hourly data (shared with Go/No-Go) instead of daily maxima",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render even if the render manifest matches the inputs",
+    )
+    args = parser.parse_args()
+    if args.hourly and USE_MANUAL_JSON:
+        parser.error("--hourly needs API mode; set USE_MANUAL_JSON = False")
+
+    if args.batch:
+        batch_main(args.batch, args.workers, fmt=args.format, force=args.force)
+    else:
+        main(fmt=args.format, force=args.force, hourly=args.hourly)
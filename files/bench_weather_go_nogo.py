@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the Weather Go/No-Go engine (Pipeline Step 4)
+
+Times evaluate_gate_a/b/c, evaluate_go_nogo, the array engine and
+format_html_output on synthetic hourly series (12 hours .. 1 year), and
+reports throughput (hours/s), retained allocations and peak traced memory.
+Results can be saved as a baseline JSON and later runs compared against it.
+
+Usage:
+    python bench_weather_go_nogo.py
+    python bench_weather_go_nogo.py --save-baseline out/bench/gonogo_baseline.json
+    python bench_weather_go_nogo.py --compare out/bench/gonogo_baseline.json --threshold 0.2
+"""
+
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from weather_go_nogo import (
+    GoNoGoLimits,
+    WeatherInput,
+    evaluate_gate_a,
+    evaluate_gate_b,
+    evaluate_gate_c,
+    evaluate_go_nogo,
+    evaluate_go_nogo_arrays,
+    format_html_output
+)
+
+# Series lengths: 12 hours, 2 days, 16-day forecast, 3 months, 1 year
+DEFAULT_SIZES = [12, 48, 384, 2160, 8760]
+
+
+def synthetic_series(n_hours: int, seed: int = 42) -> List[WeatherInput]:
+    """Hourly series that drifts across the default Gate-A/Gate-B limits"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_hours)
+    wave_ft = np.clip(6.0 + 3.0 * np.sin(t / 18.0) + rng.normal(0, 0.6, n_hours), 0.5, None)
+    wind_kt = np.clip(15.0 + 6.0 * np.sin(t / 27.0 + 1.0) + rng.normal(0, 2.0, n_hours), 0.0, None)
+    base = datetime(2026, 1, 1)
+    return [
+        WeatherInput(wave_ft=float(w), wind_kt=float(k), timestamp=base + timedelta(hours=i))
+        for i, (w, k) in enumerate(zip(wave_ft, wind_kt))
+    ]
+
+
+def build_cases(series: List[WeatherInput], limits: GoNoGoLimits) -> Dict[str, Callable[[], object]]:
+    """Benchmark callables for one series; inputs are prepared outside the timed call"""
+    gate_a = [evaluate_gate_a(w, limits) for w in series]
+    gate_b = [evaluate_gate_b(w, limits) for w in series]
+    wave_ft = np.array([w.wave_ft for w in series])
+    wind_kt = np.array([w.wind_kt for w in series])
+    result = evaluate_go_nogo(series, limits)
+    return {
+        "gate_a": lambda: [evaluate_gate_a(w, limits) for w in series],
+        "gate_b": lambda: [evaluate_gate_b(w, limits) for w in series],
+        "gate_c": lambda: evaluate_gate_c(series, limits, gate_a, gate_b),
+        "go_nogo": lambda: evaluate_go_nogo(series, limits),
+        "go_nogo_arrays": lambda: evaluate_go_nogo_arrays(wave_ft, wind_kt, limits),
+        "format_html": lambda: format_html_output(result, limits),
+    }
+
+
+def time_call(fn: Callable[[], object], min_time: float = 0.2, repeats: int = 3) -> float:
+    """Best per-call wall time over repeats, each looping for at least min_time"""
+    fn()  # Warm up
+    best = float("inf")
+    for _ in range(repeats):
+        loops = 0
+        start = time.perf_counter()
+        while True:
+            fn()
+            loops += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / loops)
+    return best
+
+
+def measure_memory(fn: Callable[[], object]) -> Tuple[int, int]:
+    """(retained allocation blocks, peak traced bytes) for one call"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+        del result
+    finally:
+        tracemalloc.stop()
+    return max(blocks, 0), peak
+
+
+def run_benchmarks(sizes: List[int], min_time: float = 0.2) -> Dict[str, dict]:
+    """Run every case for every series size; keys are '<case>@<hours>'"""
+    limits = GoNoGoLimits()
+    results = {}
+    for n in sizes:
+        series = synthetic_series(n)
+        for name, fn in build_cases(series, limits).items():
+            seconds = time_call(fn, min_time)
+            blocks, peak = measure_memory(fn)
+            results[f"{name}@{n}"] = {
+                "case": name,
+                "hours": n,
+                "seconds": seconds,
+                "ops_per_s": 1.0 / seconds,
+                "hours_per_s": n / seconds,
+                "alloc_blocks": blocks,
+                "peak_kb": peak / 1024.0,
+            }
+    return results
+
+
+def compare_to_baseline(
+    results: Dict[str, dict],
+    baseline: Dict[str, dict],
+    threshold: float
+) -> List[str]:
+    """Regressions: throughput below or peak memory above baseline by more than threshold"""
+    regressions = []
+    for key, cur in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if cur["hours_per_s"] < base["hours_per_s"] * (1.0 - threshold):
+            regressions.append(
+                f"{key}: throughput {cur['hours_per_s']:,.0f} < baseline {base['hours_per_s']:,.0f} hours/s"
+            )
+        if cur["peak_kb"] > base["peak_kb"] * (1.0 + threshold):
+            regressions.append(
+                f"{key}: peak memory {cur['peak_kb']:,.1f}KB > baseline {base['peak_kb']:,.1f}KB"
+            )
+    return regressions
+
+
+def print_table(results: Dict[str, dict], baseline: Dict[str, dict]) -> None:
+    print(f"{'case':<16}{'hours':>7}{'calls/s':>12}{'hours/s':>16}{'allocs':>10}{'peak KB':>12}{'vs base':>10}")
+    print("-" * 83)
+    for key, r in results.items():
+        ratio = ""
+        if key in baseline:
+            ratio = f"{r['hours_per_s'] / baseline[key]['hours_per_s']:.2f}x"
+        print(
+            f"{r['case']:<16}{r['hours']:>7}{r['ops_per_s']:>12,.0f}{r['hours_per_s']:>16,.0f}"
+            f"{r['alloc_blocks']:>10,}{r['peak_kb']:>12,.1f}{ratio:>10}"
+        )
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the Weather Go/No-Go engine")
+    parser.add_argument(
+        '--sizes',
+        default=",".join(str(n) for n in DEFAULT_SIZES),
+        help='Comma-separated series lengths in hours'
+    )
+    parser.add_argument('--min-time', type=float, default=0.2, help='Seconds per timing repeat')
+    parser.add_argument('--save-baseline', help='Write results to this baseline JSON')
+    parser.add_argument('--compare', help='Baseline JSON to compare against')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.2,
+        help='Allowed relative slowdown / memory growth before flagging (default 0.2)'
+    )
+    args = parser.parse_args()
+
+    sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+    results = run_benchmarks(sizes, args.min_time)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get("results", {})
+
+    print_table(results, baseline)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.machine(),
+                "results": results,
+            }, f, indent=2)
+        print(f"\nBaseline saved to: {args.save_baseline}")
+
+    if args.compare:
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nREGRESSIONS ({len(regressions)}):")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%} of baseline")
+
+
+if __name__ == "__main__":
+    main()
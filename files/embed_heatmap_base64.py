@@ -1,43 +1,65 @@
 # -*- coding: utf-8 -*-
-"""Embed heatmap PNG as Base64 in HTML img src (files/ only). Single HTML portable."""
+"""Embed heatmap PNG as Base64 in HTML img src (files/ only). Single HTML portable.
+
+Embedded images keep their source and render hash as attributes
+(data-embed-src / data-embed-hash), so a later run replaces the data URI when
+the heatmap was re-rendered. The hash comes from WEATHER_DASHBOARD's render
+manifest when present, else from the PNG bytes; the PNG is only encoded when
+some HTML still has the plain reference or an older hash.
+"""
 import base64
-import os
+import hashlib
+import json
+import re
 from pathlib import Path
 
 FILES_DIR = Path(__file__).resolve().parent
 
-# 1) files/out/weather_4day_heatmap.png
-png_out = FILES_DIR / "out" / "weather_4day_heatmap.png"
-if png_out.is_file():
-    with open(png_out, "rb") as f:
-        b64 = base64.standard_b64encode(f.read()).decode("ascii")
-    data_uri = "data:image/png;base64," + b64
+
+def embed_key(png_path):
+    manifest = png_path.with_name(png_path.name + ".manifest.json")
+    try:
+        with open(manifest, "r", encoding="utf-8") as f:
+            return json.load(f)["hash"][:16]
+    except (OSError, ValueError, KeyError, TypeError):
+        with open(png_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def embed_png(png_path, src_ref, label):
+    ref = re.escape(src_ref)
+    pattern = re.compile(
+        'src="' + ref + '"'
+        + '|src="data:image/png;base64,[^"]*" data-embed-src="' + ref + '" data-embed-hash="([^"]*)"'
+    )
+    key = embed_key(png_path)
+    pending = []
     for path in sorted(FILES_DIR.glob("AGI TR SCHEDULE_*.html")):
         with open(path, "r", encoding="utf-8") as f:
             html = f.read()
-        if 'src="out/weather_4day_heatmap.png"' in html:
-            html = html.replace(
-                'src="out/weather_4day_heatmap.png"', 'src="' + data_uri + '"'
-            )
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(html)
-            print("Updated (out/heatmap)", path.name)
+        if any(m.group(1) != key for m in pattern.finditer(html)):
+            pending.append((path, html))
+    if not pending:
+        print("Skipped (" + label + "): no HTML needs " + src_ref + " embedded")
+        return
+    with open(png_path, "rb") as f:
+        b64 = base64.standard_b64encode(f.read()).decode("ascii")
+    attrs = 'src="data:image/png;base64,' + b64 + '" data-embed-src="' + src_ref + '" data-embed-hash="' + key + '"'
+    for path, html in pending:
+        html = pattern.sub(lambda m: attrs, html)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+        print("Updated (" + label + ")", path.name)
+
+
+# 1) files/out/weather_4day_heatmap.png
+png_out = FILES_DIR / "out" / "weather_4day_heatmap.png"
+if png_out.is_file():
+    embed_png(png_out, "out/weather_4day_heatmap.png", "out/heatmap")
 else:
     print("Skipped: files/out/weather_4day_heatmap.png not found")
 
 # 2) files/weather_4day_heatmap_dashboard.png
 png_dash = FILES_DIR / "weather_4day_heatmap_dashboard.png"
 if png_dash.is_file():
-    with open(png_dash, "rb") as f:
-        b64_2 = base64.standard_b64encode(f.read()).decode("ascii")
-    data_uri_2 = "data:image/png;base64," + b64_2
-    for path in sorted(FILES_DIR.glob("AGI TR SCHEDULE_*.html")):
-        with open(path, "r", encoding="utf-8") as f:
-            html = f.read()
-        if 'src="weather_4day_heatmap_dashboard.png"' in html:
-            html = html.replace(
-                'src="weather_4day_heatmap_dashboard.png"', 'src="' + data_uri_2 + '"'
-            )
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(html)
-            print("Updated (dashboard)", path.name)
+    embed_png(png_dash, "weather_4day_heatmap_dashboard.png", "dashboard")
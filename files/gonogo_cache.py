@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for Weather Go/No-Go results (Pipeline Step 4)
+
+Entries are keyed by a SHA-256 of the forecast payload, GoNoGoLimits and
+use_gate_b, and hold the GoNoGoResult. The HTML block is not cached: it
+carries the evaluation time, so callers re-render it on every run.
+The cache directory is size-bounded; least recently used entries are evicted.
+"""
+
+from dataclasses import asdict
+from typing import Optional
+import hashlib
+import json
+import os
+
+from weather_go_nogo import GateResult, GoNoGoLimits, GoNoGoResult
+
+# Bump when evaluation or the stored result schema changes so stale entries are
+# not served (HTML is rendered per run, so rendering changes need no bump)
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "out", "gonogo_cache"
+)
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+
+
+def cache_key(payload: bytes, limits: GoNoGoLimits, use_gate_b: bool) -> str:
+    """SHA-256 over forecast payload bytes, limits and Gate-B flag"""
+    h = hashlib.sha256()
+    h.update(f"v{CACHE_VERSION}\n".encode())
+    h.update(json.dumps(asdict(limits), sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    h.update(b"\ngate_b=1\n" if use_gate_b else b"\ngate_b=0\n")
+    h.update(payload)
+    return h.hexdigest()
+
+
+def _result_from_dict(data: dict) -> GoNoGoResult:
+    return GoNoGoResult(
+        decision=data["decision"],
+        reason_codes=data["reason_codes"],
+        gate_a=GateResult(**data["gate_a"]),
+        gate_b=GateResult(**data["gate_b"]) if data["gate_b"] else None,
+        gate_c=GateResult(**data["gate_c"]),
+        rationale=data["rationale"],
+        recommendations=data["recommendations"]
+    )
+
+
+class GoNoGoResultCache:
+    """On-disk Go/No-Go result cache with size-bounded LRU eviction"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[GoNoGoResult]:
+        """Return the result for key, or None on miss"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            result = _result_from_dict(entry["result"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        os.utime(path)  # Mark as recently used
+        return result
+
+    def put(self, key: str, result: GoNoGoResult) -> None:
+        """Store result, then evict down to max_bytes"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"result": asdict(result)}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove least recently used entries until under max_bytes; returns count removed"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
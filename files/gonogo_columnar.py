@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Columnar binary forecast format for Weather Go/No-Go (Pipeline Step 4)
+
+Layout (little endian):
+    header  32 bytes  magic "GNGCOL1\\0", version u32, reserved u32, n_hours u64, padding
+    int32[n]          epoch_hour (hours since 1970-01-01T00:00Z)
+    float32[n]        wave_ft
+    float32[n]        wind_kt
+    float32[n]        wave_period_s (NaN where not provided)
+
+Columns are memory-mapped read-only, so loading does not parse timestamps or
+build per-hour objects. Gate arithmetic promotes the float32 columns to float64.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+import os
+import struct
+
+import numpy as np
+
+from weather_go_nogo import (
+    ForecastArrays,
+    GoNoGoLimits,
+    GoNoGoResult,
+    evaluate_go_nogo_arrays,
+    load_forecast_arrays
+)
+
+COLUMNAR_MAGIC = b"GNGCOL1\0"
+COLUMNAR_VERSION = 1
+COLUMNAR_SUFFIX = ".gngc"
+_HEADER = struct.Struct("<8sIIQ8x")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class ColumnarForecast:
+    """Memory-mapped hourly forecast columns"""
+    epoch_hour: np.ndarray  # int32 (n,)
+    wave_ft: np.ndarray  # float32 (n,)
+    wind_kt: np.ndarray  # float32 (n,)
+    wave_period_s: np.ndarray  # float32 (n,)
+
+    def __len__(self) -> int:
+        return len(self.epoch_hour)
+
+    def timestamps(self) -> List[datetime]:
+        """Hourly timestamps as UTC datetimes (materialised on demand)"""
+        return [_EPOCH + timedelta(hours=int(h)) for h in self.epoch_hour]
+
+
+def write_forecast_columnar(path: str, forecast: ForecastArrays) -> None:
+    """Write forecast columns to the columnar binary format"""
+    epoch_hour = np.empty(len(forecast.timestamps), dtype='<i4')
+    for i, ts in enumerate(forecast.timestamps):
+        if ts.tzinfo is None:
+            raise ValueError(f"Timestamp without timezone: {ts.isoformat()}")
+        hours, rest = divmod(int((ts - _EPOCH).total_seconds()), 3600)
+        if rest:
+            raise ValueError(f"Timestamp not on the hour: {ts.isoformat()}")
+        epoch_hour[i] = hours
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(COLUMNAR_MAGIC, COLUMNAR_VERSION, 0, len(epoch_hour)))
+        f.write(epoch_hour.tobytes())
+        for column in (forecast.wave_ft, forecast.wind_kt, forecast.wave_period_s):
+            f.write(np.asarray(column, dtype='<f4').tobytes())
+    os.replace(tmp_path, path)
+
+
+def convert_json_to_columnar(weather_json_path: str, columnar_path: Optional[str] = None) -> str:
+    """Convert a forecast JSON file to the columnar format; returns output path"""
+    if columnar_path is None:
+        columnar_path = os.path.splitext(weather_json_path)[0] + COLUMNAR_SUFFIX
+    write_forecast_columnar(columnar_path, load_forecast_arrays(weather_json_path))
+    return columnar_path
+
+
+def load_forecast_columnar(path: str) -> ColumnarForecast:
+    """Memory-map the columns of a columnar forecast file (zero-copy, read-only)"""
+    with open(path, 'rb') as f:
+        header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError(f"{path}: truncated columnar header")
+    magic, version, _, n = _HEADER.unpack(header)
+    if magic != COLUMNAR_MAGIC:
+        raise ValueError(f"{path}: not a Go/No-Go columnar forecast")
+    if version != COLUMNAR_VERSION:
+        raise ValueError(f"{path}: unsupported columnar version {version}")
+    if os.path.getsize(path) < _HEADER.size + 16 * n:
+        raise ValueError(f"{path}: truncated columnar data")
+    if n == 0:
+        empty = np.zeros(0, dtype='<f4')
+        return ColumnarForecast(np.zeros(0, dtype='<i4'), empty, empty, empty)
+
+    def column(index: int, dtype: str) -> np.ndarray:
+        return np.memmap(path, dtype=dtype, mode='r', offset=_HEADER.size + 4 * n * index, shape=(n,))
+
+    return ColumnarForecast(
+        epoch_hour=column(0, '<i4'),
+        wave_ft=column(1, '<f4'),
+        wind_kt=column(2, '<f4'),
+        wave_period_s=column(3, '<f4')
+    )
+
+
+def run_gonogo_from_columnar(
+    columnar_path: str,
+    limits: Optional[GoNoGoLimits] = None,
+    use_gate_b: bool = True
+) -> GoNoGoResult:
+    """Run Go/No-Go evaluation from a columnar forecast file"""
+    if limits is None:
+        limits = GoNoGoLimits()
+    forecast = load_forecast_columnar(columnar_path)
+    return evaluate_go_nogo_arrays(forecast.wave_ft, forecast.wind_kt, limits, use_gate_b)
+
+
+def main():
+    """
+    Convert forecast JSON to the columnar format
+
+    Usage:
+        python gonogo_columnar.py weather_forecast.json [-o weather_forecast.gngc] [--evaluate]
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Convert weather forecast JSON to the Go/No-Go columnar format"
+    )
+    parser.add_argument('json', help='Path to weather forecast JSON file')
+    parser.add_argument('-o', '--output', help=f'Output path (default: <json>{COLUMNAR_SUFFIX})')
+    parser.add_argument(
+        '--evaluate',
+        action='store_true',
+        help='Run Go/No-Go with default limits on the converted file'
+    )
+    args = parser.parse_args()
+
+    if not os.path.exists(args.json):
+        print(f"Error: JSON file not found: {args.json}")
+        return
+
+    out_path = convert_json_to_columnar(args.json, args.output)
+    forecast = load_forecast_columnar(out_path)
+    print(f"Wrote {len(forecast)} hours -> {out_path} ({os.path.getsize(out_path)} bytes)")
+
+    if args.evaluate:
+        result = run_gonogo_from_columnar(out_path)
+        print(f"Decision: {result.decision}")
+        print(f"Rationale: {result.rationale}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Per-activity Weather Go/No-Go over the voyage calendar (Pipeline Step 4)
+
+Joins the hourly gate masks of a forecast with the SEA TRANSIT activities of
+option_c.json (entities.activities, plan.start_ts/end_ts). Activity windows
+are located with a sorted search over the hourly timestamps and judged from
+prefix sums, so every activity is checked without rescanning the series.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+from datetime import datetime
+import json
+import math
+import os
+
+import numpy as np
+
+from weather_go_nogo import (
+    REASON_CODE_BITS,
+    GateMasks,
+    GoNoGoLimits,
+    compute_gate_masks,
+    decode_reason_bits,
+    load_forecast_arrays
+)
+
+# Activity titles that mark a sea passage (cf. SAIL_AWAY in lib/ssot/utils/schedule-mapper.ts)
+SEA_TRANSIT_KEYWORDS = ("sail", "marine transportation")
+
+
+@dataclass
+class SeaTransitActivity:
+    """SEA TRANSIT activity window from option_c.json"""
+    activity_id: str
+    title: str
+    start: datetime
+    end: datetime
+
+
+@dataclass
+class ActivityGoNoGo:
+    """Go/No-Go decision for one SEA TRANSIT activity"""
+    activity_id: str
+    title: str
+    start: datetime
+    end: datetime
+    decision: str  # "GO" | "NO-GO" | "CONDITIONAL" | "NO-DATA"
+    forecast_hours: int  # Forecast hours inside the activity window
+    go_hours: int  # Hours passing every evaluated gate
+    fully_covered: bool  # Forecast spans the whole activity window
+    first_departure: Optional[datetime]  # Earliest departure with a full Gate-C window
+    reason_codes: List[str]
+
+
+def load_sea_transit_activities(
+    option_c_path: str,
+    keywords: Sequence[str] = SEA_TRANSIT_KEYWORDS
+) -> List[SeaTransitActivity]:
+    """Load SEA TRANSIT activities (title matches keywords) sorted by plan start"""
+    with open(option_c_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    activities = (data.get('entities') or {}).get('activities')
+    if activities is None:
+        raise ValueError(f"{option_c_path} has no entities.activities (contract v0.8.0 expected)")
+    if isinstance(activities, dict):
+        activities = list(activities.values())
+
+    result = []
+    for act in activities:
+        title = act.get('title') or ""
+        plan = act.get('plan') or {}
+        if not plan.get('start_ts') or not plan.get('end_ts'):
+            continue
+        if not any(k in title.lower() for k in keywords):
+            continue
+        result.append(SeaTransitActivity(
+            activity_id=act.get('activity_id', ""),
+            title=title,
+            start=datetime.fromisoformat(plan['start_ts'].replace('Z', '+00:00')),
+            end=datetime.fromisoformat(plan['end_ts'].replace('Z', '+00:00'))
+        ))
+    result.sort(key=lambda a: a.start)
+    return result
+
+
+def _prefix(counts: np.ndarray) -> np.ndarray:
+    """Prefix sums with a leading zero row along axis 0"""
+    out = np.zeros((counts.shape[0] + 1,) + counts.shape[1:], dtype=np.int64)
+    np.cumsum(counts, axis=0, out=out[1:])
+    return out
+
+
+def evaluate_activities(
+    timestamps: Sequence[datetime],
+    masks: GateMasks,
+    activities: Sequence[SeaTransitActivity],
+    limits: GoNoGoLimits
+) -> List[ActivityGoNoGo]:
+    """
+    Judge each activity window against the hourly gate masks
+
+    An activity is GO if a full SailingTime_hr + Reserve_hr window of GO hours
+    starts and ends inside it, CONDITIONAL if that holds but some of its hours
+    are near limits, NO-GO otherwise and NO-DATA without forecast hours.
+
+    Args:
+        timestamps: Sorted hourly timestamps aligned with masks
+        masks: Per-hour gate masks (compute_gate_masks)
+        activities: SEA TRANSIT activities
+        limits: Operational limits
+    """
+    n = len(timestamps)
+    need = max(int(math.ceil(limits.SailingTime_hr + limits.Reserve_hr)), 1)
+    hour_s = np.array([t.timestamp() for t in timestamps], dtype=float)
+
+    go = masks.go
+    go_cs = _prefix(go.astype(np.int64))
+    marginal_cs = _prefix(masks.marginal.astype(np.int64))
+    bit_values = np.array(list(REASON_CODE_BITS.values()), dtype=np.uint8)
+    bits_cs = _prefix(((masks.reason_bits[:, None] & bit_values) != 0).astype(np.int64))
+
+    # Departure at hour i is feasible if hours i .. i+need-1 are all GO
+    feasible = np.zeros(n, dtype=bool)
+    if n >= need:
+        feasible[:n - need + 1] = (go_cs[need:] - go_cs[:-need]) == need
+    feasible_cs = _prefix(feasible.astype(np.int64))
+
+    act_start = np.array([a.start.timestamp() for a in activities], dtype=float)
+    act_end = np.array([a.end.timestamp() for a in activities], dtype=float)
+    lo = np.searchsorted(hour_s, act_start, side='left')
+    # Hours in [start, end): the hour starting at act_end is outside the activity
+    hi = np.searchsorted(hour_s, act_end, side='left')
+    # Last departure whose window still ends inside the activity
+    dep_hi = np.maximum(hi - need + 1, lo)
+
+    forecast_hours = hi - lo
+    go_hours = go_cs[hi] - go_cs[lo]
+    has_window = (feasible_cs[dep_hi] - feasible_cs[lo]) > 0
+    has_marginal = (marginal_cs[hi] - marginal_cs[lo]) > 0
+    bit_present = (bits_cs[hi] - bits_cs[lo]) > 0
+    fully_covered = (
+        (act_start >= hour_s[0]) & (act_end <= hour_s[-1] + 3600.0)  # Last bucket covers its hour
+        if n else np.zeros(len(activities), dtype=bool)
+    )
+
+    results = []
+    for k, act in enumerate(activities):
+        if forecast_hours[k] == 0:
+            decision = "NO-DATA"
+        elif not has_window[k]:
+            decision = "NO-GO"
+        elif has_marginal[k]:
+            decision = "CONDITIONAL"
+        else:
+            decision = "GO"
+
+        first_departure = None
+        if has_window[k]:
+            first_departure = timestamps[int(lo[k] + np.argmax(feasible[lo[k]:dep_hi[k]]))]
+
+        reason_bits = int(np.bitwise_or.reduce(bit_values[bit_present[k]]))
+        reason_codes = decode_reason_bits(reason_bits)
+        if decision == "NO-GO":
+            reason_codes.append("WX_WINDOW_INSUFFICIENT")
+
+        results.append(ActivityGoNoGo(
+            activity_id=act.activity_id,
+            title=act.title,
+            start=act.start,
+            end=act.end,
+            decision=decision,
+            forecast_hours=int(forecast_hours[k]),
+            go_hours=int(go_hours[k]),
+            fully_covered=bool(fully_covered[k]),
+            first_departure=first_departure,
+            reason_codes=reason_codes
+        ))
+    return results
+
+
+def run_gonogo_for_schedule(
+    weather_json_path: str,
+    option_c_path: str,
+    limits: Optional[GoNoGoLimits] = None,
+    use_gate_b: bool = True
+) -> List[ActivityGoNoGo]:
+    """Evaluate every SEA TRANSIT activity of option_c.json against a forecast JSON"""
+    if limits is None:
+        limits = GoNoGoLimits()
+
+    forecast = load_forecast_arrays(weather_json_path)
+    order = sorted(range(len(forecast.timestamps)), key=forecast.timestamps.__getitem__)
+    timestamps = [forecast.timestamps[i] for i in order]
+    masks = compute_gate_masks(
+        forecast.wave_ft[order], forecast.wind_kt[order], limits, use_gate_b
+    )
+    activities = load_sea_transit_activities(option_c_path)
+    return evaluate_activities(timestamps, masks, activities, limits)
+
+
+def main():
+    """
+    Command-line interface for per-activity Go/No-Go
+
+    Usage:
+        python gonogo_schedule.py --json weather_forecast.json --option-c ../data/schedule/option_c_v0.8.0.json
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="SEA TRANSIT Weather Go/No-Go per schedule activity"
+    )
+    parser.add_argument('--json', required=True, help='Path to weather forecast JSON file')
+    parser.add_argument('--option-c', required=True, help='Path to option_c.json (contract v0.8.0)')
+    parser.add_argument('--hs-limit', type=float, default=3.0, help='Max significant wave height (m)')
+    parser.add_argument('--wind-limit', type=float, default=25.0, help='Max wind speed (kt)')
+    parser.add_argument('--sailing-time', type=float, default=8.0, help='Expected sailing time (hr)')
+    parser.add_argument('--reserve', type=float, default=4.0, help='Reserve time (hr)')
+    parser.add_argument('--no-gate-b', action='store_true', help='Disable Gate-B squall buffer')
+    parser.add_argument(
+        '--with-data-only',
+        action='store_true',
+        help='Only list activities that have forecast hours'
+    )
+
+    args = parser.parse_args()
+
+    for path in (args.json, args.option_c):
+        if not os.path.exists(path):
+            print(f"Error: file not found: {path}")
+            return
+
+    limits = GoNoGoLimits(
+        Hs_limit_m=args.hs_limit,
+        Wind_limit_kt=args.wind_limit,
+        SailingTime_hr=args.sailing_time,
+        Reserve_hr=args.reserve
+    )
+    results = run_gonogo_for_schedule(args.json, args.option_c, limits, not args.no_gate_b)
+
+    print("\n" + "="*60)
+    print("SEA TRANSIT GO/NO-GO PER ACTIVITY")
+    print("="*60)
+    for r in results:
+        if args.with_data_only and r.decision == "NO-DATA":
+            continue
+        departure = f" | first departure {r.first_departure:%Y-%m-%d %H:%M}" if r.first_departure else ""
+        coverage = "" if r.fully_covered or r.decision == "NO-DATA" else " | partial forecast"
+        print(f"{r.activity_id:<8} {r.start:%Y-%m-%d} {r.decision:<11} "
+              f"{r.go_hours}/{r.forecast_hours}h GO{departure}{coverage}")
+        print(f"         {r.title}")
+        if r.reason_codes:
+            print(f"         Reason Codes: {', '.join(r.reason_codes)}")
+    print("\n" + "="*60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ Integrates weather-go-nogo evaluation into AGI TR SCHEDULE HTML.
 Part of the full pipeline: shift(1) → daily-update(2) → pipeline-check(3) → weather-go-nogo(4)
 """
 
+import json
 import os
 import sys
 from datetime import datetime
@@ -22,6 +23,7 @@ from weather_go_nogo import (
     GoNoGoLimits,
     GoNoGoResult
 )
+from gonogo_cache import DEFAULT_CACHE_DIR, GoNoGoResultCache, cache_key
 
 
 def find_latest_schedule_html(files_dir: str = ".") -> str:
@@ -88,7 +90,9 @@ def run_pipeline_step4(
     weather_source: str = "sample",
     limits: GoNoGoLimits = None,
     use_gate_b: bool = True,
-    output_dir: str = "."
+    output_dir: str = ".",
+    use_cache: bool = True,
+    cache_dir: str = DEFAULT_CACHE_DIR
 ) -> tuple[GoNoGoResult, str]:
     """
     Execute pipeline step 4: Weather Go/No-Go evaluation and HTML integration
@@ -98,6 +102,8 @@ def run_pipeline_step4(
         limits: Operational limits (uses defaults if None)
         use_gate_b: Whether to apply Gate-B squall buffer
         output_dir: Output directory for updated HTML
+        use_cache: Reuse cached result/HTML when forecast and limits are unchanged
+        cache_dir: Directory of the content-addressed result cache
     
     Returns:
         Tuple of (GoNoGoResult, output_html_path)
@@ -120,29 +126,51 @@ def run_pipeline_step4(
             Hmax_allow_m=5.5
         )
     
+    weather_json = weather_source
+    manual_series = None
     if weather_source == "sample":
         weather_json = os.path.join(output_dir, "weather_forecast_sample.json")
         if not os.path.exists(weather_json):
             print(f"Warning: Sample file not found at {weather_json}")
             print("Creating sample data...")
             # Use manual data as fallback
-            result = run_gonogo_manual(
-                wave_ft_series=[6.5, 7.0, 7.2, 6.8, 6.5, 6.2, 6.0, 5.8, 5.5, 5.2, 5.0, 4.8],
-                wind_kt_series=[18, 20, 22, 21, 19, 18, 17, 16, 15, 14, 13, 12],
-                limits=limits,
-                use_gate_b=use_gate_b
-            )
+            manual_series = {
+                "wave_ft_series": [6.5, 7.0, 7.2, 6.8, 6.5, 6.2, 6.0, 5.8, 5.5, 5.2, 5.0, 4.8],
+                "wind_kt_series": [18, 20, 22, 21, 19, 18, 17, 16, 15, 14, 13, 12],
+            }
+    
+    cache = GoNoGoResultCache(cache_dir) if use_cache else None
+    cached = None
+    if cache is not None:
+        if manual_series is not None:
+            payload = json.dumps(manual_series, sort_keys=True).encode("utf-8")
         else:
-            result = run_gonogo_from_json(weather_json, limits, use_gate_b)
+            with open(weather_json, 'rb') as f:
+                payload = f.read()
+        key = cache_key(payload, limits, use_gate_b)
+        cached = cache.get(key)
+    
+    if cached is not None:
+        result = cached
+        print(f"   Cache hit ({key[:12]}): forecast and limits unchanged")
+    elif manual_series is not None:
+        result = run_gonogo_manual(
+            limits=limits,
+            use_gate_b=use_gate_b,
+            **manual_series
+        )
     else:
-        result = run_gonogo_from_json(weather_source, limits, use_gate_b)
+        result = run_gonogo_from_json(weather_json, limits, use_gate_b)
     
     print(f"   Decision: {result.decision}")
     print(f"   Rationale: {result.rationale}")
     
     # Step 2: Generate HTML block
     print("\n[2/3] Generating HTML block...")
+    # Rendered every run so "Last Evaluated" reflects this run, not the cached one
     gonogo_html = format_html_output(result, limits)
+    if cache is not None and cached is None:
+        cache.put(key, result)
     print(f"   Generated {len(gonogo_html)} characters of HTML")
     
     # Step 3: Insert into latest AGI TR SCHEDULE
@@ -219,6 +247,11 @@ def main():
         default='.',
         help='Output directory (default: current directory)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always re-evaluate and re-render (skip the Go/No-Go result cache)'
+    )
     
     args = parser.parse_args()
     
@@ -233,7 +266,8 @@ def main():
         weather_source=args.weather,
         limits=limits,
         use_gate_b=not args.no_gate_b,
-        output_dir=args.output_dir
+        output_dir=args.output_dir,
+        use_cache=not args.no_cache
     )
     
     print("\nSummary:")
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the per-activity Go/No-Go calendar (evaluate_activities).
+
+Run from files/: python -m pytest -q test_gonogo_schedule.py
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from gonogo_schedule import SeaTransitActivity, evaluate_activities
+from weather_go_nogo import GoNoGoLimits, compute_gate_masks
+
+BASE = datetime(2026, 1, 1)
+# SailingTime + Reserve = 6 h window
+LIMITS = GoNoGoLimits(SailingTime_hr=4.0, Reserve_hr=2.0)
+ACTIVITY = SeaTransitActivity(
+    activity_id="A1",
+    title="Marine transportation",
+    start=BASE + timedelta(hours=6),
+    end=BASE + timedelta(hours=12),
+)
+
+
+def _evaluate(rough_hours):
+    wave_ft = np.full(24, 2.0)
+    wind_kt = np.full(24, 10.0)
+    wave_ft[rough_hours] = 20.0
+    wind_kt[rough_hours] = 40.0
+    timestamps = [BASE + timedelta(hours=i) for i in range(24)]
+    masks = compute_gate_masks(wave_ft, wind_kt, LIMITS)
+    return evaluate_activities(timestamps, masks, [ACTIVITY], LIMITS)[0]
+
+
+def test_hour_at_activity_end_is_outside():
+    # 12:00 starts at act_end, so its NO-GO hour must not count
+    result = _evaluate([12])
+    assert result.decision == "GO"
+    assert result.forecast_hours == 6
+    assert result.first_departure == BASE + timedelta(hours=6)
+    assert result.reason_codes == []
+
+
+def test_departure_window_cannot_use_hour_at_activity_end():
+    # 06:00 is NO-GO; the only other 6 h window (07:00-12:00) needs the 12:00 hour
+    result = _evaluate([6])
+    assert result.decision == "NO-GO"
+    assert result.first_departure is None
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Regression tests for IncrementalGoNoGo against the batch evaluate_go_nogo.
+
+Run from files/: python -m pytest -q test_weather_go_nogo.py
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+import numpy as np
+import pytest
+
+from weather_go_nogo import (
+    GoNoGoLimits,
+    GoNoGoResult,
+    IncrementalGoNoGo,
+    WeatherInput,
+    evaluate_go_nogo,
+)
+
+BASE = datetime(2026, 1, 1)
+
+
+def _hour(i: int, wave_ft: float = 2.0, wind_kt: float = 10.0) -> WeatherInput:
+    return WeatherInput(wave_ft=wave_ft, wind_kt=wind_kt, timestamp=BASE + timedelta(hours=i))
+
+
+def _normalized(result: GoNoGoResult) -> tuple:
+    """Result fields with reason codes as sets (the batch engine does not fix their order)"""
+    gates = tuple(
+        None if g is None else (g.passed, frozenset(g.reason_codes), g.details)
+        for g in (result.gate_a, result.gate_b, result.gate_c)
+    )
+    return (result.decision, frozenset(result.reason_codes), gates, result.rationale, result.recommendations)
+
+
+def _assert_matches_batch(evaluator: IncrementalGoNoGo, series: Dict[datetime, WeatherInput]) -> None:
+    ordered: List[WeatherInput] = [series[ts] for ts in sorted(series)]
+    expected = evaluate_go_nogo(ordered, evaluator.limits)
+    assert _normalized(evaluator.result()) == _normalized(expected)
+
+
+def test_rejected_insert_leaves_state_untouched():
+    evaluator = IncrementalGoNoGo(GoNoGoLimits())
+    series = {w.timestamp: w for w in (_hour(i) for i in range(24))}
+    evaluator.update(list(series.values()))
+    assert evaluator.result().decision == "GO"
+
+    rough = _hour(5, wave_ft=20.0, wind_kt=40.0)
+    between = WeatherInput(wave_ft=2.0, wind_kt=10.0, timestamp=BASE + timedelta(hours=7, minutes=30))
+    with pytest.raises(ValueError):
+        evaluator.update([rough, between])
+    _assert_matches_batch(evaluator, series)
+
+    assert evaluator.update([rough]) is True
+    series[rough.timestamp] = rough
+    _assert_matches_batch(evaluator, series)
+    assert evaluator.result().decision != "GO"
+
+
+def test_mixed_replace_and_append_match_batch():
+    rng = np.random.default_rng(7)
+    evaluator = IncrementalGoNoGo(GoNoGoLimits())
+    series: Dict[datetime, WeatherInput] = {}
+    for _ in range(40):
+        n = len(series)
+        replaced = rng.choice(n, size=min(n, int(rng.integers(0, 6))), replace=False)
+        appended = np.arange(n, n + int(rng.integers(0, 8)))
+        batch = [
+            _hour(int(i), float(rng.uniform(1, 14)), float(rng.uniform(5, 35)))
+            for i in np.concatenate([replaced, appended])
+        ]
+        if series and rng.random() < 0.3:
+            # Rejected batch must not leak partial writes; the retry without
+            # the bad record must then apply in full
+            last = max(series)
+            bad = WeatherInput(wave_ft=3.0, wind_kt=12.0, timestamp=last - timedelta(minutes=30))
+            with pytest.raises(ValueError):
+                evaluator.update(batch + [bad])
+            _assert_matches_batch(evaluator, series)
+        evaluator.update(batch)
+        series.update((w.timestamp, w) for w in batch)
+        _assert_matches_batch(evaluator, series)
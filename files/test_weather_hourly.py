@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the hourly dataset -> Go/No-Go bridge (.gngc export).
+
+Run from files/: python -m pytest -q test_weather_hourly.py
+"""
+
+import numpy as np
+
+from gonogo_columnar import run_gonogo_from_columnar
+from weather_hourly import HourlyWeather, daily_from_hourly, write_gonogo_forecast
+
+# 2026-01-01 00:00 local (UTC+4) as an epoch hour
+EPOCH_HOUR0 = 20454 * 24 - 4
+
+
+def _calm_hours(n: int = 24) -> HourlyWeather:
+    return HourlyWeather(
+        epoch_hour=np.arange(EPOCH_HOUR0, EPOCH_HOUR0 + n, dtype=np.int64),
+        wind_kn=np.full(n, 10.0),
+        gust_kn=np.full(n, 14.0),
+        wdir_deg=np.full(n, 200.0),
+        vis_km=np.full(n, 10.0),
+        wave_m=np.full(n, 0.5),
+        wave_period_s=np.full(n, 5.0),
+        source=np.ones(n, dtype=np.uint8),
+        utc_offset_s=4 * 3600,
+    )
+
+
+def test_calm_day_is_go(tmp_path):
+    path = write_gonogo_forecast(_calm_hours(), str(tmp_path / "calm.gngc"))
+    assert run_gonogo_from_columnar(path).decision == "GO"
+
+
+def test_data_gap_is_not_filled_for_gates(tmp_path):
+    # 8 missing hours leave two 8 h windows, short of SailingTime + Reserve (12 h)
+    hourly = _calm_hours()
+    hourly.wind_kn[8:16] = np.nan
+    hourly.wave_m[8:16] = np.nan
+
+    result = run_gonogo_from_columnar(write_gonogo_forecast(hourly, str(tmp_path / "gap.gngc")))
+    assert result.decision == "NO-GO"
+    assert "WX_WINDOW_INSUFFICIENT" in result.reason_codes
+
+    # The heatmap still gap-fills and tags the day
+    daily = daily_from_hourly(hourly)
+    assert daily["coverage"][0] == "INTERPOLATED"
+    assert daily["filled_hours"][0] == 8
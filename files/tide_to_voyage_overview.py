@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 """
 WATER TIDE.csv 기반: 주간(6:00~17:00) 최고 물때 상위 3시간대를 Voyage Overview tide-table에 연동.
+--output-json 에는 Voyage 기간의 일별 고조 창(기준 조위 이상 연속 시간대)도 함께 기록 (load-out/load-in 계획용),
+시간별 조위를 cubic 보간한 분 단위 곡선과 기준 조위 통과 시각도 포함 (linkspan 10~15분 창).
 files/ 전용. 실행: files/ 폴더에서 python tide_to_voyage_overview.py [--dry-run] [--output-json PATH]
+    [--threshold M] [--window-hours 6-17] [--curve-step MIN]
 """
 from __future__ import annotations
 
@@ -9,21 +12,56 @@ import csv
 import json
 import re
 import sys
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime
 from pathlib import Path
 
+import numpy as np
+
 FILES_DIR = Path(__file__).resolve().parent
 TIDE_CSV = FILES_DIR / "WATER TIDE.csv"
 SCHEDULE_GLOB = "AGI TR SCHEDULE_*.html"
 DEFAULT_OUTPUT_JSON = FILES_DIR / "out" / "tide_voyage.json"
 
-# 6:00 ~ 17:00 컬럼명 (CSV 헤더와 일치)
+# 0:00 ~ 23:00 전체 컬럼명 (CSV 헤더와 일치) -> TideTable.heights 열 순서
+ALL_HOUR_COLS = [f"{h}:00" for h in range(24)]
+# 6:00 ~ 17:00 컬럼명 (Voyage Overview 주간 물때)
 HOUR_COLS = [f"{h}:00" for h in range(6, 18)]
+HOUR_IDX = np.array([ALL_HOUR_COLS.index(c) for c in HOUR_COLS], dtype=np.intp)
+
+# 고조 창 (load-out/load-in): 기준 조위 (m) 이상인 연속 시간대, 검색 시각 범위 (연속, 0~23)
+TIDE_WINDOW_THRESHOLD_M = 1.5
+TIDE_WINDOW_HOURS = range(0, 24)
+# 보간 곡선 간격 (분, 60의 약수). JSON 곡선은 cm 정수로 기록
+TIDE_CURVE_STEP_MIN = 15
+
+
+@dataclass(frozen=True)
+class TideTable:
+    """날짜 인덱스 조위표. dates: datetime64[D] 오름차순 (n,), heights: 조위 m (n, 24)."""
+
+    dates: np.ndarray
+    heights: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def index_range(self, start: date, end: date) -> tuple[int, int]:
+        """[start, end] 구간 행 인덱스 [lo, hi). searchsorted 2회 (행 스캔 없음)."""
+        lo = np.searchsorted(self.dates, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(self.dates, np.datetime64(end, "D"), side="right")
+        return int(lo), int(max(lo, hi))
+
+    def day_range(self, start: date, end: date) -> np.ndarray:
+        """[start, end] 구간 행 (days, 24) view."""
+        lo, hi = self.index_range(start, end)
+        return self.heights[lo:hi]
 
 
-def parse_tide_csv(path: Path) -> list[tuple[str, dict[str, float]]]:
-    """Parse WATER TIDE.csv -> [(date_str, {hour: height_m}), ...]."""
-    rows: list[tuple[str, dict[str, float]]] = []
+def parse_tide_csv(path: Path) -> TideTable:
+    """Parse WATER TIDE.csv -> TideTable (날짜 × 24시간). 빈 값/오류 값은 0.0, 날짜 오류 행은 제외."""
+    dates: list[date] = []
+    rows: list[list[float]] = []
     with open(path, "r", encoding="utf-8-sig") as f:
         reader = csv.DictReader(f)
         header = [h.strip() for h in (reader.fieldnames or [])]
@@ -33,15 +71,35 @@ def parse_tide_csv(path: Path) -> list[tuple[str, dict[str, float]]]:
             date_str = (row.get(date_key) or row.get("날짜") or "").strip()
             if not date_str or not date_str[0].isdigit():
                 continue
-            heights: dict[str, float] = {}
-            for col in HOUR_COLS:
+            try:
+                d = datetime.strptime(date_str, "%Y-%m-%d").date()
+            except ValueError:
+                continue
+            heights: list[float] = []
+            for col in ALL_HOUR_COLS:
                 val = (row.get(col) or "").strip().replace(" ", "")
                 try:
-                    heights[col] = float(val) if val else 0.0
+                    heights.append(float(val) if val else 0.0)
                 except ValueError:
-                    heights[col] = 0.0
-            rows.append((date_str, heights))
-    return rows
+                    heights.append(0.0)
+            dates.append(d)
+            rows.append(heights)
+    day_arr = np.array(dates, dtype="datetime64[D]")
+    height_arr = np.array(rows, dtype=np.float64).reshape(len(rows), len(ALL_HOUR_COLS))
+    order = np.argsort(day_arr, kind="stable")
+    return TideTable(dates=day_arr[order], heights=height_arr[order])
+
+
+def top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """values 상위 k개 인덱스 (큰 값 순). 동률은 앞 인덱스 우선 (stable sort 와 동일 결과)."""
+    k = min(k, len(values))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    kth = values[np.argpartition(values, len(values) - k)[len(values) - k]]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[: k - len(above)]
+    idx = np.concatenate([above, ties])
+    return idx[np.lexsort((idx, -values[idx]))]
 
 
 def voyage_cards_from_html(html_path: Path) -> list[tuple[int, str, str]]:
@@ -59,31 +117,215 @@ def voyage_cards_from_html(html_path: Path) -> list[tuple[int, str, str]]:
 
 
 def top3_tide_for_range(
-    tide_rows: list[tuple[str, dict[str, float]]], start: str, end: str
+    table: TideTable, start: str, end: str, k: int = 3
 ) -> list[tuple[str, float]]:
-    """For dates in [start, end], compute max height per hour (6~17), return top 3 (time, height)."""
+    """For dates in [start, end], compute max height per hour (6~17), return top k (time, height)."""
     try:
-        d_start = datetime.strptime(start, "%Y-%m-%d")
-        d_end = datetime.strptime(end, "%Y-%m-%d")
+        d_start = datetime.strptime(start, "%Y-%m-%d").date()
+        d_end = datetime.strptime(end, "%Y-%m-%d").date()
     except ValueError:
         return []
 
-    hour_max: dict[str, float] = {h: 0.0 for h in HOUR_COLS}
-    for date_str, heights in tide_rows:
-        try:
-            d = datetime.strptime(date_str.strip(), "%Y-%m-%d")
-        except ValueError:
-            continue
-        if d_start <= d <= d_end:
-            for h in HOUR_COLS:
-                hour_max[h] = max(hour_max.get(h, 0), heights.get(h, 0))
+    # 구간에 데이터가 없으면 0.0 (기존 dict 초기값과 동일), 음수 조위도 0.0 하한
+    hour_max = np.zeros(len(HOUR_COLS))
+    window = table.day_range(d_start, d_end)
+    if len(window):
+        np.maximum(window[:, HOUR_IDX].max(axis=0), 0.0, out=hour_max)
+    return [(HOUR_COLS[i], round(float(hour_max[i]), 2)) for i in top_k_indices(hour_max, k)]
+
+
+@dataclass(frozen=True)
+class TideWindows:
+    """TideTable 전체의 일별 고조 창. 일별 배열은 table.dates 순서 (n,).
+
+    창(run)은 CSR 형태: day i 의 창은 run_start/run_end[run_ptr[i]:run_ptr[i + 1]] (시각, end 는 exclusive).
+    각 시간 컬럼은 1시간 슬롯으로 본다 (hours_above = 기준 이상 슬롯 수).
+    """
 
-    sorted_hours = sorted(
-        [(t, hour_max[t]) for t in HOUR_COLS],
-        key=lambda x: -x[1],
+    threshold_m: float
+    hours: np.ndarray
+    hours_above: np.ndarray
+    earliest: np.ndarray
+    longest: np.ndarray
+    peak_hour: np.ndarray
+    peak_m: np.ndarray
+    run_ptr: np.ndarray
+    run_start: np.ndarray
+    run_end: np.ndarray
+
+
+def tide_windows(
+    table: TideTable,
+    threshold_m: float = TIDE_WINDOW_THRESHOLD_M,
+    hours: range = TIDE_WINDOW_HOURS,
+) -> TideWindows:
+    """전체 조위표에 대해 기준 이상 시간 수, 최초 가능 시각 (-1 = 없음), 연속 창을 한 번에 계산."""
+    hrs = np.asarray(hours, dtype=np.intp)
+    if hrs.size == 0 or np.any(np.diff(hrs) != 1) or hrs[0] < 0 or hrs[-1] >= len(ALL_HOUR_COLS):
+        raise ValueError(f"window hours must be a contiguous range within 0~23: {hours!r}")
+    h = table.heights[:, hrs]
+    above = h >= threshold_m
+    n, m = above.shape
+    hours_above = above.sum(axis=1)
+    earliest = np.where(hours_above > 0, hrs[above.argmax(axis=1)], -1)
+    peak_idx = h.argmax(axis=1)
+
+    # 0 패딩 후 diff: +1 = 창 시작, -1 = 창 종료 (row-major nonzero 라 시작/종료 순서가 짝지어짐)
+    padded = np.zeros((n, m + 2), dtype=np.int8)
+    padded[:, 1:-1] = above
+    edges = np.diff(padded, axis=1)
+    run_row, start_col = np.nonzero(edges == 1)
+    _, end_col = np.nonzero(edges == -1)
+    run_len = end_col - start_col
+    run_ptr = np.zeros(n + 1, dtype=np.intp)
+    np.cumsum(np.bincount(run_row, minlength=n), out=run_ptr[1:])
+    longest = np.zeros(n, dtype=np.intp)
+    np.maximum.at(longest, run_row, run_len)
+
+    return TideWindows(
+        threshold_m=float(threshold_m),
+        hours=hrs,
+        hours_above=hours_above,
+        earliest=earliest,
+        longest=longest,
+        peak_hour=hrs[peak_idx],
+        peak_m=h[np.arange(n), peak_idx],
+        run_ptr=run_ptr,
+        run_start=hrs[start_col],
+        run_end=hrs[end_col - 1] + 1,
     )
-    top3 = sorted_hours[:3]
-    return [(t, round(h, 2)) for t, h in top3]
+
+
+def _hour_label(hour: int) -> str:
+    return f"{hour}:00"
+
+
+def high_water_days(table: TideTable, windows: TideWindows, start: str, end: str) -> list[dict]:
+    """[start, end] 구간 일별 고조 창 (JSON 용). 날짜 오류 시 []."""
+    try:
+        d_start = datetime.strptime(start, "%Y-%m-%d").date()
+        d_end = datetime.strptime(end, "%Y-%m-%d").date()
+    except ValueError:
+        return []
+    lo, hi = table.index_range(d_start, d_end)
+    days: list[dict] = []
+    for i in range(lo, hi):
+        earliest = int(windows.earliest[i])
+        r0, r1 = windows.run_ptr[i], windows.run_ptr[i + 1]
+        days.append(
+            {
+                "date": str(table.dates[i]),
+                "hoursAbove": int(windows.hours_above[i]),
+                "longestHours": int(windows.longest[i]),
+                "earliest": _hour_label(earliest) if earliest >= 0 else None,
+                "peak": {
+                    "time": _hour_label(int(windows.peak_hour[i])),
+                    "height": round(float(windows.peak_m[i]), 2),
+                },
+                "windows": [
+                    {"start": _hour_label(int(a)), "end": _hour_label(int(b)), "hours": int(b - a)}
+                    for a, b in zip(windows.run_start[r0:r1], windows.run_end[r0:r1])
+                ],
+            }
+        )
+    return days
+
+
+@dataclass(frozen=True)
+class TideCurve:
+    """등간격 조위 곡선. heights[i] = start + i * step_min 분 시점 조위 (m), 자료 없는 날은 NaN."""
+
+    start: np.datetime64
+    step_min: int
+    heights: np.ndarray
+
+    def index_range(self, start: date, end: date) -> tuple[int, int]:
+        """[start 00:00, end+1일 00:00) 구간 샘플 인덱스 [lo, hi). step 이 60의 약수라 자정은 항상 샘플 위치."""
+        step = np.timedelta64(self.step_min, "m")
+        lo = (np.datetime64(start, "m") - self.start) // step
+        hi = (np.datetime64(end, "D") + np.timedelta64(1, "D") - self.start) // step
+        n = len(self.heights)
+        lo, hi = min(max(int(lo), 0), n), min(max(int(hi), 0), n)
+        return lo, max(lo, hi)
+
+    def time_at(self, index: np.ndarray | float) -> np.ndarray:
+        """샘플 인덱스 (소수 허용) -> datetime64[m] (분 단위 반올림)."""
+        minutes = np.rint(np.asarray(index, dtype=np.float64) * self.step_min).astype(np.int64)
+        return self.start + minutes.astype("timedelta64[m]")
+
+
+def interpolate_tide(table: TideTable, step_min: int = TIDE_CURVE_STEP_MIN) -> TideCurve:
+    """시간별 조위표 -> step_min 분 간격 곡선 (cubic Hermite / Catmull-Rom, 한 번의 broadcast 계산).
+
+    날짜 사이 공백은 NaN 으로 채워 보간하지 않으며, 원래 정시 값은 그대로 유지된다.
+    """
+    if step_min <= 0 or 60 % step_min:
+        raise ValueError(f"curve step must divide 60 minutes: {step_min!r}")
+    if not len(table):
+        return TideCurve(np.datetime64("NaT", "m"), step_min, np.empty(0))
+    steps = 60 // step_min
+    n_days = int((table.dates[-1] - table.dates[0]) // np.timedelta64(1, "D")) + 1
+    hourly = np.full((n_days, len(ALL_HOUR_COLS)), np.nan)
+    hourly[(table.dates - table.dates[0]).astype(np.int64)] = table.heights
+    y = hourly.ravel()
+
+    # 접선: 양쪽 이웃이 있으면 중앙 차분, 한쪽만 있으면 단측 차분 (시간당 m)
+    fwd = np.diff(y, append=np.nan)
+    bwd = np.diff(y, prepend=np.nan)
+    slope = np.where(np.isnan(fwd), bwd, np.where(np.isnan(bwd), fwd, 0.5 * (fwd + bwd)))
+
+    u = np.arange(steps) / steps
+    u2, u3 = u * u, u * u * u
+    curve = (
+        y[:-1, None] * (2 * u3 - 3 * u2 + 1)
+        + slope[:-1, None] * (u3 - 2 * u2 + u)
+        + y[1:, None] * (3 * u2 - 2 * u3)
+        + slope[1:, None] * (u3 - u2)
+    )
+    curve[:, 0] = y[:-1]
+    return TideCurve(
+        start=np.datetime64(table.dates[0], "m"),
+        step_min=step_min,
+        heights=np.append(curve.ravel(), y[-1]),
+    )
+
+
+def threshold_crossings(curve: TideCurve, threshold_m: float) -> tuple[np.ndarray, np.ndarray]:
+    """곡선이 기준 조위를 지나는 지점 -> (샘플 인덱스 (소수), +1 상승 / -1 하강). 샘플 사이는 선형."""
+    h = curve.heights
+    if len(h) < 2:
+        return np.empty(0), np.empty(0, dtype=np.int8)
+    above = h >= threshold_m
+    valid = ~(np.isnan(h[:-1]) | np.isnan(h[1:]))
+    idx = np.flatnonzero((above[:-1] != above[1:]) & valid)
+    h0, h1 = h[idx], h[idx + 1]
+    pos = idx + (threshold_m - h0) / (h1 - h0)
+    return pos, np.where(above[idx + 1], 1, -1).astype(np.int8)
+
+
+def curve_json(
+    curve: TideCurve, crossings: tuple[np.ndarray, np.ndarray], start: str, end: str
+) -> tuple[dict | None, list[dict]]:
+    """[start, end] 구간 곡선 ({start, stepMin, heightsCm}) 과 통과 시각 목록 (JSON 용)."""
+    try:
+        d_start = datetime.strptime(start, "%Y-%m-%d").date()
+        d_end = datetime.strptime(end, "%Y-%m-%d").date()
+    except ValueError:
+        return None, []
+    lo, hi = curve.index_range(d_start, d_end)
+    if lo >= hi:
+        return None, []
+    cm = np.rint(curve.heights[lo:hi] * 100.0)
+    heights_cm = [None if np.isnan(v) else int(v) for v in cm]
+    pos, direction = crossings
+    c0, c1 = np.searchsorted(pos, [lo, hi])
+    times = curve.time_at(pos[c0:c1])
+    events = [
+        {"time": str(t), "direction": "rise" if d > 0 else "fall"}
+        for t, d in zip(times, direction[c0:c1])
+    ]
+    curve_out = {"start": str(curve.time_at(lo)), "stepMin": curve.step_min, "heightsCm": heights_cm}
+    return curve_out, events
 
 
 def replace_tide_table_in_html(
@@ -121,6 +363,32 @@ def replace_tide_table_in_html(
     return changed
 
 
+def _arg_value(name: str) -> str | None:
+    """--name VALUE 또는 --name=VALUE 값 (없으면 None)."""
+    for i, arg in enumerate(sys.argv):
+        if arg == name and i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+        if arg.startswith(name + "="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+def _parse_curve_step_arg() -> int:
+    spec = _arg_value("--curve-step")
+    return int(spec) if spec else TIDE_CURVE_STEP_MIN
+
+
+def _parse_window_args() -> tuple[float, range]:
+    """--threshold M, --window-hours H1-H2 (양 끝 포함, 예: 6-17)."""
+    threshold = _arg_value("--threshold")
+    spec = _arg_value("--window-hours")
+    hours = TIDE_WINDOW_HOURS
+    if spec:
+        first, _, last = spec.partition("-")
+        hours = range(int(first), int(last or first) + 1)
+    return (float(threshold) if threshold else TIDE_WINDOW_THRESHOLD_M), hours
+
+
 def _parse_output_json_arg() -> Path | None:
     for i, arg in enumerate(sys.argv):
         if arg == "--output-json":
@@ -135,16 +403,30 @@ def _parse_output_json_arg() -> Path | None:
 def main() -> None:
     dry_run = "--dry-run" in sys.argv
     output_json_path = _parse_output_json_arg()
+    try:
+        threshold_m, window_hours = _parse_window_args()
+        curve_step = _parse_curve_step_arg()
+    except ValueError as e:
+        print(f"ERROR: invalid --threshold/--window-hours/--curve-step: {e}")
+        return
 
     if not TIDE_CSV.is_file():
         print(f"SKIP: {TIDE_CSV.name} not found")
         return
 
-    tide_rows = parse_tide_csv(TIDE_CSV)
-    if not tide_rows:
+    tide_table = parse_tide_csv(TIDE_CSV)
+    if not len(tide_table):
         print("SKIP: no tide rows parsed")
         return
+    try:
+        windows = tide_windows(tide_table, threshold_m, window_hours)
+        curve = interpolate_tide(tide_table, curve_step)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        return
 
+    # 같은 기간이 여러 schedule HTML 에 반복되므로 (start, end) 단위로 재사용
+    range_top3: dict[tuple[str, str], list[tuple[str, float]]] = {}
     last_voyage_top3: list[tuple[int, str, str, list[tuple[str, float]]]] | None = None
 
     for html_path in sorted(FILES_DIR.glob(SCHEDULE_GLOB)):
@@ -155,13 +437,18 @@ def main() -> None:
         voyage_top3: list[tuple[int, list[tuple[str, float]]]] = []
         voyage_top3_with_dates: list[tuple[int, str, str, list[tuple[str, float]]]] = []
         for v_num, start, end in cards:
-            top3 = top3_tide_for_range(tide_rows, start, end)
+            top3 = range_top3.get((start, end))
+            if top3 is None:
+                top3 = range_top3[(start, end)] = top3_tide_for_range(tide_table, start, end)
             if not top3:
                 top3 = [(HOUR_COLS[i], 0.0) for i in range(3)]
             voyage_top3.append((v_num, top3))
             voyage_top3_with_dates.append((v_num, start, end, top3))
             if dry_run:
                 print(f"Voyage {v_num} [{start} ~ {end}]: {top3}")
+                hw = high_water_days(tide_table, windows, start, end)
+                ok_days = sum(1 for d in hw if d["hoursAbove"])
+                print(f"  high water >= {threshold_m}m: {ok_days}/{len(hw)} days")
 
         last_voyage_top3 = voyage_top3_with_dates
 
@@ -172,16 +459,28 @@ def main() -> None:
             print(f"Updated tide tables: {html_path.name}")
 
     if output_json_path is not None and last_voyage_top3 is not None:
-        out_data = {
-            "voyages": [
+        crossings = threshold_crossings(curve, windows.threshold_m)
+        voyages_out = []
+        for v_num, start, end, rows in last_voyage_top3:
+            tide_curve, events = curve_json(curve, crossings, start, end)
+            voyages_out.append(
                 {
                     "voyage": v_num,
                     "dataStart": start,
                     "dataEnd": end,
                     "top3": [{"time": t, "height": h} for t, h in rows],
+                    "highWater": high_water_days(tide_table, windows, start, end),
+                    "crossings": events,
+                    "tideCurve": tide_curve,
                 }
-                for v_num, start, end, rows in last_voyage_top3
-            ]
+            )
+        out_data = {
+            "voyages": voyages_out,
+            "highWaterWindow": {
+                "thresholdM": windows.threshold_m,
+                "fromHour": _hour_label(int(windows.hours[0])),
+                "toHour": _hour_label(int(windows.hours[-1])),
+            },
         }
         output_json_path.parent.mkdir(parents=True, exist_ok=True)
         output_json_path.write_text(
@@ -10,11 +10,16 @@ Evaluates marine weather conditions using 3-Gate logic:
 Part of integrated pipeline: shift(1) → daily-update(2) → pipeline-check(3) → weather-go-nogo(4)
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import json
+import math
 import os
+import string
+
+import numpy as np
 
 
 @dataclass
@@ -38,6 +43,14 @@ class GoNoGoLimits:
     Hmax_allow_m: float = 5.5  # Max allowed peak wave height (meters)
 
 
+@dataclass
+class ForecastErrorModel:
+    """Gaussian forecast error model for Monte-Carlo Go/No-Go"""
+    wave_sigma_ft: Union[float, np.ndarray] = 1.0  # Wave error std (feet), scalar or per-hour spread
+    wind_sigma_kt: Union[float, np.ndarray] = 3.0  # Wind error std (knots), scalar or per-hour spread
+    shared_fraction: float = 0.5  # Share of error variance that is a per-realisation bias
+
+
 @dataclass
 class GateResult:
     """Result from a single gate evaluation"""
@@ -58,6 +71,24 @@ class GoNoGoResult:
     recommendations: List[str]
 
 
+# Reason-code bits for the array engine (one bit per per-hour Gate-A/Gate-B code)
+REASON_CODE_BITS = {
+    "WX_WAVE": 1 << 0,
+    "WX_WIND": 1 << 1,
+    "WX_WAVE_SQUALL": 1 << 2,
+    "WX_WIND_GUST": 1 << 3,
+    "WX_HMAX": 1 << 4,
+}
+GATE_A_BITS = REASON_CODE_BITS["WX_WAVE"] | REASON_CODE_BITS["WX_WIND"]
+GATE_B_BITS = (
+    REASON_CODE_BITS["WX_WAVE_SQUALL"]
+    | REASON_CODE_BITS["WX_WIND_GUST"]
+    | REASON_CODE_BITS["WX_HMAX"]
+)
+
+MARGINAL_RATIO = 0.85  # Share of a Gate-A limit above which conditions are marginal
+
+
 def ft_to_m(feet: float) -> float:
     """Convert feet to meters"""
     return feet * 0.3048
@@ -194,6 +225,43 @@ def evaluate_gate_c(
     )
 
 
+def is_marginal(weather: WeatherInput, limits: GoNoGoLimits) -> bool:
+    """True if wave or wind is above 85% of its Gate-A limit"""
+    return (
+        ft_to_m(weather.wave_ft) > limits.Hs_limit_m * MARGINAL_RATIO
+        or weather.wind_kt > limits.Wind_limit_kt * MARGINAL_RATIO
+    )
+
+
+def _decide(
+    gate_c_result: GateResult,
+    marginal_conditions: bool
+) -> Tuple[str, str, List[str]]:
+    """Map Gate-C outcome and marginal flag to (decision, rationale, recommendations)"""
+    if gate_c_result.passed:
+        decision = "GO"
+        rationale = f"All gates passed. {gate_c_result.details}"
+        recommendations = [
+            "Monitor weather continuously during transit",
+            "Prepare contingency plans if conditions deteriorate",
+            "Confirm latest forecast before departure"
+        ]
+    else:
+        decision = "NO-GO"
+        rationale = f"Gate-C failed. {gate_c_result.details}"
+        recommendations = [
+            "Wait for weather window to improve",
+            "Monitor 2-day hourly forecasts for next opportunity",
+            "Consider alternative timing or route if available"
+        ]
+    
+    if decision == "GO" and marginal_conditions:
+        decision = "CONDITIONAL"
+        recommendations.insert(0, "Weather is near operational limits - proceed with caution")
+    
+    return decision, rationale, recommendations
+
+
 def evaluate_go_nogo(
     weather_series: List[WeatherInput],
     limits: GoNoGoLimits,
@@ -232,38 +300,12 @@ def evaluate_go_nogo(
             all_reason_codes.update(result.reason_codes)
     all_reason_codes.update(gate_c_result.reason_codes)
     
-    # Determine final decision
-    if gate_c_result.passed:
-        decision = "GO"
-        rationale = f"All gates passed. {gate_c_result.details}"
-        recommendations = [
-            "Monitor weather continuously during transit",
-            "Prepare contingency plans if conditions deteriorate",
-            "Confirm latest forecast before departure"
-        ]
-    else:
-        decision = "NO-GO"
-        rationale = f"Gate-C failed. {gate_c_result.details}"
-        recommendations = [
-            "Wait for weather window to improve",
-            "Monitor 2-day hourly forecasts for next opportunity",
-            "Consider alternative timing or route if available"
-        ]
-    
     # Check for marginal conditions (CONDITIONAL)
-    marginal_conditions = False
-    for gate_a in gate_a_results:
-        if gate_a.passed:
-            # Check if close to limits
-            for weather in weather_series:
-                Hs_m = ft_to_m(weather.wave_ft)
-                if Hs_m > limits.Hs_limit_m * 0.85 or weather.wind_kt > limits.Wind_limit_kt * 0.85:
-                    marginal_conditions = True
-                    break
+    marginal_conditions = any(r.passed for r in gate_a_results) and any(
+        is_marginal(w, limits) for w in weather_series
+    )
     
-    if decision == "GO" and marginal_conditions:
-        decision = "CONDITIONAL"
-        recommendations.insert(0, "Weather is near operational limits - proceed with caution")
+    decision, rationale, recommendations = _decide(gate_c_result, marginal_conditions)
     
     return GoNoGoResult(
         decision=decision,
@@ -284,27 +326,601 @@ def evaluate_go_nogo(
     )
 
 
-def format_html_output(result: GoNoGoResult, limits: GoNoGoLimits) -> str:
+@dataclass
+class GateMasks:
+    """Per-hour Gate-A/Gate-B outcome of the array engine"""
+    gate_a_pass: np.ndarray  # bool (..., n)
+    gate_b_pass: Optional[np.ndarray]  # bool (..., n), None if Gate-B not used
+    reason_bits: np.ndarray  # uint8 (..., n), OR of REASON_CODE_BITS
+    marginal: np.ndarray  # bool (..., n), above MARGINAL_RATIO of a Gate-A limit
+
+    @property
+    def go(self) -> np.ndarray:
+        """Hours passing every evaluated gate"""
+        if self.gate_b_pass is None:
+            return self.gate_a_pass
+        return self.gate_a_pass & self.gate_b_pass
+
+
+def decode_reason_bits(bits: int) -> List[str]:
+    """Expand a reason-code bitmask into reason code strings"""
+    return [code for code, bit in REASON_CODE_BITS.items() if bits & bit]
+
+
+def true_runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Run-length encode True stretches of a 1-D bool mask -> (starts, lengths)"""
+    padded = np.concatenate(([False], np.asarray(mask, dtype=bool), [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    starts = edges[0::2]
+    return starts, edges[1::2] - starts
+
+
+def _gate_masks(
+    wave_ft: np.ndarray,
+    wind_kt: np.ndarray,
+    lim: Dict[str, Union[float, np.ndarray]],
+    use_gate_b: bool
+) -> GateMasks:
     """
-    Format Go/No-Go result as HTML block for AGI TR SCHEDULE
-    Following DASHBOARD_OUTPUT_SCHEMA.md format
+    Gate-A/Gate-B thresholds of evaluate_gate_a/evaluate_gate_b, vectorised
+    
+    lim maps GoNoGoLimits field names to scalars or arrays that broadcast
+    against the hour axis (e.g. one row per limit profile).
     """
-    # Color coding
-    color_map = {
-        "GO": "#10b981",  # Green
-        "NO-GO": "#ef4444",  # Red
-        "CONDITIONAL": "#eab308"  # Yellow
-    }
-    bg_color_map = {
-        "GO": "rgba(16, 185, 129, 0.1)",
-        "NO-GO": "rgba(239, 68, 68, 0.1)",
-        "CONDITIONAL": "rgba(234, 179, 8, 0.1)"
+    Hs_m = wave_ft * 0.3048
+    shape = np.broadcast_shapes(Hs_m.shape, *(np.shape(v) for v in lim.values()))
+    bits = np.zeros(shape, dtype=np.uint8)
+    
+    wave_ok = np.broadcast_to(Hs_m <= lim["Hs_limit_m"], shape)
+    wind_ok = np.broadcast_to(wind_kt <= lim["Wind_limit_kt"], shape)
+    bits[~wave_ok] |= REASON_CODE_BITS["WX_WAVE"]
+    bits[~wind_ok] |= REASON_CODE_BITS["WX_WIND"]
+    gate_a_pass = wave_ok & wind_ok
+    
+    gate_b_pass = None
+    if use_gate_b:
+        Hs_eff = Hs_m + lim["ΔHs_squall_m"]
+        squall_ok = np.broadcast_to(Hs_eff <= lim["Hs_limit_m"], shape)
+        gust_ok = np.broadcast_to((wind_kt + lim["ΔGust_kt"]) <= lim["Wind_limit_kt"], shape)
+        hmax_ok = np.broadcast_to(1.86 * Hs_eff <= lim["Hmax_allow_m"], shape)
+        bits[~squall_ok] |= REASON_CODE_BITS["WX_WAVE_SQUALL"]
+        bits[~gust_ok] |= REASON_CODE_BITS["WX_WIND_GUST"]
+        bits[~hmax_ok] |= REASON_CODE_BITS["WX_HMAX"]
+        gate_b_pass = squall_ok & gust_ok & hmax_ok
+    
+    marginal = np.broadcast_to(
+        (Hs_m > lim["Hs_limit_m"] * MARGINAL_RATIO)
+        | (wind_kt > lim["Wind_limit_kt"] * MARGINAL_RATIO),
+        shape
+    )
+    
+    return GateMasks(
+        gate_a_pass=gate_a_pass,
+        gate_b_pass=gate_b_pass,
+        reason_bits=bits,
+        marginal=marginal
+    )
+
+
+def _as_columns(wave_ft, wind_kt) -> Tuple[np.ndarray, np.ndarray]:
+    """Coerce wave/wind inputs to float arrays of equal shape"""
+    wave_ft = np.asarray(wave_ft, dtype=float)
+    wind_kt = np.asarray(wind_kt, dtype=float)
+    if wave_ft.shape != wind_kt.shape:
+        raise ValueError("wave_ft and wind_kt must have same shape")
+    return wave_ft, wind_kt
+
+
+def compute_gate_masks(
+    wave_ft: np.ndarray,
+    wind_kt: np.ndarray,
+    limits: GoNoGoLimits,
+    use_gate_b: bool = True
+) -> GateMasks:
+    """
+    Evaluate Gate-A (and Gate-B) for every hour at once
+    
+    Same thresholds as evaluate_gate_a/evaluate_gate_b, applied column-wise.
+    """
+    wave_ft, wind_kt = _as_columns(wave_ft, wind_kt)
+    return _gate_masks(wave_ft, wind_kt, asdict(limits), use_gate_b)
+
+
+def compute_gate_masks_batch(
+    wave_ft: np.ndarray,
+    wind_kt: np.ndarray,
+    profiles: List[GoNoGoLimits],
+    use_gate_b: bool = True
+) -> List[GateMasks]:
+    """
+    Evaluate Gate-A/Gate-B for several limit profiles in one pass
+    
+    Profile thresholds are stacked into (profiles, 1) columns and broadcast
+    over the hour axis; one GateMasks row view is returned per profile.
+    """
+    wave_ft, wind_kt = _as_columns(wave_ft, wind_kt)
+    lim = {
+        f.name: np.array([getattr(p, f.name) for p in profiles], dtype=float)[:, None]
+        for f in fields(GoNoGoLimits)
     }
+    stacked = _gate_masks(wave_ft, wind_kt, lim, use_gate_b)
+    return [
+        GateMasks(
+            gate_a_pass=stacked.gate_a_pass[i],
+            gate_b_pass=stacked.gate_b_pass[i] if use_gate_b else None,
+            reason_bits=stacked.reason_bits[i],
+            marginal=stacked.marginal[i]
+        )
+        for i in range(len(profiles))
+    ]
+
+
+def _result_from_summary(
+    n: int,
+    a_passed: int,
+    b_passed: Optional[int],
+    all_bits: int,
+    gate_c_bits: int,
+    max_continuous: int,
+    marginal_conditions: bool,
+    limits: GoNoGoLimits
+) -> GoNoGoResult:
+    """Build the GoNoGoResult from per-series gate counts and reason bits"""
+    required_window_hr = limits.SailingTime_hr + limits.Reserve_hr
+    
+    gate_c_codes = decode_reason_bits(gate_c_bits)
+    gate_c_passed = max_continuous >= required_window_hr
+    if gate_c_passed:
+        details = f"Continuous window of {max_continuous:.1f}hr ≥ required {required_window_hr:.1f}hr"
+    else:
+        details = f"Max continuous window {max_continuous:.1f}hr < required {required_window_hr:.1f}hr"
+        gate_c_codes.append("WX_WINDOW_INSUFFICIENT")
+    gate_c_result = GateResult(passed=gate_c_passed, reason_codes=gate_c_codes, details=details)
+    
+    decision, rationale, recommendations = _decide(gate_c_result, marginal_conditions)
+    
+    gate_b = None
+    if b_passed is not None:
+        gate_b = GateResult(
+            passed=b_passed == n if n else None,
+            reason_codes=decode_reason_bits(all_bits & GATE_B_BITS),
+            details=f"{b_passed}/{n} time points passed" if n else "Not evaluated"
+        )
+    
+    return GoNoGoResult(
+        decision=decision,
+        reason_codes=decode_reason_bits(all_bits) + [
+            c for c in gate_c_codes if c not in REASON_CODE_BITS
+        ],
+        gate_a=GateResult(
+            passed=a_passed == n,
+            reason_codes=decode_reason_bits(all_bits & GATE_A_BITS),
+            details=f"{a_passed}/{n} time points passed"
+        ),
+        gate_b=gate_b,
+        gate_c=gate_c_result,
+        rationale=rationale,
+        recommendations=recommendations
+    )
+
+
+def result_from_masks(masks: GateMasks, limits: GoNoGoLimits) -> GoNoGoResult:
+    """Aggregate per-hour gate masks into the final GoNoGoResult"""
+    go = masks.go
+    _, run_lengths = true_runs(go)
+    
+    return _result_from_summary(
+        n=len(masks.gate_a_pass),
+        a_passed=int(masks.gate_a_pass.sum()),
+        b_passed=int(masks.gate_b_pass.sum()) if masks.gate_b_pass is not None else None,
+        all_bits=int(np.bitwise_or.reduce(masks.reason_bits)),
+        # Gate-C: Gate-B codes of the hours that break the window
+        gate_c_bits=int(np.bitwise_or.reduce(masks.reason_bits[~go])) & GATE_B_BITS,
+        max_continuous=int(run_lengths.max()) if run_lengths.size else 0,
+        marginal_conditions=bool(masks.gate_a_pass.any() and masks.marginal.any()),
+        limits=limits
+    )
+
+
+def evaluate_go_nogo_arrays(
+    wave_ft: np.ndarray,
+    wind_kt: np.ndarray,
+    limits: GoNoGoLimits,
+    use_gate_b: bool = True
+) -> GoNoGoResult:
+    """
+    Array-backed 3-Gate Go/No-Go evaluation
+    
+    Equivalent to evaluate_go_nogo but takes hourly wave/wind columns instead
+    of WeatherInput objects; gates are evaluated in one vectorised pass.
+    
+    Args:
+        wave_ft: Hourly wave heights in feet
+        wind_kt: Hourly wind speeds in knots
+        limits: Operational limits
+        use_gate_b: Whether to apply Gate-B squall buffer logic
+    
+    Returns:
+        GoNoGoResult with final decision
+    """
+    masks = compute_gate_masks(wave_ft, wind_kt, limits, use_gate_b)
+    return result_from_masks(masks, limits)
+
+
+def evaluate_limit_profiles(
+    wave_ft: np.ndarray,
+    wind_kt: np.ndarray,
+    profiles: List[GoNoGoLimits],
+    use_gate_b: bool = True
+) -> List[GoNoGoResult]:
+    """
+    Evaluate one forecast against several limit profiles
+    
+    Args:
+        wave_ft: Hourly wave heights in feet
+        wind_kt: Hourly wind speeds in knots
+        profiles: Limit profiles (barges, conservative Hs, relaxed buffers, ...)
+        use_gate_b: Whether to apply Gate-B squall buffer logic
+    
+    Returns:
+        One GoNoGoResult per profile, in profile order
+    """
+    masks = compute_gate_masks_batch(wave_ft, wind_kt, profiles, use_gate_b)
+    return [result_from_masks(m, limits) for m, limits in zip(masks, profiles)]
+
+
+@dataclass
+class MonteCarloResult:
+    """Probabilistic Go/No-Go over perturbed forecast realisations"""
+    n_samples: int
+    p_hour_go: np.ndarray  # (n,) P(hour passes every evaluated gate)
+    p_departure: np.ndarray  # (n,) P(departure at hour has a full Gate-C window)
+    p_gate_c: float  # P(at least one feasible departure in the horizon)
+
+
+def evaluate_go_nogo_monte_carlo(
+    wave_ft: np.ndarray,
+    wind_kt: np.ndarray,
+    limits: GoNoGoLimits,
+    error_model: Optional[ForecastErrorModel] = None,
+    n_samples: int = 1000,
+    use_gate_b: bool = True,
+    seed: Optional[int] = None,
+    chunk_size: int = 2048
+) -> MonteCarloResult:
+    """
+    Monte-Carlo Go/No-Go: P(GO) per departure hour
+    
+    Draws n_samples perturbed realisations of the forecast from error_model,
+    applies the Gate-A/Gate-B thresholds on the (samples, hours) grid and
+    checks the SailingTime_hr + Reserve_hr window at every start hour with a
+    cumulative sum. Samples are processed in chunks to bound memory.
+    
+    Args:
+        wave_ft: Hourly wave heights in feet (forecast / ensemble mean)
+        wind_kt: Hourly wind speeds in knots (forecast / ensemble mean)
+        limits: Operational limits
+        error_model: Forecast error model (defaults to ForecastErrorModel())
+        n_samples: Number of realisations
+        use_gate_b: Whether to apply Gate-B squall buffer logic
+        seed: Random seed for reproducible draws
+        chunk_size: Realisations evaluated per vectorised block
+    
+    Returns:
+        MonteCarloResult with per-hour and per-departure probabilities
+    """
+    if error_model is None:
+        error_model = ForecastErrorModel()
+    wave_ft, wind_kt = _as_columns(wave_ft, wind_kt)
+    n = wave_ft.shape[-1]
+    need = max(int(math.ceil(limits.SailingTime_hr + limits.Reserve_hr)), 1)
+    n_starts = max(n - need + 1, 0)
+    
+    rng = np.random.default_rng(seed)
+    lim = asdict(limits)
+    shared = math.sqrt(error_model.shared_fraction)
+    local = math.sqrt(1.0 - error_model.shared_fraction)
+    wave_sigma = np.asarray(error_model.wave_sigma_ft, dtype=float)
+    wind_sigma = np.asarray(error_model.wind_sigma_kt, dtype=float)
+    
+    hour_go = np.zeros(n, dtype=np.int64)
+    departure_ok = np.zeros(n_starts, dtype=np.int64)
+    any_window = 0
+    
+    for done in range(0, n_samples, chunk_size):
+        k = min(chunk_size, n_samples - done)
+        wave_err = shared * rng.standard_normal((k, 1)) + local * rng.standard_normal((k, n))
+        wind_err = shared * rng.standard_normal((k, 1)) + local * rng.standard_normal((k, n))
+        wave_s = np.maximum(wave_ft + wave_sigma * wave_err, 0.0)
+        wind_s = np.maximum(wind_kt + wind_sigma * wind_err, 0.0)
+        
+        go = _gate_masks(wave_s, wind_s, lim, use_gate_b).go
+        hour_go += go.sum(axis=0)
+        
+        if n_starts:
+            c = np.zeros((k, n + 1), dtype=np.int32)
+            np.cumsum(go, axis=1, out=c[:, 1:])
+            window_ok = (c[:, need:] - c[:, :-need]) == need
+            departure_ok += window_ok.sum(axis=0)
+            any_window += int(window_ok.any(axis=1).sum())
+    
+    p_departure = np.zeros(n, dtype=float)
+    p_departure[:n_starts] = departure_ok / max(n_samples, 1)
+    return MonteCarloResult(
+        n_samples=n_samples,
+        p_hour_go=hour_go / max(n_samples, 1),
+        p_departure=p_departure,
+        p_gate_c=any_window / max(n_samples, 1)
+    )
+
+
+@dataclass
+class DepartureWindow:
+    """Feasible departure slot inside a continuous GO run"""
+    start_index: int  # Hour index of departure
+    departure: Optional[datetime]  # Timestamp of departure hour, if known
+    run_end_index: int  # Exclusive end index of the GO run
+    margin_hr: float  # GO hours left beyond SailingTime_hr + Reserve_hr
+
+
+def departure_window_arrays(
+    go: np.ndarray,
+    limits: GoNoGoLimits
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Every departure hour whose GO run covers SailingTime_hr + Reserve_hr
+    
+    Single pass over the run-length encoding of the GO mask.
+    
+    Returns:
+        Tuple of (start_index, run_end_index, margin_hr) arrays
+    """
+    required_window_hr = limits.SailingTime_hr + limits.Reserve_hr
+    need = max(int(math.ceil(required_window_hr)), 1)
+    
+    starts, lengths = true_runs(go)
+    fits = lengths >= need
+    run_starts = starts[fits]
+    run_ends = run_starts + lengths[fits]
+    counts = lengths[fits] - need + 1
+    
+    run_ids = np.repeat(np.arange(len(run_starts)), counts)
+    offsets = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+    start_index = run_starts[run_ids] + offsets
+    run_end_index = run_ends[run_ids]
+    margin_hr = (run_end_index - start_index) - required_window_hr
+    return start_index, run_end_index, margin_hr
+
+
+def find_departure_windows(
+    go: np.ndarray,
+    limits: GoNoGoLimits,
+    timestamps: Optional[List[datetime]] = None
+) -> List[DepartureWindow]:
+    """
+    List every feasible departure slot with its margin
+    
+    Args:
+        go: Hourly GO mask (e.g. GateMasks.go)
+        limits: Operational limits (window = SailingTime_hr + Reserve_hr)
+        timestamps: Optional hourly timestamps aligned with go
+    
+    Returns:
+        DepartureWindow per feasible start hour, in time order
+    """
+    start_index, run_end_index, margin_hr = departure_window_arrays(go, limits)
+    return [
+        DepartureWindow(
+            start_index=int(i),
+            departure=timestamps[i] if timestamps is not None else None,
+            run_end_index=int(e),
+            margin_hr=float(m)
+        )
+        for i, e, m in zip(start_index, run_end_index, margin_hr)
+    ]
+
+
+class _RunTree:
+    """Segment tree over a GO mask tracking the longest run of GO hours"""
+    
+    def __init__(self, go: np.ndarray, capacity: int):
+        size = 1
+        while size < capacity:
+            size *= 2
+        self.size = size
+        self.pre = [0] * (2 * size)  # GO run touching node start
+        self.suf = [0] * (2 * size)  # GO run touching node end
+        self.best = [0] * (2 * size)  # Longest GO run inside node
+        self.span = [0] * (2 * size)
+        for i in range(size):
+            leaf = size + i
+            self.span[leaf] = 1
+            v = 1 if i < len(go) and go[i] else 0
+            self.pre[leaf] = self.suf[leaf] = self.best[leaf] = v
+        for node in range(size - 1, 0, -1):
+            self.span[node] = 2 * self.span[2 * node]
+            self._pull(node)
+    
+    def _pull(self, node: int) -> None:
+        l, r = 2 * node, 2 * node + 1
+        span = self.span[l]
+        self.pre[node] = self.pre[l] if self.pre[l] < span else span + self.pre[r]
+        self.suf[node] = self.suf[r] if self.suf[r] < span else span + self.suf[l]
+        self.best[node] = max(self.best[l], self.best[r], self.suf[l] + self.pre[r])
+    
+    def set(self, i: int, go: bool) -> None:
+        node = self.size + i
+        v = 1 if go else 0
+        self.pre[node] = self.suf[node] = self.best[node] = v
+        node //= 2
+        while node:
+            self._pull(node)
+            node //= 2
+    
+    @property
+    def max_run(self) -> int:
+        return self.best[1]
+
+
+class IncrementalGoNoGo:
+    """
+    Incremental Go/No-Go evaluator for rolling forecast updates
+    
+    Keeps per-hour gate state, reason-code counts and a segment tree of GO
+    run-lengths. Appending or replacing k hourly records costs O(k log n)
+    instead of re-evaluating the whole series; unchanged records are skipped.
+    
+    Usage:
+        evaluator = IncrementalGoNoGo(limits)
+        evaluator.update(load_weather_series("weather_forecast.json"))
+        if evaluator.update(new_hours):
+            html = format_html_output(evaluator.result(), evaluator.limits)
+    """
+    
+    def __init__(self, limits: Optional[GoNoGoLimits] = None, use_gate_b: bool = True):
+        self.limits = limits if limits is not None else GoNoGoLimits()
+        self.use_gate_b = use_gate_b
+        self._lim = asdict(self.limits)
+        self.timestamps: List[datetime] = []
+        self._index: Dict[datetime, int] = {}
+        
+        capacity = 64
+        self._wave = np.full(capacity, np.nan)
+        self._wind = np.full(capacity, np.nan)
+        self._a_pass = np.zeros(capacity, dtype=bool)
+        self._b_pass = np.zeros(capacity, dtype=bool)
+        self._bits = np.zeros(capacity, dtype=np.uint8)
+        self._marginal = np.zeros(capacity, dtype=bool)
+        self._tree = _RunTree(self._a_pass[:0], capacity)
+        
+        self._a_passed = 0
+        self._b_passed = 0
+        self._marginal_count = 0
+        self._bit_counts = {bit: 0 for bit in REASON_CODE_BITS.values()}
     
-    color = color_map.get(result.decision, "#64748b")
-    bg_color = bg_color_map.get(result.decision, "rgba(100, 116, 139, 0.1)")
+    def __len__(self) -> int:
+        return len(self.timestamps)
     
-    html = f"""
+    @property
+    def go(self) -> np.ndarray:
+        """Current hourly GO mask"""
+        n = len(self.timestamps)
+        if not self.use_gate_b:
+            return self._a_pass[:n].copy()
+        return self._a_pass[:n] & self._b_pass[:n]
+    
+    def _grow(self, needed: int) -> None:
+        capacity = len(self._wave)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_wave", "_wind", "_a_pass", "_b_pass", "_bits", "_marginal"):
+            old = getattr(self, name)
+            new = np.full(capacity, np.nan) if old.dtype.kind == 'f' else np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self._tree = _RunTree(self.go, capacity)
+    
+    def _count(self, idx: np.ndarray, sign: int) -> None:
+        self._a_passed += sign * int(self._a_pass[idx].sum())
+        self._b_passed += sign * int(self._b_pass[idx].sum())
+        self._marginal_count += sign * int(self._marginal[idx].sum())
+        for bit in self._bit_counts:
+            self._bit_counts[bit] += sign * int(np.count_nonzero(self._bits[idx] & bit))
+    
+    def _summary(self) -> Tuple:
+        all_bits = 0
+        for bit, count in self._bit_counts.items():
+            if count:
+                all_bits |= bit
+        return (
+            len(self.timestamps),
+            self._a_passed,
+            self._b_passed if self.use_gate_b else None,
+            all_bits,
+            # A Gate-B code marks a Gate-B failure, so every Gate-B code comes
+            # from an hour that breaks the window
+            all_bits & GATE_B_BITS,
+            self._tree.max_run,
+            self._a_passed > 0 and self._marginal_count > 0
+        )
+    
+    def update(self, records: List[WeatherInput]) -> bool:
+        """
+        Append new hours or replace existing ones (matched by timestamp)
+        
+        Records must either match an existing timestamp or come after the
+        last known hour; inserting between known hours is rejected. The
+        update is all-or-nothing: a rejected batch leaves the state untouched.
+        
+        Returns:
+            True if the aggregated Go/No-Go result changed
+        """
+        before = self._summary()
+        
+        latest = {}
+        for w in records:
+            latest[w.timestamp] = w
+        if self.timestamps:
+            last = self.timestamps[-1]
+            for ts in latest:
+                if ts not in self._index and ts < last:
+                    raise ValueError(f"Cannot insert {ts} before last known hour {last}")
+        
+        changed = []
+        for ts in sorted(latest):
+            w = latest[ts]
+            i = self._index.get(ts)
+            if i is None:
+                i = len(self.timestamps)
+                self._grow(i + 1)
+                self.timestamps.append(ts)
+                self._index[ts] = i
+            elif self._wave[i] == w.wave_ft and self._wind[i] == w.wind_kt:
+                continue
+            self._wave[i] = w.wave_ft
+            self._wind[i] = w.wind_kt
+            changed.append(i)
+        
+        if not changed:
+            return False
+        
+        idx = np.array(changed)
+        self._count(idx, -1)
+        masks = _gate_masks(self._wave[idx], self._wind[idx], self._lim, self.use_gate_b)
+        self._a_pass[idx] = masks.gate_a_pass
+        if self.use_gate_b:
+            self._b_pass[idx] = masks.gate_b_pass
+        self._bits[idx] = masks.reason_bits
+        self._marginal[idx] = masks.marginal
+        self._count(idx, +1)
+        
+        if len(changed) * 8 > len(self.timestamps):
+            self._tree = _RunTree(self.go, len(self._wave))
+        else:
+            for i, go in zip(changed, masks.go):
+                self._tree.set(i, bool(go))
+        
+        return self._summary() != before
+    
+    def result(self) -> GoNoGoResult:
+        """Current Go/No-Go decision for the whole series"""
+        n, a_passed, b_passed, all_bits, gate_c_bits, max_run, marginal = self._summary()
+        return _result_from_summary(
+            n=n,
+            a_passed=a_passed,
+            b_passed=b_passed,
+            all_bits=all_bits,
+            gate_c_bits=gate_c_bits,
+            max_continuous=max_run,
+            marginal_conditions=marginal,
+            limits=self.limits
+        )
+
+
+# HTML skeleton for format_html_output, compiled once into literal chunks + fields
+_GONOGO_HEAD_HTML = """
         <div class="weather-gonogo-section" style="
             background: {bg_color};
             border: 2px solid {color};
@@ -337,7 +953,7 @@ def format_html_output(result: GoNoGoResult, limits: GoNoGoLimits) -> str:
                 text-transform: uppercase;
                 letter-spacing: 2px;
             ">
-                {result.decision}
+                {decision}
             </div>
             
             <div style="margin-bottom: 16px;">
@@ -345,7 +961,7 @@ def format_html_output(result: GoNoGoResult, limits: GoNoGoLimits) -> str:
                     Rationale:
                 </div>
                 <div style="color: var(--text-primary); line-height: 1.6;">
-                    {result.rationale}
+                    {rationale}
                 </div>
             </div>
             
@@ -354,41 +970,20 @@ def format_html_output(result: GoNoGoResult, limits: GoNoGoLimits) -> str:
                     Gate Results:
                 </div>
                 <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 12px;">
-                    <div style="background: var(--bg-tertiary); padding: 12px; border-radius: 8px;">
-                        <div style="font-size: 12px; color: var(--text-muted); margin-bottom: 4px;">Gate-A (Basic)</div>
-                        <div style="color: {'#10b981' if result.gate_a.passed else '#ef4444'}; font-weight: 600;">
-                            {'✓ PASS' if result.gate_a.passed else '✗ FAIL'}
-                        </div>
-                        <div style="font-size: 12px; color: var(--text-secondary); margin-top: 4px;">
-                            {result.gate_a.details}
-                        </div>
-                    </div>
 """
-    
-    if result.gate_b:
-        html += f"""
-                    <div style="background: var(--bg-tertiary); padding: 12px; border-radius: 8px;">
-                        <div style="font-size: 12px; color: var(--text-muted); margin-bottom: 4px;">Gate-B (Squall)</div>
-                        <div style="color: {'#10b981' if result.gate_b.passed else '#ef4444'}; font-weight: 600;">
-                            {'✓ PASS' if result.gate_b.passed else '✗ FAIL'}
+
+_GONOGO_GATE_CARD_HTML = """                    <div style="background: var(--bg-tertiary); padding: 12px; border-radius: 8px;">
+                        <div style="font-size: 12px; color: var(--text-muted); margin-bottom: 4px;">{label}</div>
+                        <div style="color: {status_color}; font-weight: 600;">
+                            {status_label}
                         </div>
                         <div style="font-size: 12px; color: var(--text-secondary); margin-top: 4px;">
-                            {result.gate_b.details}
+                            {details}
                         </div>
                     </div>
 """
-    
-    html += f"""
-                    <div style="background: var(--bg-tertiary); padding: 12px; border-radius: 8px;">
-                        <div style="font-size: 12px; color: var(--text-muted); margin-bottom: 4px;">Gate-C (Window)</div>
-                        <div style="color: {'#10b981' if result.gate_c.passed else '#ef4444'}; font-weight: 600;">
-                            {'✓ PASS' if result.gate_c.passed else '✗ FAIL'}
-                        </div>
-                        <div style="font-size: 12px; color: var(--text-secondary); margin-top: 4px;">
-                            {result.gate_c.details}
-                        </div>
-                    </div>
-                </div>
+
+_GONOGO_BODY_HTML = """                </div>
             </div>
             
             <div style="margin-bottom: 16px;">
@@ -397,16 +992,16 @@ def format_html_output(result: GoNoGoResult, limits: GoNoGoLimits) -> str:
                 </div>
                 <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 8px; font-size: 13px;">
                     <div style="color: var(--text-primary);">
-                        <span style="color: var(--text-muted);">Wave (Hs):</span> ≤{limits.Hs_limit_m}m
+                        <span style="color: var(--text-muted);">Wave (Hs):</span> ≤{Hs_limit_m}m
                     </div>
                     <div style="color: var(--text-primary);">
-                        <span style="color: var(--text-muted);">Wind:</span> ≤{limits.Wind_limit_kt}kt
+                        <span style="color: var(--text-muted);">Wind:</span> ≤{Wind_limit_kt}kt
                     </div>
                     <div style="color: var(--text-primary);">
-                        <span style="color: var(--text-muted);">Peak Wave (Hmax):</span> ≤{limits.Hmax_allow_m}m
+                        <span style="color: var(--text-muted);">Peak Wave (Hmax):</span> ≤{Hmax_allow_m}m
                     </div>
                     <div style="color: var(--text-primary);">
-                        <span style="color: var(--text-muted);">Required Window:</span> {limits.SailingTime_hr + limits.Reserve_hr}hr
+                        <span style="color: var(--text-muted);">Required Window:</span> {window_hr}hr
                     </div>
                 </div>
             </div>
@@ -417,21 +1012,233 @@ def format_html_output(result: GoNoGoResult, limits: GoNoGoLimits) -> str:
                 </div>
                 <ul style="margin: 0; padding-left: 20px; color: var(--text-primary); line-height: 1.8;">
 """
-    
-    for rec in result.recommendations:
-        html += f"                    <li>{rec}</li>\n"
-    
-    html += """
+
+_GONOGO_REC_HTML = """                    <li>{rec}</li>\n"""
+
+_GONOGO_FOOT_HTML = """
                 </ul>
             </div>
             
             <div style="margin-top: 16px; padding-top: 16px; border-top: 1px solid var(--border-subtle); font-size: 12px; color: var(--text-muted); text-align: center;">
-                Last Evaluated: """ + datetime.now().strftime("%Y-%m-%d %H:%M UTC") + """
+                Last Evaluated: {evaluated_at}
             </div>
         </div>
 """
+
+_DECISION_COLORS = {
+    "GO": "#10b981",  # Green
+    "NO-GO": "#ef4444",  # Red
+    "CONDITIONAL": "#eab308"  # Yellow
+}
+_DECISION_BG_COLORS = {
+    "GO": "rgba(16, 185, 129, 0.1)",
+    "NO-GO": "rgba(239, 68, 68, 0.1)",
+    "CONDITIONAL": "rgba(234, 179, 8, 0.1)"
+}
+
+
+class _CompiledTemplate:
+    """Template split once into (literal, field) chunks, rendered into a shared buffer"""
+    
+    def __init__(self, parts: List[Tuple[str, Optional[str]]]):
+        self._parts = parts
+    
+    @classmethod
+    def compile(cls, text: str) -> "_CompiledTemplate":
+        return cls([
+            (literal, field) for literal, field, _, _ in string.Formatter().parse(text)
+        ])
     
-    return html
+    def bind(self, **values: object) -> "_CompiledTemplate":
+        """Fold fixed field values into the literal chunks"""
+        parts: List[Tuple[str, Optional[str]]] = []
+        literal = ""
+        for text, field in self._parts:
+            literal += text
+            if field in values:
+                literal += str(values[field])
+            elif field is not None:
+                parts.append((literal, field))
+                literal = ""
+        parts.append((literal, None))
+        return _CompiledTemplate(parts)
+    
+    def render_into(self, out: List[str], values: Dict[str, object]) -> None:
+        for literal, field in self._parts:
+            out.append(literal)
+            if field is not None:
+                out.append(str(values[field]))
+
+
+_HEAD_TEMPLATE = _CompiledTemplate.compile(_GONOGO_HEAD_HTML)
+_GATE_CARD_TEMPLATE = _CompiledTemplate.compile(_GONOGO_GATE_CARD_HTML)
+_BODY_TEMPLATE = _CompiledTemplate.compile(_GONOGO_BODY_HTML)
+_REC_TEMPLATE = _CompiledTemplate.compile(_GONOGO_REC_HTML)
+_FOOT_TEMPLATE = _CompiledTemplate.compile(_GONOGO_FOOT_HTML)
+
+
+@lru_cache(maxsize=None)
+def _head_template(decision: str) -> _CompiledTemplate:
+    color = _DECISION_COLORS.get(decision, "#64748b")
+    return _HEAD_TEMPLATE.bind(
+        bg_color=_DECISION_BG_COLORS.get(decision, "rgba(100, 116, 139, 0.1)"),
+        color=color,
+        decision=decision
+    )
+
+
+@lru_cache(maxsize=None)
+def _gate_card_template(label: str, passed: Optional[bool]) -> _CompiledTemplate:
+    return _GATE_CARD_TEMPLATE.bind(
+        label=label,
+        status_color='#10b981' if passed else '#ef4444',
+        status_label='✓ PASS' if passed else '✗ FAIL'
+    )
+
+
+@lru_cache(maxsize=256)
+def _limits_block(
+    Hs_limit_m: float,
+    Wind_limit_kt: float,
+    Hmax_allow_m: float,
+    window_hr: float
+) -> str:
+    out: List[str] = []
+    _BODY_TEMPLATE.render_into(out, {
+        "Hs_limit_m": Hs_limit_m,
+        "Wind_limit_kt": Wind_limit_kt,
+        "Hmax_allow_m": Hmax_allow_m,
+        "window_hr": window_hr
+    })
+    return "".join(out)
+
+
+def _render_gonogo_into(
+    out: List[str],
+    result: GoNoGoResult,
+    limits: GoNoGoLimits,
+    evaluated_at: str
+) -> None:
+    """Append one Go/No-Go HTML block to the output buffer"""
+    _head_template(result.decision).render_into(out, {"rationale": result.rationale})
+    
+    _gate_card_template("Gate-A (Basic)", result.gate_a.passed).render_into(
+        out, {"details": result.gate_a.details}
+    )
+    if result.gate_b:
+        out.append("\n")
+        _gate_card_template("Gate-B (Squall)", result.gate_b.passed).render_into(
+            out, {"details": result.gate_b.details}
+        )
+    out.append("\n")
+    _gate_card_template("Gate-C (Window)", result.gate_c.passed).render_into(
+        out, {"details": result.gate_c.details}
+    )
+    
+    out.append(_limits_block(
+        limits.Hs_limit_m,
+        limits.Wind_limit_kt,
+        limits.Hmax_allow_m,
+        limits.SailingTime_hr + limits.Reserve_hr
+    ))
+    for rec in result.recommendations:
+        _REC_TEMPLATE.render_into(out, {"rec": rec})
+    _FOOT_TEMPLATE.render_into(out, {"evaluated_at": evaluated_at})
+
+
+def format_html_output(result: GoNoGoResult, limits: GoNoGoLimits) -> str:
+    """
+    Format Go/No-Go result as HTML block for AGI TR SCHEDULE
+    Following DASHBOARD_OUTPUT_SCHEMA.md format
+    """
+    out: List[str] = []
+    _render_gonogo_into(out, result, limits, datetime.now().strftime("%Y-%m-%d %H:%M UTC"))
+    return "".join(out)
+
+
+def format_html_outputs(
+    blocks: Iterable[Tuple[GoNoGoResult, GoNoGoLimits]],
+    separator: str = "\n"
+) -> str:
+    """
+    Render many Go/No-Go blocks (per voyage / per profile) in one pass
+    
+    All blocks share one buffer and one evaluation timestamp.
+    
+    Args:
+        blocks: (result, limits) pairs, rendered in order
+        separator: Text placed between consecutive blocks
+    """
+    evaluated_at = datetime.now().strftime("%Y-%m-%d %H:%M UTC")
+    out: List[str] = []
+    for i, (result, limits) in enumerate(blocks):
+        if i:
+            out.append(separator)
+        _render_gonogo_into(out, result, limits, evaluated_at)
+    return "".join(out)
+
+
+def load_weather_series(weather_json_path: str) -> List[WeatherInput]:
+    """Load the hourly forecast of a weather JSON file as WeatherInput list"""
+    with open(weather_json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    weather_series = []
+    for item in data.get('forecast', []):
+        weather_series.append(WeatherInput(
+            wave_ft=item['wave_ft'],
+            wind_kt=item['wind_kt'],
+            timestamp=datetime.fromisoformat(item['timestamp'].replace('Z', '+00:00')),
+            wave_period_s=item.get('wave_period_s')
+        ))
+    return weather_series
+
+
+def build_manual_series(
+    wave_ft_series: List[float],
+    wind_kt_series: List[float]
+) -> List[WeatherInput]:
+    """Build an hourly WeatherInput series starting now from manual arrays"""
+    if len(wave_ft_series) != len(wind_kt_series):
+        raise ValueError("wave_ft_series and wind_kt_series must have same length")
+    
+    weather_series = []
+    base_time = datetime.now()
+    for i, (wave_ft, wind_kt) in enumerate(zip(wave_ft_series, wind_kt_series)):
+        weather_series.append(WeatherInput(
+            wave_ft=wave_ft,
+            wind_kt=wind_kt,
+            timestamp=base_time + timedelta(hours=i)
+        ))
+    return weather_series
+
+
+@dataclass
+class ForecastArrays:
+    """Hourly forecast held as columns for the array engine"""
+    timestamps: List[datetime]
+    wave_ft: np.ndarray
+    wind_kt: np.ndarray
+    wave_period_s: np.ndarray  # NaN where not provided
+
+
+def load_forecast_arrays(weather_json_path: str) -> ForecastArrays:
+    """Load the hourly forecast of a weather JSON file as column arrays"""
+    with open(weather_json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    forecast = data.get('forecast', [])
+    return ForecastArrays(
+        timestamps=[
+            datetime.fromisoformat(item['timestamp'].replace('Z', '+00:00'))
+            for item in forecast
+        ],
+        wave_ft=np.array([item['wave_ft'] for item in forecast], dtype=float),
+        wind_kt=np.array([item['wind_kt'] for item in forecast], dtype=float),
+        wave_period_s=np.array(
+            [item.get('wave_period_s') for item in forecast], dtype=float
+        )
+    )
 
 
 def run_gonogo_from_json(
@@ -458,21 +1265,28 @@ def run_gonogo_from_json(
     if limits is None:
         limits = GoNoGoLimits()
     
-    with open(weather_json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    weather_series = []
-    for item in data.get('forecast', []):
-        weather_series.append(WeatherInput(
-            wave_ft=item['wave_ft'],
-            wind_kt=item['wind_kt'],
-            timestamp=datetime.fromisoformat(item['timestamp'].replace('Z', '+00:00')),
-            wave_period_s=item.get('wave_period_s')
-        ))
+    weather_series = load_weather_series(weather_json_path)
     
     return evaluate_go_nogo(weather_series, limits, use_gate_b)
 
 
+def run_gonogo_profiles_from_json(
+    weather_json_path: str,
+    profiles: List[GoNoGoLimits],
+    use_gate_b: bool = True
+) -> List[GoNoGoResult]:
+    """
+    Run Go/No-Go for several limit profiles, parsing the forecast JSON once
+    
+    Returns:
+        One GoNoGoResult per profile, in profile order
+    """
+    forecast = load_forecast_arrays(weather_json_path)
+    return evaluate_limit_profiles(
+        forecast.wave_ft, forecast.wind_kt, profiles, use_gate_b
+    )
+
+
 def run_gonogo_manual(
     wave_ft_series: List[float],
     wind_kt_series: List[float],
@@ -491,17 +1305,7 @@ def run_gonogo_manual(
     if limits is None:
         limits = GoNoGoLimits()
     
-    if len(wave_ft_series) != len(wind_kt_series):
-        raise ValueError("wave_ft_series and wind_kt_series must have same length")
-    
-    weather_series = []
-    base_time = datetime.now()
-    for i, (wave_ft, wind_kt) in enumerate(zip(wave_ft_series, wind_kt_series)):
-        weather_series.append(WeatherInput(
-            wave_ft=wave_ft,
-            wind_kt=wind_kt,
-            timestamp=base_time + timedelta(hours=i)
-        ))
+    weather_series = build_manual_series(wave_ft_series, wind_kt_series)
     
     return evaluate_go_nogo(weather_series, limits, use_gate_b)
 
@@ -564,6 +1368,17 @@ def main():
         '--output-html',
         help='Output HTML file path (for integration into AGI TR SCHEDULE)'
     )
+    parser.add_argument(
+        '--windows',
+        action='store_true',
+        help='List every feasible departure hour with its window margin'
+    )
+    parser.add_argument(
+        '--monte-carlo',
+        type=int,
+        metavar='N',
+        help='Report P(GO) per departure hour from N perturbed forecast realisations'
+    )
     
     args = parser.parse_args()
     
@@ -580,15 +1395,16 @@ def main():
         if not os.path.exists(args.json):
             print(f"Error: JSON file not found: {args.json}")
             return
-        result = run_gonogo_from_json(args.json, limits, not args.no_gate_b)
+        weather_series = load_weather_series(args.json)
     elif args.manual_wave and args.manual_wind:
         wave_series = [float(x.strip()) for x in args.manual_wave.split(',')]
         wind_series = [float(x.strip()) for x in args.manual_wind.split(',')]
-        result = run_gonogo_manual(wave_series, wind_series, limits, not args.no_gate_b)
+        weather_series = build_manual_series(wave_series, wind_series)
     else:
         print("Error: Must provide either --json or both --manual-wave and --manual-wind")
         parser.print_help()
         return
+    result = evaluate_go_nogo(weather_series, limits, not args.no_gate_b)
     
     # Print result
     print("\n" + "="*60)
@@ -614,6 +1430,37 @@ def main():
     for i, rec in enumerate(result.recommendations, 1):
         print(f"  {i}. {rec}")
     
+    if args.windows:
+        masks = compute_gate_masks(
+            [w.wave_ft for w in weather_series],
+            [w.wind_kt for w in weather_series],
+            limits,
+            not args.no_gate_b
+        )
+        windows = find_departure_windows(
+            masks.go, limits, [w.timestamp for w in weather_series]
+        )
+        print(f"\nDeparture Windows: {len(windows)} feasible start hour(s)")
+        for win in windows:
+            print(
+                f"  {win.departure:%Y-%m-%d %H:%M} "
+                f"(GO run ends +{win.run_end_index - win.start_index}hr, "
+                f"margin {win.margin_hr:.1f}hr)"
+            )
+    
+    if args.monte_carlo:
+        mc = evaluate_go_nogo_monte_carlo(
+            [w.wave_ft for w in weather_series],
+            [w.wind_kt for w in weather_series],
+            limits,
+            n_samples=args.monte_carlo,
+            use_gate_b=not args.no_gate_b
+        )
+        print(f"\nMonte-Carlo ({mc.n_samples} realisations): P(Gate-C window) = {mc.p_gate_c:.1%}")
+        for w, p in zip(weather_series, mc.p_departure):
+            if p > 0:
+                print(f"  {w.timestamp:%Y-%m-%d %H:%M}  P(GO departure) = {p:.1%}")
+    
     # Save HTML if requested
     if args.output_html:
         html_output = format_html_output(result, limits)
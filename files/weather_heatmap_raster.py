@@ -0,0 +1,496 @@
+# -*- coding: utf-8 -*-
+"""
+Raster backend for the weather risk heatmap (WEATHER_DASHBOARD.py)
+================================================================
+Composes the dashboard PNG directly into an RGBA NumPy pixel buffer instead
+of going through the matplotlib figure stack: cells, bands, spans and bars
+are array fills, lines and markers are coverage masks, and text is blitted
+from a glyph atlas (each character rasterised once per font size by Pillow,
+which matplotlib already depends on). Layout, colours and summary boxes
+follow render_heatmap_matplotlib() at 150 dpi with a transparent background.
+"""
+
+from __future__ import annotations
+import importlib.util
+import math
+import os
+
+import numpy as np
+
+from WEATHER_DASHBOARD import (
+    DASHBOARD_THEME,
+    VOYAGES,
+    coverage_box_text,
+    heatmap_matrix,
+    heatmap_summary,
+    summary_box_text,
+)
+
+DPI = 150
+CANVAS_W, CANVAS_H = 1810, 1085
+
+# Panel boxes (x0, y0, x1, y1) in pixels
+HEAT_BOX = (176, 22, 1642, 502)
+CBAR_BOX = (1665, 22, 1724, 502)
+RISK_BOX = (176, 574, 1642, 814)
+STATUS_BOX = (176, 886, 1642, 1030)
+
+
+def _px(points: float) -> int:
+    return int(round(points * DPI / 72.0))
+
+
+def _rgba(color: str, alpha: float | None = None) -> tuple[float, float, float, float]:
+    """'#rrggbb' or '#rrggbbaa' to floats; alpha overrides the colour's own."""
+    h = color.lstrip("#")
+    r, g, b = (int(h[i : i + 2], 16) / 255.0 for i in (0, 2, 4))
+    a = int(h[6:8], 16) / 255.0 if len(h) == 8 else 1.0
+    return (r, g, b, a if alpha is None else alpha)
+
+
+def _font_dir() -> str | None:
+    """matplotlib's bundled DejaVu fonts, located without importing matplotlib."""
+    spec = importlib.util.find_spec("matplotlib")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    path = os.path.join(list(spec.submodule_search_locations)[0], "mpl-data", "fonts", "ttf")
+    return path if os.path.isdir(path) else None
+
+
+_FONT_FILES = {
+    (False, False): "DejaVuSans.ttf",
+    (True, False): "DejaVuSans-Bold.ttf",
+    (False, True): "DejaVuSansMono.ttf",
+    (True, True): "DejaVuSansMono-Bold.ttf",
+}
+
+
+class GlyphAtlas:
+    """Glyph coverage masks for one font face and size, rasterised on first use."""
+
+    def __init__(self, size_px: int, bold: bool = False, mono: bool = False):
+        from PIL import ImageFont
+
+        font_dir = _font_dir()
+        path = os.path.join(font_dir, _FONT_FILES[(bold, mono)]) if font_dir else None
+        if path and os.path.exists(path):
+            self.font = ImageFont.truetype(path, size_px)
+        else:
+            self.font = ImageFont.load_default(size_px)
+        ascent, descent = self.font.getmetrics()
+        self.line_height = ascent + descent
+        self._glyphs: dict[str, tuple[np.ndarray, float]] = {}
+        self._lines: dict[str, np.ndarray] = {}
+
+    def glyph(self, ch: str) -> tuple[np.ndarray, float]:
+        """(coverage mask [line_height, w], advance) for one character."""
+        g = self._glyphs.get(ch)
+        if g is None:
+            from PIL import Image, ImageDraw
+
+            advance = self.font.getlength(ch)
+            img = Image.new("L", (int(math.ceil(advance)) + self.line_height // 2, self.line_height))
+            ImageDraw.Draw(img).text((0, 0), ch, font=self.font, fill=255)
+            g = (np.asarray(img, dtype=np.float32) / 255.0, advance)
+            self._glyphs[ch] = g
+        return g
+
+    def line(self, text: str) -> np.ndarray:
+        """Coverage mask for one line of text (cached; cell labels repeat)."""
+        mask = self._lines.get(text)
+        if mask is None:
+            glyphs = [self.glyph(ch) for ch in text]
+            width = int(math.ceil(sum(adv for _, adv in glyphs))) + self.line_height // 2
+            mask = np.zeros((self.line_height, max(width, 1)), dtype=np.float32)
+            x = 0.0
+            for m, adv in glyphs:
+                xi = int(round(x))
+                region = mask[:, xi : xi + m.shape[1]]
+                np.maximum(region, m[:, : region.shape[1]], out=region)
+                x += adv
+            cols = np.flatnonzero(mask.any(axis=0))
+            mask = mask[:, : cols[-1] + 1] if len(cols) else mask[:, :1]
+            self._lines[text] = mask
+        return mask
+
+    def block(self, text: str, spacing: float = 1.2, align: str = "left") -> np.ndarray:
+        """Coverage mask for multi-line text, left or center aligned."""
+        lines = [self.line(t) if t else np.zeros((self.line_height, 1), np.float32) for t in text.split("\n")]
+        step = int(round(self.line_height * spacing))
+        height = step * (len(lines) - 1) + self.line_height
+        mask = np.zeros((height, max(m.shape[1] for m in lines)), dtype=np.float32)
+        for k, m in enumerate(lines):
+            x = (mask.shape[1] - m.shape[1]) // 2 if align == "center" else 0
+            mask[k * step : k * step + m.shape[0], x : x + m.shape[1]] = m
+        return mask
+
+
+_ATLASES: dict[tuple[int, bool, bool], GlyphAtlas] = {}
+
+
+def get_atlas(points: float, bold: bool = False, mono: bool = False) -> GlyphAtlas:
+    key = (_px(points), bold, mono)
+    atlas = _ATLASES.get(key)
+    if atlas is None:
+        atlas = _ATLASES[key] = GlyphAtlas(*key)
+        for ch in "0123456789.-":  # Numeric cell labels
+            atlas.glyph(ch)
+    return atlas
+
+
+class RasterCanvas:
+    """Premultiplied float32 RGBA buffer with source-over compositing."""
+
+    def __init__(self, width: int, height: int):
+        self.px = np.zeros((height, width, 4), dtype=np.float32)
+
+    def blend(self, x0: int, y0: int, mask: np.ndarray, rgba: tuple) -> None:
+        """Composite rgba over the buffer with per-pixel coverage mask at (x0, y0)."""
+        h, w = mask.shape
+        H, W = self.px.shape[:2]
+        cx0, cy0 = max(x0, 0), max(y0, 0)
+        cx1, cy1 = min(x0 + w, W), min(y0 + h, H)
+        if cx0 >= cx1 or cy0 >= cy1:
+            return
+        sa = mask[cy0 - y0 : cy1 - y0, cx0 - x0 : cx1 - x0] * np.float32(rgba[3])
+        dst = self.px[cy0:cy1, cx0:cx1]
+        dst *= (1.0 - sa)[..., None]
+        dst += sa[..., None] * np.array([rgba[0], rgba[1], rgba[2], 1.0], dtype=np.float32)
+
+    def to_rgba8(self) -> np.ndarray:
+        """Straight-alpha uint8 RGBA for PNG encoding."""
+        alpha = self.px[..., 3:4]
+        straight = np.zeros(self.px.shape, dtype=np.float32)
+        np.divide(self.px[..., :3], alpha, out=straight[..., :3], where=alpha > 0)
+        straight[..., 3:4] = alpha
+        np.clip(straight, 0.0, 1.0, out=straight)
+        straight *= 255.0
+        straight += 0.5
+        return straight.astype(np.uint8)
+
+    def fill_rect(self, x0: float, y0: float, x1: float, y1: float, rgba: tuple) -> None:
+        xi0, yi0 = int(round(min(x0, x1))), int(round(min(y0, y1)))
+        xi1, yi1 = int(round(max(x0, x1))), int(round(max(y0, y1)))
+        H, W = self.px.shape[:2]
+        xi0, yi0, xi1, yi1 = max(xi0, 0), max(yi0, 0), min(xi1, W), min(yi1, H)
+        if xi1 > xi0 and yi1 > yi0:
+            # Uniform coverage: scalar source-over, no mask array
+            dst = self.px[yi0:yi1, xi0:xi1]
+            dst *= np.float32(1.0 - rgba[3])
+            dst += np.array([rgba[0] * rgba[3], rgba[1] * rgba[3], rgba[2] * rgba[3], rgba[3]], np.float32)
+
+    def stroke_rect(self, x0: float, y0: float, x1: float, y1: float, rgba: tuple, width: int = 1) -> None:
+        self.fill_rect(x0, y0, x1, y0 + width, rgba)
+        self.fill_rect(x0, y1 - width, x1, y1, rgba)
+        self.fill_rect(x0, y0 + width, x0 + width, y1 - width, rgba)
+        self.fill_rect(x1 - width, y0 + width, x1, y1 - width, rgba)
+
+    def hline(self, y: float, x0: float, x1: float, rgba: tuple, width: int = 1, dash: tuple | None = None) -> None:
+        xi0, xi1 = int(round(x0)), int(round(x1))
+        mask = np.ones((width, max(xi1 - xi0, 0)), np.float32)
+        if dash:
+            on, off = dash
+            mask[:, (np.arange(mask.shape[1]) % (on + off)) >= on] = 0.0
+        self.blend(xi0, int(round(y - width / 2.0)), mask, rgba)
+
+    def vline(self, x: float, y0: float, y1: float, rgba: tuple, width: int = 1) -> None:
+        self.fill_rect(x - width / 2.0, y0, x + width / 2.0, y1, rgba)
+
+    def polyline(self, xs, ys, width: float, rgba: tuple) -> None:
+        """Anti-aliased polyline (distance-to-segment coverage, composited once)."""
+        xs, ys = np.asarray(xs, float), np.asarray(ys, float)
+        if len(xs) == 0:
+            return
+        pad = width / 2.0 + 1.0
+        x0, y0 = int(math.floor(xs.min() - pad)), int(math.floor(ys.min() - pad))
+        x1, y1 = int(math.ceil(xs.max() + pad)), int(math.ceil(ys.max() + pad))
+        cover = np.zeros((y1 - y0, x1 - x0), np.float32)
+        for k in range(max(len(xs) - 1, 1)):
+            ax, ay = xs[k], ys[k]
+            bx, by = (xs[k + 1], ys[k + 1]) if len(xs) > 1 else (ax, ay)
+            # Distance field only over this segment's bounding box
+            sx0, sy0 = int(math.floor(min(ax, bx) - pad)), int(math.floor(min(ay, by) - pad))
+            sx1, sy1 = int(math.ceil(max(ax, bx) + pad)), int(math.ceil(max(ay, by) + pad))
+            gy, gx = np.mgrid[sy0:sy1, sx0:sx1].astype(np.float32) + 0.5
+            dx, dy = bx - ax, by - ay
+            seg = dx * dx + dy * dy
+            t = np.clip(((gx - ax) * dx + (gy - ay) * dy) / seg, 0.0, 1.0) if seg else 0.0
+            dist = np.hypot(gx - (ax + t * dx), gy - (ay + t * dy))
+            region = cover[sy0 - y0 : sy1 - y0, sx0 - x0 : sx1 - x0]
+            np.maximum(region, np.clip(width / 2.0 + 0.5 - dist, 0.0, 1.0), out=region)
+        self.blend(x0, y0, cover, rgba)
+
+    def circles(self, xs, ys, radius: float, rgba: tuple) -> None:
+        r = int(math.ceil(radius + 1))
+        gy, gx = np.mgrid[-r : r + 1, -r : r + 1].astype(np.float32)
+        disc = np.clip(radius + 0.5 - np.hypot(gx, gy), 0.0, 1.0)
+        for x, y in zip(xs, ys):
+            self.blend(int(round(x)) - r, int(round(y)) - r, disc, rgba)
+
+    def fill_below(self, xs, ys, y_base: float, rgba: tuple) -> None:
+        """Fill between a polyline and a horizontal baseline (ys above y_base)."""
+        xs, ys = np.asarray(xs, float), np.asarray(ys, float)
+        if len(xs) < 2:
+            return
+        x0, x1 = int(round(xs[0])), int(round(xs[-1]))
+        y0, y1 = int(math.floor(ys.min())), int(round(y_base))
+        if x1 <= x0 or y1 <= y0:
+            return
+        line_y = np.interp(np.arange(x0, x1) + 0.5, xs, ys)
+        rows = np.arange(y0, y1)[:, None] + 0.5
+        self.blend(x0, y0, np.clip(rows - line_y[None, :] + 0.5, 0.0, 1.0).astype(np.float32), rgba)
+
+    def text(
+        self,
+        x: float,
+        y: float,
+        text: str,
+        atlas: GlyphAtlas,
+        rgba: tuple,
+        ha: str = "left",
+        va: str = "top",
+        rotate: bool = False,
+    ) -> tuple[int, int]:
+        """Draw text anchored at (x, y); rotate=True reads bottom-to-top. Returns mask size."""
+        mask = atlas.block(text, align=ha if ha == "center" else "left") if "\n" in text else atlas.line(text)
+        if rotate:
+            mask = np.rot90(mask)
+        h, w = mask.shape
+        ox = {"left": 0.0, "center": w / 2.0, "right": float(w)}[ha]
+        oy = {"top": 0.0, "center": h / 2.0, "bottom": float(h)}[va]
+        self.blend(int(round(x - ox)), int(round(y - oy)), mask, rgba)
+        return w, h
+
+
+def colormap_lut(colors: list[str], n: int = 256) -> np.ndarray:
+    """(n, 4) LUT equivalent to LinearSegmentedColormap.from_list(colors, N=n)."""
+    stops = np.linspace(0.0, 1.0, len(colors))
+    rgba = np.array([_rgba(c) for c in colors])
+    pos = np.linspace(0.0, 1.0, n)
+    return np.stack([np.interp(pos, stops, rgba[:, k]) for k in range(4)], axis=1)
+
+
+def _lut_index(values: np.ndarray, vmin: float, vmax: float, n: int = 256) -> np.ndarray:
+    """matplotlib Normalize + Colormap LUT lookup (vmin == vmax maps to 0)."""
+    scaled = (values - vmin) / (vmax - vmin) if vmax > vmin else np.zeros_like(values)
+    return np.clip((scaled * n).astype(int), 0, n - 1)
+
+
+def _nice_ticks(vmin: float, vmax: float, max_ticks: int = 8) -> np.ndarray:
+    span = vmax - vmin
+    if span <= 0:
+        return np.array([vmin])
+    raw = span / max_ticks
+    mag = 10.0 ** math.floor(math.log10(raw))
+    step = next(s * mag for s in (1, 2, 2.5, 5, 10) if s * mag >= raw)
+    first = math.ceil(vmin / step - 1e-9) * step
+    return np.arange(first, vmax + step * 1e-6, step)
+
+
+def _legend_box(canvas: RasterCanvas, x: float, y: float, w: float, h: float, theme: dict) -> None:
+    canvas.fill_rect(x, y, x + w, y + h, _rgba(theme["bg_card"], 0.9))
+    canvas.stroke_rect(x, y, x + w, y + h, _rgba(theme["grid_color"]))
+
+
+def render_heatmap_raster(data: dict, output_path: str, theme: dict | None = None, voyages=None) -> dict:
+    """
+    Compose the dashboard heatmap PNG in a pixel buffer.
+
+    Returns the status/shamal/coverage counts shown in the summary boxes.
+    """
+    from PIL import Image
+
+    theme = theme or DASHBOARD_THEME
+    voyages = VOYAGES if voyages is None else voyages
+    start, end, days = data["start"], data["end"], data["days"]
+    n = len(days)
+    risk, status, shamal = data["risk"], data["status"], data["shamal"]
+    params, data_matrix, data_norm = heatmap_matrix(data)
+    summary = heatmap_summary(data)
+    canvas = RasterCanvas(CANVAS_W, CANVAS_H)
+
+    hx0, hy0, hx1, hy1 = HEAT_BOX
+    col_w = (hx1 - hx0) / n
+
+    def col_x(c: float) -> float:
+        # Data x in [-0.5, n - 0.5] to pixels (shared by all panels)
+        return hx0 + (c + 0.5) * col_w
+
+    shamal_rgba = _rgba(theme["shamal"], 0.15)
+
+    def shade_shamal(box: tuple) -> None:
+        # Shamal highlight (axvspan at zorder 0: above cells, below lines and text)
+        for c in np.flatnonzero(shamal):
+            canvas.fill_rect(col_x(c - 0.5), box[1], col_x(c + 0.5), box[3], shamal_rgba)
+
+    grid = _rgba(theme["grid_color"])
+    text_primary = _rgba(theme["text_primary"])
+    text_secondary = _rgba(theme["text_secondary"])
+    tick_atlas = get_atlas(9)
+
+    # Heatmap cells: imshow-style autoscaled colour lookup, row 0 (risk) at the bottom
+    lut = colormap_lut(theme["cmap"])
+    finite = data_norm[~np.isnan(data_norm)]
+    vmin, vmax = (float(finite.min()), float(finite.max())) if finite.size else (0.0, 1.0)
+    rows = len(params)
+    row_h = (hy1 - hy0) / rows
+    cell_idx = _lut_index(np.nan_to_num(data_norm), vmin, vmax)
+    col_edges = np.round(hx0 + np.arange(n + 1) * col_w).astype(int)
+    row_edges = np.round(hy1 - np.arange(rows + 1) * row_h).astype(int)
+    cells = np.zeros((hy1 - hy0, hx1 - hx0, 4), np.float32)
+    for r in range(rows):
+        ya, yb = row_edges[r + 1] - hy0, row_edges[r] - hy0
+        for c in range(n):
+            if not np.isnan(data_norm[r, c]):
+                cells[ya:yb, col_edges[c] - hx0 : col_edges[c + 1] - hx0] = lut[cell_idx[r, c]]
+    canvas.px[hy0:hy1, hx0:hx1] = cells
+
+    shade_shamal(HEAT_BOX)
+
+    # Cell annotations
+    cell_atlas = get_atlas(9, bold=True)
+    bg_primary = _rgba(theme["bg_primary"])
+    for r in range(rows):
+        yc = (row_edges[r] + row_edges[r + 1]) / 2.0
+        for c in range(n):
+            val = data_matrix[r, c]
+            if np.isnan(val):
+                continue
+            txt = f"{val:.0f}" if r in (0, 1, 4, 5) else f"{val:.1f}"
+            color = text_primary if data_norm[r, c] > 0.5 else bg_primary
+            canvas.text(col_x(c), yc, txt, cell_atlas, color, ha="center", va="center")
+
+    label_atlas = get_atlas(10, bold=True)
+    for r, label in enumerate(params):
+        yc = (row_edges[r] + row_edges[r + 1]) / 2.0
+        canvas.hline(yc, hx0 - 6, hx0, text_secondary)
+        canvas.text(hx0 - 10, yc, label, label_atlas, text_primary, ha="right", va="center")
+
+    # Colorbar
+    cx0, cy0, cx1, cy1 = CBAR_BOX
+    levels = vmax - (np.arange(cy1 - cy0) + 0.5) / (cy1 - cy0) * (vmax - vmin)
+    bar = lut[_lut_index(levels, vmin, vmax)]
+    canvas.px[cy0:cy1, cx0:cx1] = bar[:, None, :]
+    canvas.stroke_rect(cx0, cy0, cx1, cy1, grid)
+    for t in _nice_ticks(vmin, vmax):
+        ty = cy1 - (t - vmin) / (vmax - vmin) * (cy1 - cy0) if vmax > vmin else cy1
+        canvas.hline(ty, cx1, cx1 + 6, text_secondary)
+        canvas.text(cx1 + 10, ty, f"{t:.1f}", tick_atlas, text_secondary, va="center")
+    canvas.text(cx1 + 52, (cy0 + cy1) / 2.0, "Normalized (fixed ranges)", tick_atlas, text_secondary,
+                ha="center", va="center", rotate=True)
+
+    # Risk panel: bands, voyages, grid, fill, line, thresholds
+    rx0, ry0, rx1, ry1 = RISK_BOX
+
+    def risk_y(v):
+        return ry1 - np.asarray(v, float) / 100.0 * (ry1 - ry0)
+
+    for lo, hi, key in ((0, 30, "GO"), (30, 60, "HOLD"), (60, 100, "NO-GO")):
+        canvas.fill_rect(rx0, risk_y(hi), rx1, risk_y(lo), _rgba(theme["risk_band"][key]))
+
+    voyage_labels = []
+    for v in voyages:
+        if v["end"] < start or v["start"] > end:
+            continue
+        xs = (max(v["start"], start) - start).days
+        xe = (min(v["end"], end) - start).days
+        color = theme["voyage"].get(v["type"], theme["voyage"]["default"])
+        canvas.fill_rect(col_x(xs), ry0, col_x(xe), ry1, _rgba(color, 0.15))
+        voyage_labels.append(((col_x(xs) + col_x(xe)) / 2.0, f'{v["name"]}\n{v["label"]}', color))
+
+    shade_shamal(RISK_BOX)
+
+    grid_line = _rgba(theme["grid_color"], 0.3)
+    tick_step = max(1, n // 8)
+    for c in range(0, n, tick_step):
+        canvas.vline(col_x(c), ry0, ry1, grid_line)
+    for v in range(0, 101, 20):
+        canvas.hline(risk_y(v), rx0, rx1, grid_line)
+        canvas.hline(risk_y(v), rx0 - 6, rx0, text_secondary)
+        canvas.text(rx0 - 10, risk_y(v), str(v), tick_atlas, text_secondary, ha="right", va="center")
+
+    accent = theme["accent_primary"]
+    xs_px = [col_x(c) for c in range(n)]
+    ys_px = risk_y(np.nan_to_num(risk))
+    canvas.fill_below(xs_px, ys_px, ry1, _rgba(accent, 0.3))
+    canvas.polyline(xs_px, ys_px, _px(2), _rgba(accent))
+    canvas.circles(xs_px, ys_px, _px(5) / 2.0, _rgba(accent))
+    dash = (_px(5.5), _px(2.4))
+    canvas.hline(risk_y(30), rx0, rx1, _rgba(theme["status"]["GO"]), _px(1.5), dash)
+    canvas.hline(risk_y(60), rx0, rx1, _rgba(theme["status"]["NO-GO"]), _px(1.5), dash)
+
+    voyage_atlas = get_atlas(9, bold=True)
+    for mid, label, color in voyage_labels:
+        mask = voyage_atlas.block(label, align="center")
+        w, h = mask.shape[1] + 12, mask.shape[0] + 8
+        top = risk_y(85)
+        canvas.fill_rect(mid - w / 2.0, top, mid + w / 2.0, top + h, _rgba(theme["bg_card"], 0.9))
+        canvas.stroke_rect(mid - w / 2.0, top, mid + w / 2.0, top + h, _rgba(color), _px(1.5))
+        canvas.text(mid, top + 4, label, voyage_atlas, _rgba(color), ha="center")
+
+    legend_atlas = get_atlas(8)
+    entries = [("GO Threshold (30)", theme["status"]["GO"]), ("NO-GO Threshold (60)", theme["status"]["NO-GO"])]
+    lw = max(legend_atlas.line(t).shape[1] for t, _ in entries) + 64
+    lh = len(entries) * legend_atlas.line_height + 16
+    lx, ly = rx1 - lw - 8, ry0 + 8
+    _legend_box(canvas, lx, ly, lw, lh, theme)
+    for k, (label, color) in enumerate(entries):
+        yc = ly + 8 + (k + 0.5) * legend_atlas.line_height
+        canvas.hline(yc, lx + 8, lx + 38, _rgba(color), _px(1.5), dash)
+        canvas.text(lx + 50, yc, label, legend_atlas, text_secondary, va="center")
+
+    title_atlas = get_atlas(11, bold=True)
+    canvas.text((rx0 + rx1) / 2.0, ry0 - 18, "Composite Weather Risk Score (Ensemble + Marine + Archive/Climate)",
+                title_atlas, _rgba(theme["accent_secondary"]), ha="center", va="bottom")
+    canvas.text(rx0 - 62, (ry0 + ry1) / 2.0, "Risk Score (0-100)", label_atlas, text_primary,
+                ha="center", va="center", rotate=True)
+
+    # Summary boxes (mono text, 90% transparent boxes)
+    stats_atlas = get_atlas(8, bold=True, mono=True)
+    stats = stats_atlas.block(summary_box_text(data, summary).rstrip("\n"))
+    bx, by = rx0 + 12, ry1 - stats.shape[0] - 28
+    canvas.fill_rect(bx, by, bx + stats.shape[1] + 24, by + stats.shape[0] + 16, _rgba(theme["bg_card"], 0.1))
+    canvas.stroke_rect(bx, by, bx + stats.shape[1] + 24, by + stats.shape[0] + 16, _rgba(accent, 0.1), _px(1.5))
+    canvas.blend(bx + 12, by + 8, stats, text_primary)
+
+    cov_atlas = get_atlas(7, mono=True)
+    cov = cov_atlas.block(coverage_box_text(summary["coverage"]))
+    bx, by = hx1 - cov.shape[1] - 36, hy1 - cov.shape[0] - 28
+    canvas.fill_rect(bx, by, bx + cov.shape[1] + 24, by + cov.shape[0] + 16, _rgba(theme["bg_card"], 0.1))
+    canvas.stroke_rect(bx, by, bx + cov.shape[1] + 24, by + cov.shape[0] + 16, _rgba(theme["accent_secondary"], 0.1))
+    canvas.blend(bx + 12, by + 8, cov, text_secondary)
+
+    # Status bars
+    sx0, sy0, sx1, sy1 = STATUS_BOX
+    shade_shamal(STATUS_BOX)
+    bar_top = sy1 - (sy1 - sy0) / 1.3
+    edge = _rgba(theme["bg_primary"])
+    for c, st in enumerate(status):
+        x0, x1 = col_x(c - 0.45), col_x(c + 0.45)
+        canvas.fill_rect(x0, bar_top, x1, sy1, _rgba(theme["status"][st]))
+        canvas.stroke_rect(x0, bar_top, x1, sy1, edge, 2)
+    date_atlas = get_atlas(10, bold=True)
+    for c, d in enumerate(days):
+        canvas.hline(sy1, col_x(c) - 1, col_x(c) + 1, text_secondary, 6)
+        canvas.text(col_x(c), sy1 + 16, d.strftime("%d %b"), date_atlas, text_primary, ha="center")
+    canvas.text((sx0 + sx1) / 2.0, sy0 - 18, "Daily Operation Status (GO / HOLD / NO-GO)",
+                title_atlas, _rgba(theme["accent_gold"]), ha="center", va="bottom")
+
+    status_legend = get_atlas(9)
+    entries = [("GO (Risk < 30)", "GO"), ("HOLD (30-60)", "HOLD"), ("NO-GO (>=60)", "NO-GO")]
+    widths = [status_legend.line(t).shape[1] + 72 for t, _ in entries]
+    lx, ly, lh = sx0 + 8, sy0 + 8, status_legend.line_height + 12
+    _legend_box(canvas, lx, ly, sum(widths) + 8, lh, theme)
+    x = lx + 8
+    for (label, key), w in zip(entries, widths):
+        canvas.fill_rect(x, ly + lh / 2.0 - 7, x + 40, ly + lh / 2.0 + 7, _rgba(theme["status"][key]))
+        canvas.text(x + 52, ly + lh / 2.0, label, status_legend, text_primary, va="center")
+        x += w
+
+    # Left/bottom spines
+    for x0, y0, x1, y1 in (HEAT_BOX, RISK_BOX, STATUS_BOX):
+        canvas.vline(x0, y0, y1, grid, 2)
+        canvas.hline(y1, x0, x1, grid, 2)
+
+    Image.fromarray(canvas.to_rgba8(), "RGBA").save(output_path, compress_level=6)
+    return summary
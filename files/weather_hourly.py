@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Hourly weather dataset shared by the heatmap and Go/No-Go (WEATHER_DASHBOARD.py)
+
+Fetches hourly wind / gust / direction / visibility (archive for past days,
+forecast model ensemble after that) and marine wave height / period once,
+stores them in a memory-mapped columnar file, scores every hour with
+calc_risk_score, and derives the daily heatmap series from the scored
+hours. The same gap-filled hours are written as a Go/No-Go columnar
+forecast (.gngc), so both consumers read one dataset.
+
+Layout (little endian):
+    header  32 bytes  magic "WXHCOL1\\0", version u32, utc_offset_s i32, n_hours u64, padding
+    int32[n]          epoch_hour (hours since 1970-01-01T00:00Z)
+    float32[n] x 6    wind_kn, gust_kn, wdir_deg, vis_km, wave_m, wave_period_s (NaN = missing)
+    uint8[n]          source (0 none, 1 archive, 2 forecast ensemble)
+
+Rows are a contiguous hourly grid starting at local midnight of the first
+day (utc_offset_s = the API timezone offset), 24 rows per day.
+"""
+
+from __future__ import annotations
+import os
+import struct
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+
+from WEATHER_DASHBOARD import (
+    ARCHIVE_URL,
+    FETCH_MAX_WORKERS,
+    FORECAST_CACHE_TTL_MIN,
+    GAP_FILL_METHOD,
+    LAT,
+    LON,
+    MANUAL_SHAMAL_PERIODS,
+    MARINE_URL,
+    MODEL_URLS,
+    OP_STATUS_LEVELS,
+    SCRIPT_DIR,
+    TZ,
+    blend_ensemble,
+    calc_risk_score,
+    daterange,
+    fill_daily_gaps,
+    is_shamal_day,
+    model_weights,
+    op_status_codes,
+    request_json,
+    safe_get,
+)
+
+HOURLY_MAGIC = b"WXHCOL1\0"
+HOURLY_VERSION = 1
+HOURLY_SUFFIX = ".wxh"
+HOURLY_CACHE_DIR = os.path.join(SCRIPT_DIR, "out", "hourly")
+HOURLY_FIELDS = ("wind_kn", "gust_kn", "wdir_deg", "vis_km", "wave_m", "wave_period_s")
+SOURCE_NONE, SOURCE_ARCHIVE, SOURCE_FORECAST = 0, 1, 2
+_SOURCE_TAGS = np.array(["", "ARCHIVE", "FORECAST_ENSEMBLE"], dtype=object)
+_HEADER = struct.Struct("<8sIiQ8x")
+_WIND_VARS = ["wind_speed_10m", "wind_gusts_10m", "wind_direction_10m", "visibility"]
+M_PER_FT = 0.3048
+
+
+@dataclass
+class HourlyWeather:
+    """Hourly weather columns on a contiguous local-day grid"""
+    epoch_hour: np.ndarray  # int32 (n,)
+    wind_kn: np.ndarray  # float32 (n,)
+    gust_kn: np.ndarray
+    wdir_deg: np.ndarray
+    vis_km: np.ndarray
+    wave_m: np.ndarray
+    wave_period_s: np.ndarray
+    source: np.ndarray  # uint8 (n,)
+    utc_offset_s: int = 0
+
+    def __len__(self) -> int:
+        return len(self.epoch_hour)
+
+    def local_days(self) -> list[date]:
+        """Local date of each 24-hour block"""
+        if len(self) == 0:
+            return []
+        first = (int(self.epoch_hour[0]) * 3600 + self.utc_offset_s) // 86400
+        return [date(1970, 1, 1) + timedelta(days=first + k) for k in range(len(self) // 24)]
+
+
+# -----------------------------
+# FETCH
+# -----------------------------
+def _hour_grid(d0: date, d1: date, utc_offset_s: int) -> np.ndarray:
+    """epoch hours from local midnight of d0 through 23:00 local of d1"""
+    start = ((d0 - date(1970, 1, 1)).days * 86400 - utc_offset_s) // 3600
+    return np.arange(start, start + 24 * ((d1 - d0).days + 1), dtype=np.int64)
+
+
+def _place(grid: np.ndarray, payload: dict, key: str, scale: float = 1.0) -> np.ndarray:
+    """Hourly payload variable (unixtime) placed on grid; NaN where absent."""
+    out = np.full(len(grid), np.nan)
+    t = safe_get(payload, "hourly", "time", default=[])
+    v = safe_get(payload, "hourly", key, default=None)
+    if not t or v is None:
+        return out
+    pos = np.asarray(t, dtype=np.int64) // 3600 - grid[0]
+    vals = np.asarray(v, dtype=float)[: len(pos)] * scale
+    ok = (pos >= 0) & (pos < len(grid))
+    out[pos[ok]] = vals[ok]
+    return out
+
+
+def _circular_mean_deg(deg: np.ndarray, weight: np.ndarray | None = None, axis: int = 0) -> np.ndarray:
+    """NaN-aware (optionally weighted) mean direction in degrees"""
+    rad = np.deg2rad(deg)
+    w = np.ones_like(rad) if weight is None else np.where(np.isnan(weight), 0.0, weight)
+    valid = ~np.isnan(rad)
+    u = np.where(valid, np.sin(rad) * w, 0.0).sum(axis=axis)
+    v = np.where(valid, np.cos(rad) * w, 0.0).sum(axis=axis)
+    out = np.rad2deg(np.arctan2(u, v)) % 360.0
+    return np.where(valid.any(axis=axis) & ((u != 0) | (v != 0)), out, np.nan)
+
+
+def _hourly_params(d0: date, d1: date, lat: float, lon: float, hourly: list[str]) -> dict:
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "timezone": TZ,
+        "timeformat": "unixtime",
+        "wind_speed_unit": "kn",
+        "start_date": d0.isoformat(),
+        "end_date": d1.isoformat(),
+        "hourly": ",".join(hourly),
+    }
+
+
+def fetch_hourly(
+    d0: date,
+    d1: date,
+    today: date,
+    lat: float | None = None,
+    lon: float | None = None,
+    model_urls: dict[str, str] | None = None,
+    max_workers: int = FETCH_MAX_WORKERS,
+) -> HourlyWeather:
+    """
+    Fetch hourly archive, forecast models and marine data concurrently and
+    merge them on one hourly grid: archive where available, otherwise the
+    weighted model blend (blend_ensemble / model_weights). Same
+    archive/forecast split as fetch_all_sources.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    lat = LAT if lat is None else lat
+    lon = LON if lon is None else lon
+    model_urls = MODEL_URLS if model_urls is None else model_urls
+    archive_end = min(d1, today - timedelta(days=2))
+    remaining_start = max(d0, today - timedelta(days=1))
+
+    marine_params = _hourly_params(d0, d1, lat, lon, ["wave_height", "wave_period"])
+    del marine_params["wind_speed_unit"]
+    marine_params["cell_selection"] = "sea"
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        archive_f = (
+            pool.submit(request_json, ARCHIVE_URL, _hourly_params(d0, archive_end, lat, lon, _WIND_VARS))
+            if archive_end >= d0
+            else None
+        )
+        model_fs = (
+            [
+                pool.submit(request_json, url, _hourly_params(remaining_start, d1, lat, lon, _WIND_VARS))
+                for url in model_urls.values()
+            ]
+            if remaining_start <= d1
+            else []
+        )
+        marine_f = pool.submit(request_json, MARINE_URL, marine_params)
+        archive = archive_f.result() if archive_f is not None else {}
+        models = [f.result() for f in model_fs]
+        marine = marine_f.result()
+
+    utc_offset_s = next(
+        (int(p["utc_offset_seconds"]) for p in [archive, marine, *models] if "utc_offset_seconds" in p),
+        0,
+    )
+    grid = _hour_grid(d0, d1, utc_offset_s)
+
+    def wind_columns(payload: dict) -> np.ndarray:
+        return np.stack(
+            [
+                _place(grid, payload, "wind_speed_10m"),
+                _place(grid, payload, "wind_gusts_10m"),
+                _place(grid, payload, "wind_direction_10m"),
+                _place(grid, payload, "visibility", 1.0 / 1000.0),
+            ]
+        )
+
+    columns = wind_columns(archive)
+    source = np.where(np.isnan(columns[0]), SOURCE_NONE, SOURCE_ARCHIVE).astype(np.uint8)
+    if models:
+        stacked = np.stack([wind_columns(p) for p in models])  # (models, vars, hours)
+        names = ("wind_kn", "gust_kn", "wdir_deg", "vis_km")  # wind_columns() order
+        blend = blend_ensemble(
+            {name: stacked[:, k] for k, name in enumerate(names)},
+            model_weights(list(model_urls)),
+            direction_keys=("wdir_deg",),
+        )
+        ens = np.stack([blend[name] for name in names])
+        use = (source == SOURCE_NONE) & ~np.isnan(ens[0])
+        columns[:, use] = ens[:, use]
+        source[use] = SOURCE_FORECAST
+
+    return HourlyWeather(
+        epoch_hour=grid.astype(np.int32),
+        wind_kn=columns[0].astype(np.float32),
+        gust_kn=columns[1].astype(np.float32),
+        wdir_deg=columns[2].astype(np.float32),
+        vis_km=columns[3].astype(np.float32),
+        wave_m=_place(grid, marine, "wave_height").astype(np.float32),
+        wave_period_s=_place(grid, marine, "wave_period").astype(np.float32),
+        source=source,
+        utc_offset_s=utc_offset_s,
+    )
+
+
+# -----------------------------
+# COLUMNAR STORAGE
+# -----------------------------
+def write_hourly_columnar(path: str, hourly: HourlyWeather) -> None:
+    """Write hourly columns to the columnar binary format"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(HOURLY_MAGIC, HOURLY_VERSION, hourly.utc_offset_s, len(hourly)))
+        f.write(np.asarray(hourly.epoch_hour, dtype="<i4").tobytes())
+        for name in HOURLY_FIELDS:
+            f.write(np.asarray(getattr(hourly, name), dtype="<f4").tobytes())
+        f.write(np.asarray(hourly.source, dtype="u1").tobytes())
+    os.replace(tmp_path, path)
+
+
+def load_hourly_columnar(path: str) -> HourlyWeather:
+    """Memory-map the columns of an hourly columnar file (zero-copy, read-only)"""
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError(f"{path}: truncated hourly header")
+    magic, version, utc_offset_s, n = _HEADER.unpack(header)
+    if magic != HOURLY_MAGIC:
+        raise ValueError(f"{path}: not an hourly weather columnar file")
+    if version != HOURLY_VERSION:
+        raise ValueError(f"{path}: unsupported hourly version {version}")
+    if os.path.getsize(path) < _HEADER.size + 29 * n:
+        raise ValueError(f"{path}: truncated hourly data")
+    if n == 0:
+        empty = np.zeros(0, dtype="<f4")
+        return HourlyWeather(np.zeros(0, dtype="<i4"), *([empty] * 6), np.zeros(0, dtype="u1"), utc_offset_s)
+
+    def column(offset: int, dtype: str) -> np.ndarray:
+        return np.memmap(path, dtype=dtype, mode="r", offset=_HEADER.size + offset, shape=(n,))
+
+    floats = {name: column(4 * n * (k + 1), "<f4") for k, name in enumerate(HOURLY_FIELDS)}
+    return HourlyWeather(
+        epoch_hour=column(0, "<i4"),
+        source=column(4 * n * (len(HOURLY_FIELDS) + 1), "u1"),
+        utc_offset_s=utc_offset_s,
+        **floats,
+    )
+
+
+def hourly_cache_path(d0: date, d1: date, lat: float, lon: float, cache_dir: str = HOURLY_CACHE_DIR) -> str:
+    return os.path.join(cache_dir, f"wx_{lat:.4f}_{lon:.4f}_{d0:%Y%m%d}_{d1:%Y%m%d}{HOURLY_SUFFIX}")
+
+
+def load_hourly_dataset(
+    d0: date,
+    d1: date,
+    today: date | None = None,
+    lat: float | None = None,
+    lon: float | None = None,
+    cache_dir: str = HOURLY_CACHE_DIR,
+    max_age_min: float = FORECAST_CACHE_TTL_MIN,
+) -> tuple[HourlyWeather, str]:
+    """
+    Hourly dataset for d0..d1 from the columnar cache if younger than
+    max_age_min, otherwise fetched and rewritten. Returns (dataset, path).
+    """
+    lat = LAT if lat is None else lat
+    lon = LON if lon is None else lon
+    path = hourly_cache_path(d0, d1, lat, lon, cache_dir)
+    try:
+        if time.time() - os.path.getmtime(path) < max_age_min * 60.0:
+            return load_hourly_columnar(path), path
+    except (OSError, ValueError):
+        pass
+    hourly = fetch_hourly(d0, d1, today or datetime.now().date(), lat, lon)
+    write_hourly_columnar(path, hourly)
+    return load_hourly_columnar(path), path
+
+
+# -----------------------------
+# SCORING
+# -----------------------------
+def score_hourly(hourly: HourlyWeather, method: str = GAP_FILL_METHOD) -> dict[str, np.ndarray]:
+    """
+    Gap-filled hourly series (fill_daily_gaps rules, per hour) with
+    calc_risk_score, status code (index into OP_STATUS_LEVELS), shamal flag
+    and coverage tag for every hour.
+    """
+    scored = {name: np.array(getattr(hourly, name), dtype=float) for name in HOURLY_FIELDS}
+    coverage = _SOURCE_TAGS[np.asarray(hourly.source)]
+    fill_daily_gaps(
+        scored["wind_kn"], scored["gust_kn"], scored["wave_m"], scored["vis_km"], coverage, method
+    )
+    scored["epoch_hour"] = np.asarray(hourly.epoch_hour, dtype=np.int64)
+    scored["coverage"] = coverage
+    scored["risk"] = calc_risk_score(scored["wind_kn"], scored["gust_kn"], scored["wave_m"], scored["vis_km"])
+    scored["status"] = op_status_codes(scored["risk"])
+    scored["shamal"] = is_shamal_day(scored["wdir_deg"], scored["wind_kn"], scored["gust_kn"])
+    return scored
+
+
+# Daily coverage tag: first tag present among the day's hours, so a day
+# with any gap-filled hour is tagged as filled, as collect_daily_weather does
+_COVERAGE_PRIORITY = ("DEFAULT", "INTERPOLATED", "FORECAST_ENSEMBLE", "ARCHIVE")
+_FILLED_TAGS = ("DEFAULT", "INTERPOLATED")
+
+
+def daily_from_hourly(hourly: HourlyWeather, d0: date | None = None, d1: date | None = None) -> dict:
+    """
+    Daily series in collect_daily_weather() form, derived from scored hours.
+
+    wind/gust/wave are daily maxima, visibility the minimum, direction the
+    wind-weighted circular mean. Daily risk is the worst hourly risk (every
+    hour scored on its own values, not a mix of maxima from different
+    hours); go_hours counts GO hours per day and filled_hours the hours
+    whose wind was gap-filled.
+    """
+    if len(hourly) % 24:
+        raise ValueError("Hourly dataset is not a whole number of local days")
+    scored = score_hourly(hourly)
+    all_days = hourly.local_days()
+    d0 = d0 or all_days[0]
+    d1 = d1 or all_days[-1]
+    k0 = (d0 - all_days[0]).days
+    k1 = (d1 - all_days[0]).days + 1
+    if k0 < 0 or k1 > len(all_days) or k1 <= k0:
+        raise ValueError(f"{d0}..{d1} outside hourly dataset {all_days[0]}..{all_days[-1]}")
+
+    def per_day(name: str) -> np.ndarray:
+        return scored[name].reshape(-1, 24)[k0:k1]
+
+    days = daterange(d0, d1)
+    wind_kn = per_day("wind_kn").max(axis=1)
+    gust_kn = per_day("gust_kn").max(axis=1)
+    wdir_deg = _circular_mean_deg(per_day("wdir_deg"), per_day("wind_kn"), axis=1)
+    risk = per_day("risk").max(axis=1)
+
+    tags = per_day("coverage")
+    coverage = np.array([""] * len(days), dtype=object)
+    for tag in reversed(_COVERAGE_PRIORITY):
+        coverage[(tags == tag).any(axis=1)] = tag
+
+    shamal = is_shamal_day(wdir_deg, wind_kn, gust_kn)
+    for s, e in MANUAL_SHAMAL_PERIODS:
+        for i, d in enumerate(days):
+            if s <= d <= e:
+                shamal[i] = True
+
+    return {
+        "start": d0,
+        "end": d1,
+        "days": days,
+        "wind_kn": wind_kn,
+        "gust_kn": gust_kn,
+        "wdir_deg": wdir_deg,
+        "vis_km": per_day("vis_km").min(axis=1),
+        "wave_m": per_day("wave_m").max(axis=1),
+        "risk": risk,
+        "status": np.array(OP_STATUS_LEVELS)[op_status_codes(risk)].tolist(),
+        "shamal": shamal,
+        "coverage": coverage,
+        "go_hours": (per_day("status") == 0).sum(axis=1),
+        "filled_hours": np.isin(tags, _FILLED_TAGS).sum(axis=1),
+    }
+
+
+# -----------------------------
+# GO/NO-GO BRIDGE
+# -----------------------------
+def to_forecast_arrays(hourly: HourlyWeather):
+    """
+    The raw hours as weather_go_nogo.ForecastArrays (wave in ft, UTC timestamps).
+
+    Not gap-filled: a missing hour stays NaN and fails the gates, rather than
+    reaching them as interpolated or default values (gap fill is for the
+    heatmap only).
+    """
+    from weather_go_nogo import ForecastArrays
+
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return ForecastArrays(
+        timestamps=[epoch + timedelta(hours=int(h)) for h in hourly.epoch_hour],
+        wave_ft=np.array(hourly.wave_m, dtype=float) / M_PER_FT,
+        wind_kt=np.array(hourly.wind_kn, dtype=float),
+        wave_period_s=np.array(hourly.wave_period_s, dtype=float),
+    )
+
+
+def write_gonogo_forecast(hourly: HourlyWeather, path: str) -> str:
+    """Write the hours as a Go/No-Go columnar forecast (.gngc); returns path"""
+    from gonogo_columnar import write_forecast_columnar
+
+    write_forecast_columnar(path, to_forecast_arrays(hourly))
+    return path
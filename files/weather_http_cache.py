@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Persistent HTTP response cache for the weather heatmap (WEATHER_DASHBOARD.py)
+
+Entries are keyed by a SHA-256 of the URL and normalised query params and
+hold the decoded JSON body plus ETag / Last-Modified validators, so expired
+entries can be revalidated with a conditional request. Freshness is decided
+by the caller (per-endpoint TTL in minutes; None = never expires).
+The cache directory is size-bounded; least recently used entries are evicted.
+"""
+
+from typing import Optional
+from urllib.parse import urlencode
+import hashlib
+import json
+import os
+import threading
+import time
+
+# Bump when the entry layout changes so old entries are ignored
+HTTP_CACHE_VERSION = 1
+DEFAULT_HTTP_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "out", "http_cache"
+)
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+
+def normalize_params(params: Optional[dict]) -> str:
+    """Query string with sorted keys and str() values (None dropped)"""
+    items = sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+    return urlencode(items)
+
+
+def http_cache_key(url: str, params: Optional[dict]) -> str:
+    """SHA-256 over cache version, URL and normalised params"""
+    raw = f"v{HTTP_CACHE_VERSION}\n{url.rstrip('/')}?{normalize_params(params)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def is_fresh(entry: dict, ttl_minutes: Optional[float], now: Optional[float] = None) -> bool:
+    """True if entry is younger than ttl_minutes (None = never expires)"""
+    if ttl_minutes is None:
+        return True
+    now = time.time() if now is None else now
+    return now - entry["fetched_at"] < ttl_minutes * 60.0
+
+
+def conditional_headers(entry: Optional[dict]) -> dict:
+    """If-None-Match / If-Modified-Since headers for revalidating entry"""
+    headers = {}
+    if entry is None:
+        return headers
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+class HttpResponseCache:
+    """On-disk JSON response cache with size-bounded LRU eviction"""
+
+    def __init__(self, cache_dir: str = DEFAULT_HTTP_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached entry for key, or None on miss"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            entry["fetched_at"] = float(entry["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if "body" not in entry:
+            return None
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+        return entry
+
+    def put(
+        self,
+        key: str,
+        url: str,
+        params: Optional[dict],
+        body: dict,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> dict:
+        """Store a response body with its validators, then evict down to max_bytes"""
+        entry = {
+            "url": url,
+            "params": normalize_params(params),
+            "fetched_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+        }
+        self._write(key, entry)
+        self.evict()
+        return entry
+
+    def revalidated(self, key: str, entry: dict) -> None:
+        """Reset the age of an entry after a 304 Not Modified"""
+        entry["fetched_at"] = time.time()
+        self._write(key, entry)
+
+    def _write(self, key: str, entry: dict) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        # Unique temp name: fetches run concurrently from a thread pool
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def evict(self) -> int:
+        """Remove least recently used entries until under max_bytes; returns count removed"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
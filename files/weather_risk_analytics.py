@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Long-horizon weather risk analytics (WEATHER_DASHBOARD.py risk model)
+
+Scores years of daily archive data with the dashboard risk model for
+seasonal planning: per-day risk, GO/HOLD/NO-GO status and shamal flag, and
+per-month shamal frequency and status percentages. Everything after the
+fetch is array arithmetic (calc_risk_score / op_status_codes /
+is_shamal_day over the whole series, np.bincount per period).
+
+The archive (wind, gust, direction, visibility) and marine wave history are
+fetched in calendar-year chunks, concurrently. Completed years are kept as
+daily .npz files under out/archive_daily/, so later runs only re-fetch the
+current year (and that through the HTTP response cache).
+
+Usage:
+    python weather_risk_analytics.py --start 2021-01-01 --end 2025-12-31
+    python weather_risk_analytics.py --site AGI --by year-month --json out/risk_monthly.json
+"""
+
+from __future__ import annotations
+import calendar
+import csv
+import json
+import os
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from WEATHER_DASHBOARD import (
+    FETCH_MAX_WORKERS,
+    GAP_FILL_METHOD,
+    LAT,
+    LON,
+    OP_STATUS_LEVELS,
+    SITES,
+    calc_risk_score,
+    fetch_archive,
+    fetch_marine_waves,
+    fill_daily_gaps,
+    is_shamal_day,
+    op_status_codes,
+)
+
+ARCHIVE_DAILY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "out", "archive_daily")
+# Bump when the chunk layout changes so old .npz files are ignored
+ARCHIVE_DAILY_VERSION = 1
+DAILY_FIELDS = ("wind_kn", "gust_kn", "wdir_deg", "vis_km", "wave_m")
+# A year chunk is cached only if every field has at least this share of days
+ARCHIVE_MIN_COVERAGE = 0.9
+PERIODS = ("month", "year-month", "year")
+
+
+def year_chunks(d0: date, d1: date) -> list[tuple[date, date]]:
+    """Split d0..d1 at calendar-year boundaries."""
+    return [
+        (max(d0, date(y, 1, 1)), min(d1, date(y, 12, 31)))
+        for y in range(d0.year, d1.year + 1)
+    ]
+
+
+def _align(days: np.ndarray, date_strs, values) -> np.ndarray:
+    """Values keyed by ISO date strings placed on the contiguous daily index days."""
+    out = np.full(len(days), np.nan)
+    if len(date_strs) == 0:
+        return out
+    pos = (np.asarray(date_strs).astype("U10").astype("datetime64[D]") - days[0]).astype(int)
+    values = np.asarray(values, dtype=float)[: len(pos)]
+    ok = (pos >= 0) & (pos < len(days))
+    out[pos[ok]] = values[ok]
+    return out
+
+
+def fetch_daily_chunk(d0: date, d1: date, lat: float, lon: float) -> dict[str, np.ndarray]:
+    """Archive wind/gust/direction/min visibility and marine wave max for d0..d1."""
+    days = np.arange(np.datetime64(d0), np.datetime64(d1 + timedelta(days=1)))
+    arc = fetch_archive(d0, d1, lat=lat, lon=lon)
+    marine = fetch_marine_waves(d0, d1, lat=lat, lon=lon)
+    return {
+        "dates": days,
+        "wind_kn": _align(days, arc["dates"], arc["wind_max_kn"]),
+        "gust_kn": _align(days, arc["dates"], arc["gust_max_kn"]),
+        "wdir_deg": _align(days, arc["dates"], arc["wind_dir_deg"]),
+        "vis_km": _align(days, arc["dates"], arc["vis_min_km"]),
+        "wave_m": _align(days, marine["dates"], marine["wave_max_m"]),
+    }
+
+
+def _chunk_path(cache_dir: str, lat: float, lon: float, d0: date, d1: date) -> str:
+    return os.path.join(
+        cache_dir, f"v{ARCHIVE_DAILY_VERSION}_{lat:.4f}_{lon:.4f}_{d0:%Y%m%d}_{d1:%Y%m%d}.npz"
+    )
+
+
+def _load_chunk(path: str) -> dict[str, np.ndarray] | None:
+    try:
+        with np.load(path) as z:
+            return {k: z[k] for k in ("dates",) + DAILY_FIELDS}
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _chunk_gaps(chunk: dict[str, np.ndarray]) -> list[str]:
+    """Fields below ARCHIVE_MIN_COVERAGE (a failed fetch leaves a field all-NaN)."""
+    return [
+        key for key in DAILY_FIELDS
+        if np.isfinite(chunk[key]).mean() < ARCHIVE_MIN_COVERAGE
+    ]
+
+
+def _save_chunk(path: str, chunk: dict[str, np.ndarray]) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **chunk)
+    os.replace(tmp_path, path)
+
+
+def load_archive_daily(
+    d0: date,
+    d1: date,
+    lat: float = LAT,
+    lon: float = LON,
+    cache_dir: str = ARCHIVE_DAILY_DIR,
+    max_workers: int = FETCH_MAX_WORKERS,
+    today: date | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Daily archive series for d0..d1 (capped at the archive lag, today - 2 days)
+    as arrays on a contiguous daily index. Full past years are read from / stored
+    to cache_dir once every field is covered; other chunks are fetched
+    concurrently.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    today = today or datetime.now().date()
+    d1 = min(d1, today - timedelta(days=2))
+    if d1 < d0:
+        raise ValueError(f"No archive data before {d1 + timedelta(days=1)} for start {d0}")
+
+    chunks = year_chunks(d0, d1)
+    loaded: dict[int, dict] = {}
+    todo = []
+    for k, (c0, c1) in enumerate(chunks):
+        # Only whole past years are immutable; partial chunks change key daily
+        complete = c0 == date(c0.year, 1, 1) and c1 == date(c1.year, 12, 31)
+        path = _chunk_path(cache_dir, lat, lon, c0, c1) if complete else None
+        chunk = _load_chunk(path) if path and os.path.exists(path) else None
+        # Older runs cached wind-only years; re-fetch those
+        if chunk is not None and not _chunk_gaps(chunk):
+            loaded[k] = chunk
+        else:
+            todo.append((k, c0, c1, path))
+
+    if todo:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(todo))) as pool:
+            futures = {
+                k: (pool.submit(fetch_daily_chunk, c0, c1, lat, lon), path)
+                for k, c0, c1, path in todo
+            }
+            for k, (future, path) in futures.items():
+                chunk = future.result()
+                loaded[k] = chunk
+                if not path:
+                    continue
+                gaps = _chunk_gaps(chunk)
+                if gaps:
+                    print(f"[WARN] {os.path.basename(path)} not cached, incomplete: {', '.join(gaps)}")
+                else:
+                    _save_chunk(path, chunk)
+
+    return {
+        key: np.concatenate([loaded[k][key] for k in range(len(chunks))])
+        for key in ("dates",) + DAILY_FIELDS
+    }
+
+
+def score_daily(daily: dict[str, np.ndarray], method: str = GAP_FILL_METHOD) -> dict[str, np.ndarray]:
+    """
+    Per-day risk, status code (index into OP_STATUS_LEVELS) and shamal flag.
+    Gaps are filled as in the dashboard (fill_daily_gaps); coverage tags the
+    wind source and wave_filled marks days whose wave was derived from wind.
+    """
+    table = {key: np.array(daily[key], dtype=float) for key in DAILY_FIELDS}
+    table["dates"] = daily["dates"]
+    table["wave_filled"] = np.isnan(table["wave_m"])
+    coverage = np.where(np.isnan(table["wind_kn"]), "", "ARCHIVE").astype(object)
+    fill_daily_gaps(
+        table["wind_kn"], table["gust_kn"], table["wave_m"], table["vis_km"], coverage, method
+    )
+    table["coverage"] = coverage
+    table["risk"] = calc_risk_score(table["wind_kn"], table["gust_kn"], table["wave_m"], table["vis_km"])
+    table["status"] = op_status_codes(table["risk"])
+    table["shamal"] = is_shamal_day(table["wdir_deg"], table["wind_kn"], table["gust_kn"])
+    return table
+
+
+def period_index(dates: np.ndarray, by: str = "month") -> tuple[np.ndarray, list[str]]:
+    """(group index per day, group labels) for month-of-year, year-month or year."""
+    if by == "month":
+        months = dates.astype("datetime64[M]").astype(int) % 12
+        present = np.unique(months)
+        remap = np.full(12, -1)
+        remap[present] = np.arange(len(present))
+        return remap[months], [calendar.month_abbr[m + 1] for m in present]
+    if by in ("year-month", "year"):
+        units = dates.astype("datetime64[M]" if by == "year-month" else "datetime64[Y]")
+        labels, index = np.unique(units, return_inverse=True)
+        return index, [str(u) for u in labels]
+    raise ValueError(f"Unknown period: {by} (expected one of {PERIODS})")
+
+
+def summarize_by_period(table: dict[str, np.ndarray], by: str = "month") -> list[dict]:
+    """Per-period day count, shamal frequency, GO/HOLD/NO-GO % and mean/max risk."""
+    index, labels = period_index(table["dates"], by)
+    k = len(labels)
+    days = np.bincount(index, minlength=k)
+    shamal = np.bincount(index, weights=table["shamal"], minlength=k)
+    status = np.stack(
+        [np.bincount(index, weights=table["status"] == s, minlength=k) for s in range(len(OP_STATUS_LEVELS))]
+    )
+    risk_sum = np.bincount(index, weights=table["risk"], minlength=k)
+    risk_max = np.full(k, -np.inf)
+    np.maximum.at(risk_max, index, table["risk"])
+
+    rows = []
+    for g, label in enumerate(labels):
+        n = int(days[g])
+        row = {"period": label, "days": n, "shamal_days": int(shamal[g]), "shamal_pct": float(100.0 * shamal[g] / n)}
+        for s, name in enumerate(OP_STATUS_LEVELS):
+            row[f"{name.lower().replace('-', '')}_pct"] = float(100.0 * status[s, g] / n)
+        row["mean_risk"] = float(risk_sum[g] / n)
+        row["max_risk"] = float(risk_max[g])
+        rows.append(row)
+    return rows
+
+
+def write_daily_csv(table: dict[str, np.ndarray], path: str) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["date", *DAILY_FIELDS, "risk", "status", "shamal", "coverage", "wave_filled"])
+        status = np.array(OP_STATUS_LEVELS)[table["status"]]
+        for i, d in enumerate(table["dates"]):
+            writer.writerow(
+                [str(d)]
+                + [f"{table[key][i]:.2f}" for key in DAILY_FIELDS]
+                + [f"{table['risk'][i]:.1f}", status[i], int(table["shamal"][i]), table["coverage"][i]]
+                + [int(table["wave_filled"][i])]
+            )
+
+
+def print_table(rows: list[dict]) -> None:
+    print(f"{'period':<10}{'days':>6}{'shamal':>8}{'shamal%':>9}{'GO%':>8}{'HOLD%':>8}{'NO-GO%':>8}{'risk':>7}{'max':>7}")
+    print("-" * 71)
+    for r in rows:
+        print(
+            f"{r['period']:<10}{r['days']:>6}{r['shamal_days']:>8}{r['shamal_pct']:>9.1f}"
+            f"{r['go_pct']:>8.1f}{r['hold_pct']:>8.1f}{r['nogo_pct']:>8.1f}"
+            f"{r['mean_risk']:>7.1f}{r['max_risk']:>7.1f}"
+        )
+
+
+def main():
+    import argparse
+
+    today = datetime.now().date()
+    parser = argparse.ArgumentParser(description="Seasonal weather risk analytics over archive data")
+    parser.add_argument("--start", default=f"{today.year - 5}-01-01", help="First day (default: 5 years back)")
+    parser.add_argument("--end", default=(today - timedelta(days=2)).isoformat(), help="Last day")
+    parser.add_argument("--site", choices=sorted(SITES), help="Named site (default: LAT/LON)")
+    parser.add_argument("--lat", type=float, help="Latitude (with --lon)")
+    parser.add_argument("--lon", type=float, help="Longitude (with --lat)")
+    parser.add_argument("--by", choices=PERIODS, default="month", help="Summary period (default: month of year)")
+    parser.add_argument("--json", help="Write summary rows to this JSON")
+    parser.add_argument("--daily-csv", help="Write the per-day risk table to this CSV")
+    parser.add_argument("--cache-dir", default=ARCHIVE_DAILY_DIR, help="Daily archive chunk cache")
+    args = parser.parse_args()
+
+    if args.lat is not None and args.lon is not None:
+        lat, lon, site = args.lat, args.lon, "custom"
+    elif args.site:
+        (lat, lon), site = SITES[args.site], args.site
+    else:
+        lat, lon, site = LAT, LON, "ROUTE"
+    d0, d1 = date.fromisoformat(args.start), date.fromisoformat(args.end)
+
+    daily = load_archive_daily(d0, d1, lat, lon, cache_dir=args.cache_dir, today=today)
+    table = score_daily(daily)
+    rows = summarize_by_period(table, args.by)
+
+    n = len(table["dates"])
+    print(f"[INFO] {site} ({lat}, {lon}) | {table['dates'][0]} ~ {table['dates'][-1]} ({n} days)")
+    no_wind = table["coverage"] != "ARCHIVE"
+    filled = int(np.sum(no_wind | table["wave_filled"]))
+    if filled:
+        print(
+            f"[WARN] {filled} days were gap-filled "
+            f"({int(no_wind.sum())} without archive wind, {int(table['wave_filled'].sum())} without marine wave)"
+        )
+    print_table(rows)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "site": site,
+                    "lat": lat,
+                    "lon": lon,
+                    "start": str(table["dates"][0]),
+                    "end": str(table["dates"][-1]),
+                    "by": args.by,
+                    "rows": rows,
+                },
+                f,
+                indent=2,
+            )
+        print(f"\n[OK] Summary -> {args.json}")
+    if args.daily_csv:
+        write_daily_csv(table, args.daily_csv)
+        print(f"[OK] Daily table -> {args.daily_csv}")
+
+
+if __name__ == "__main__":
+    main()